@@ -1,9 +1,12 @@
 package main
 
 import (
+	"context"
+	"errors"
 	"fmt"
 	"os"
 	"strings"
+	"sync/atomic"
 	"time"
 
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/cni"
@@ -16,8 +19,10 @@ import (
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/platform"
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/registry"
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/requirements"
+	"github.com/ovn-kubernetes/dpu-simulator/pkg/ssh"
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/vm"
 	"github.com/spf13/cobra"
+	"golang.org/x/sync/errgroup"
 )
 
 var (
@@ -32,8 +37,10 @@ var (
 	cleanupOnly bool
 	skipDeploy  bool
 	skipK8s     bool
+	forceK8s    bool
 	rebuildCNI  bool
 	redeployCNI bool
+	maxParallel int
 )
 
 var rootCmd = &cobra.Command{
@@ -65,6 +72,8 @@ func init() {
 	rootCmd.Flags().BoolVar(&skipCleanup, "skip-cleanup", false, "Skip cleanup of existing resources")
 	rootCmd.Flags().BoolVar(&skipDeploy, "skip-deploy", false, "Skip VM/Kind deployment")
 	rootCmd.Flags().BoolVar(&skipK8s, "skip-k8s", false, "Skip Kubernetes (VM only) and CNI installation")
+	rootCmd.Flags().BoolVar(&forceK8s, "force-k8s-install", false, "Re-run every Kubernetes install step even if already satisfied")
+	rootCmd.Flags().IntVar(&maxParallel, "max-parallel", 0, "Number of VMs to install concurrently (overrides kubernetes.max_parallel)")
 	rootCmd.Flags().BoolVar(&rebuildCNI, "rebuild-cni", false, "Rebuild the OVN-Kubernetes CNI image and exit")
 	rootCmd.Flags().BoolVar(&redeployCNI, "redeploy-cni", false, "Redeploy the OVN-Kubernetes CNI image onto each cluster and exit")
 }
@@ -77,9 +86,9 @@ func runDeploy(cmd *cobra.Command, args []string) error {
 	// Configure log level
 	log.SetLevel(log.ParseLevel(logLevel))
 
-	log.Info("╔═══════════════════════════════════════════════╗")
-	log.Info("║               DPU Simulator                   ║")
-	log.Info("╚═══════════════════════════════════════════════╝")
+	log.Info("╔═══════════════════════════════════════════════╗\n" +
+		"║               DPU Simulator                   ║\n" +
+		"╚═══════════════════════════════════════════════╝")
 	log.Info("Configuration: %s", configPath)
 
 	cfg, err := config.LoadConfig(configPath)
@@ -92,6 +101,13 @@ func runDeploy(cmd *cobra.Command, args []string) error {
 		return fmt.Errorf("--ovn-kubernetes-path: %w", err)
 	}
 	cfg.OVNKubernetesPath = ovnPath
+	cfg.ForceK8sInstall = forceK8s
+	if maxParallel < 0 {
+		return fmt.Errorf("--max-parallel must not be negative, got %d", maxParallel)
+	}
+	if maxParallel > 0 {
+		cfg.Kubernetes.MaxParallel = maxParallel
+	}
 
 	// Create registry manager once if configured; nil otherwise.
 	localExec := platform.NewLocalExecutor()
@@ -304,36 +320,40 @@ func runKindDeploymentWorkflow(cfg *config.Config, regMgr *registry.RegistryMana
 	return nil
 }
 
+// printSuccessMessage prints the deployment summary as a single log write so
+// it cannot interleave with output from anything still running.
 func printSuccessMessage(cfg *config.Config, deployType string) {
-	log.Info("")
-	log.Info("╔═══════════════════════════════════════════════╗")
-	log.Info("║         Deployment Completed Successfully!    ║")
-	log.Info("╚═══════════════════════════════════════════════╝")
+	sb := strings.Builder{}
+	sb.WriteString("\n")
+	sb.WriteString("╔═══════════════════════════════════════════════╗\n")
+	sb.WriteString("║         Deployment Completed Successfully!    ║\n")
+	sb.WriteString("╚═══════════════════════════════════════════════╝\n")
 
 	if deployType == "VM" {
-		log.Info("\n✓ VM deployment complete!")
-		log.Info("\nYour DPU simulation environment is ready:")
-		log.Info("  • VMs are running and accessible")
-		log.Info("  • Kubernetes is installed and configured")
-		log.Info("  • CNI is deployed and ready")
-		log.Info("\nUseful commands:")
-		log.Info("  vmctl list                    # List all VMs")
-		log.Info("  vmctl ssh <vm-name>           # SSH into a VM")
+		sb.WriteString("\n✓ VM deployment complete!\n")
+		sb.WriteString("\nYour DPU simulation environment is ready:\n")
+		sb.WriteString("  • VMs are running and accessible\n")
+		sb.WriteString("  • Kubernetes is installed and configured\n")
+		sb.WriteString("  • CNI is deployed and ready\n")
+		sb.WriteString("\nUseful commands:\n")
+		sb.WriteString("  vmctl list                    # List all VMs\n")
+		sb.WriteString("  vmctl ssh <vm-name>           # SSH into a VM\n")
 	} else {
-		log.Info("\n✓ Kind deployment complete!")
-		log.Info("\nYour DPU simulation environment is ready:")
-		log.Info("  • Kind clusters are running")
-		log.Info("  • CNI is deployed and ready")
-		log.Info("\nUseful commands:")
-		log.Info("  kind get clusters             # List all clusters")
+		sb.WriteString("\n✓ Kind deployment complete!\n")
+		sb.WriteString("\nYour DPU simulation environment is ready:\n")
+		sb.WriteString("  • Kind clusters are running\n")
+		sb.WriteString("  • CNI is deployed and ready\n")
+		sb.WriteString("\nUseful commands:\n")
+		sb.WriteString("  kind get clusters             # List all clusters\n")
 	}
 	kubeconfigDir := cfg.Kubernetes.GetKubeconfigDir()
 	for _, c := range cfg.Kubernetes.Clusters {
-		log.Info("  kubectl --kubeconfig %s get nodes", k8s.GetKubeconfigPath(c.Name, kubeconfigDir))
+		fmt.Fprintf(&sb, "  kubectl --kubeconfig %s get nodes\n", k8s.GetKubeconfigPath(c.Name, kubeconfigDir))
 	}
 
-	log.Info("\nKubeconfig directory: %s", cfg.Kubernetes.GetKubeconfigDir())
-	log.Info("For more information, see README.md")
+	fmt.Fprintf(&sb, "\nKubeconfig directory: %s\n", kubeconfigDir)
+	sb.WriteString("For more information, see README.md\n")
+	log.Info("%s", sb.String())
 }
 
 func doVMDeploy(cfg *config.Config, vmMgr *vm.VMManager) error {
@@ -347,25 +367,30 @@ func doVMDeploy(cfg *config.Config, vmMgr *vm.VMManager) error {
 		return fmt.Errorf("failed to create VMs: %w", err)
 	}
 
-	// Wait for VMs to get IP addresses
+	// Wait for VMs to get IP addresses. Each wait is almost entirely idle
+	// polling, so run them concurrently and pay for the slowest VM rather than
+	// the sum of all of them.
+	// Report each VM as soon as it is ready, and log every failure: g.Wait
+	// only returns the first one.
 	log.Info("\n=== Waiting for VMs to boot and get IPs ===")
+	g, ctx := errgroup.WithContext(context.Background())
+	var ready atomic.Int32
 	for _, vmCfg := range cfg.VMs {
-		log.Info("Waiting for %s to get an IP address...", vmCfg.Name)
-		ip, err := vmMgr.WaitForVMIP(vmCfg.Name, config.MgmtNetworkName, 5*time.Minute)
-		if err != nil {
-			return fmt.Errorf("failed to get IP for %s: %w", vmCfg.Name, err)
-		}
-		log.Info("✓ %s IP: %s", vmCfg.Name, ip)
-
-		cmdExec := platform.NewSSHExecutor(&cfg.SSH, ip)
-		log.Info("Waiting for SSH on %s...", vmCfg.Name)
-		if err := cmdExec.WaitUntilReady(5 * time.Minute); err != nil {
-			return fmt.Errorf("failed to wait for SSH on %s: %w", vmCfg.Name, err)
-		}
-		log.Info("✓ SSH ready on %s, waiting for cloud-init to finish...", vmCfg.Name)
-		// Exit code 0 = success, 2 = done with recoverable errors; both mean cloud-init finished.
-		stdout, _, _ := cmdExec.Execute("cloud-init status --wait")
-		log.Info("✓ cloud-init finished on %s (%s)", vmCfg.Name, strings.TrimSpace(stdout))
+		g.Go(func() error {
+			if err := waitForVMReady(ctx, cfg, vmMgr, vmCfg.Name); err != nil {
+				if errors.Is(err, context.Canceled) {
+					// Another VM already failed; its error is the one returned.
+					return nil
+				}
+				log.Error("✗ %s: %v", vmCfg.Name, err)
+				return err
+			}
+			log.Info("✓ %s ready (%d/%d)", vmCfg.Name, ready.Add(1), len(cfg.VMs))
+			return nil
+		})
+	}
+	if err := g.Wait(); err != nil {
+		return err
 	}
 
 	// We don't need to setup host-to-DPU virtio pairs because it is done at VM creation time
@@ -377,11 +402,54 @@ func doVMDeploy(cfg *config.Config, vmMgr *vm.VMManager) error {
 	return nil
 }
 
+// waitForVMReady waits for a VM to get a management IP, accept SSH and finish
+// cloud-init. Once ctx is cancelled (another VM failed) it stops before the
+// next wait instead of sitting out the remaining timeouts for nothing.
+func waitForVMReady(ctx context.Context, cfg *config.Config, vmMgr *vm.VMManager, vmName string) error {
+	log.Info("Waiting for %s to get an IP address...", vmName)
+	ip, err := vmMgr.WaitForVMIP(vmName, config.MgmtNetworkName, 5*time.Minute)
+	if err != nil {
+		return fmt.Errorf("failed to get IP for %s: %w", vmName, err)
+	}
+	log.Info("✓ %s IP: %s", vmName, ip)
+	if err := ctx.Err(); err != nil {
+		return err
+	}
+
+	cmdExec := platform.NewSSHExecutor(&cfg.SSH, ip)
+	log.Info("Waiting for SSH on %s...", vmName)
+	if err := cmdExec.WaitUntilReady(5 * time.Minute); err != nil {
+		return fmt.Errorf("failed to wait for SSH on %s: %w", vmName, err)
+	}
+	if err := ctx.Err(); err != nil {
+		return err
+	}
+	log.Info("✓ SSH ready on %s, waiting for cloud-init to finish...", vmName)
+	// Exit code 0 = success, 2 = done with recoverable errors; both mean cloud-init finished.
+	stdout, _, _ := cmdExec.Execute("cloud-init status --wait")
+	log.Info("✓ cloud-init finished on %s (%s)", vmName, strings.TrimSpace(stdout))
+	return nil
+}
+
 func doVMInstallK8s(vmMgr *vm.VMManager) error {
+	// Saving the base image needs every VM installed, and one of them shut
+	// down, before any cluster is set up. Otherwise clusters can start
+	// bootstrapping while other VMs are still installing.
+	if !vmMgr.GoldenImagePending() {
+		if err := vmMgr.InstallAndSetupAllK8sClusters(); err != nil {
+			return fmt.Errorf("failed to setup Kubernetes clusters: %w", err)
+		}
+		return nil
+	}
+
 	if err := vmMgr.InstallKubernetes(""); err != nil {
 		return fmt.Errorf("failed to install Kubernetes: %w", err)
 	}
 
+	if err := vmMgr.SaveGoldenImage(); err != nil {
+		return fmt.Errorf("failed to save Kubernetes-ready base image: %w", err)
+	}
+
 	if err := vmMgr.SetupAllK8sClusters(); err != nil {
 		return fmt.Errorf("failed to setup Kubernetes clusters: %w", err)
 	}
@@ -467,6 +535,7 @@ func doKindInstallCNI(kindMgr *kind.KindManager, cmdExec platform.CommandExecuto
 func main() {
 	start := time.Now()
 	err := rootCmd.Execute()
+	ssh.CloseAllConnections()
 	elapsed := time.Since(start).Round(time.Millisecond)
 	if err != nil {
 		fmt.Fprintf(os.Stderr, "Error: %v\n", err)
@@ -95,15 +95,25 @@ func init() {
 	rootCmd.AddCommand(rebootCmd)
 }
 
-func runList(cmd *cobra.Command, args []string) error {
+// loadVMManager loads the config named by --config and opens a VM manager
+// for it. Callers must Close the returned manager.
+func loadVMManager() (*config.Config, *vm.VMManager, error) {
 	cfg, err := config.LoadConfig(configPath)
 	if err != nil {
-		return fmt.Errorf("failed to load config: %w", err)
+		return nil, nil, fmt.Errorf("failed to load config: %w", err)
 	}
 
 	vmMgr, err := vm.NewVMManager(cfg, platform.NewLocalExecutor())
 	if err != nil {
-		return fmt.Errorf("failed to create VM manager: %w", err)
+		return nil, nil, fmt.Errorf("failed to create VM manager: %w", err)
+	}
+	return cfg, vmMgr, nil
+}
+
+func runList(cmd *cobra.Command, args []string) error {
+	cfg, vmMgr, err := loadVMManager()
+	if err != nil {
+		return err
 	}
 	defer vmMgr.Close()
 
@@ -135,16 +145,9 @@ func runList(cmd *cobra.Command, args []string) error {
 func runSSH(cmd *cobra.Command, args []string) error {
 	vmName := args[0]
 
-	// Load config
-	cfg, err := config.LoadConfig(configPath)
-	if err != nil {
-		return fmt.Errorf("failed to load config: %w", err)
-	}
-
-	// Create VM manager
-	vmMgr, err := vm.NewVMManager(cfg, platform.NewLocalExecutor())
+	cfg, vmMgr, err := loadVMManager()
 	if err != nil {
-		return fmt.Errorf("failed to create VM manager: %w", err)
+		return err
 	}
 	defer vmMgr.Close()
 
@@ -170,16 +173,9 @@ func runExec(cmd *cobra.Command, args []string) error {
 	vmName := args[0]
 	command := strings.Join(args[1:], " ")
 
-	// Load config
-	cfg, err := config.LoadConfig(configPath)
+	cfg, vmMgr, err := loadVMManager()
 	if err != nil {
-		return fmt.Errorf("failed to load config: %w", err)
-	}
-
-	// Create VM manager
-	vmMgr, err := vm.NewVMManager(cfg, platform.NewLocalExecutor())
-	if err != nil {
-		return fmt.Errorf("failed to create VM manager: %w", err)
+		return err
 	}
 	defer vmMgr.Close()
 
@@ -191,6 +187,7 @@ func runExec(cmd *cobra.Command, args []string) error {
 
 	// Execute command via SSH
 	cmdExec := platform.NewSSHExecutor(&cfg.SSH, ip)
+	defer ssh.CloseAllConnections()
 	if err := cmdExec.WaitUntilReady(10 * time.Second); err != nil {
 		return fmt.Errorf("failed to wait for SSH on %s: %w", vmName, err)
 	}
@@ -214,14 +211,9 @@ func runExec(cmd *cobra.Command, args []string) error {
 func runStart(cmd *cobra.Command, args []string) error {
 	vmName := args[0]
 
-	cfg, err := config.LoadConfig(configPath)
+	_, vmMgr, err := loadVMManager()
 	if err != nil {
-		return fmt.Errorf("failed to load config: %w", err)
-	}
-
-	vmMgr, err := vm.NewVMManager(cfg, platform.NewLocalExecutor())
-	if err != nil {
-		return fmt.Errorf("failed to create VM manager: %w", err)
+		return err
 	}
 	defer vmMgr.Close()
 
@@ -236,14 +228,9 @@ func runStart(cmd *cobra.Command, args []string) error {
 func runStop(cmd *cobra.Command, args []string) error {
 	vmName := args[0]
 
-	cfg, err := config.LoadConfig(configPath)
+	_, vmMgr, err := loadVMManager()
 	if err != nil {
-		return fmt.Errorf("failed to load config: %w", err)
-	}
-
-	vmMgr, err := vm.NewVMManager(cfg, platform.NewLocalExecutor())
-	if err != nil {
-		return fmt.Errorf("failed to create VM manager: %w", err)
+		return err
 	}
 	defer vmMgr.Close()
 
@@ -258,14 +245,9 @@ func runStop(cmd *cobra.Command, args []string) error {
 func runDestroy(cmd *cobra.Command, args []string) error {
 	vmName := args[0]
 
-	cfg, err := config.LoadConfig(configPath)
+	_, vmMgr, err := loadVMManager()
 	if err != nil {
-		return fmt.Errorf("failed to load config: %w", err)
-	}
-
-	vmMgr, err := vm.NewVMManager(cfg, platform.NewLocalExecutor())
-	if err != nil {
-		return fmt.Errorf("failed to create VM manager: %w", err)
+		return err
 	}
 	defer vmMgr.Close()
 
@@ -280,14 +262,9 @@ func runDestroy(cmd *cobra.Command, args []string) error {
 func runReboot(cmd *cobra.Command, args []string) error {
 	vmName := args[0]
 
-	cfg, err := config.LoadConfig(configPath)
-	if err != nil {
-		return fmt.Errorf("failed to load config: %w", err)
-	}
-
-	vmMgr, err := vm.NewVMManager(cfg, platform.NewLocalExecutor())
+	_, vmMgr, err := loadVMManager()
 	if err != nil {
-		return fmt.Errorf("failed to create VM manager: %w", err)
+		return err
 	}
 	defer vmMgr.Close()
 
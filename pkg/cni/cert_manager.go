@@ -4,6 +4,8 @@ import (
 	"fmt"
 	"time"
 
+	"golang.org/x/sync/errgroup"
+
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/log"
 )
 
@@ -23,7 +25,7 @@ func (m *CNIManager) installCertManager(clusterName string) error {
 	}
 
 	log.Info("Installing cert-manager %s on cluster %s...", CertManagerVersion, clusterName)
-	if err := m.k8sClient.ApplyManifestFromURL(certManagerManifestURL); err != nil {
+	if err := m.applyManifestFromURL(certManagerManifestURL); err != nil {
 		return fmt.Errorf("failed to apply cert-manager manifest: %w", err)
 	}
 
@@ -35,10 +37,19 @@ func (m *CNIManager) installCertManager(clusterName string) error {
 		"cert-manager-cainjector",
 	}
 
+	// The deployments roll out side by side, so wait on them together
+	// under one timeout rather than one after another.
+	var g errgroup.Group
 	for _, deployment := range deployments {
-		if err := m.k8sClient.WaitForDeploymentAvailable("cert-manager", deployment, 5*time.Minute); err != nil {
-			return fmt.Errorf("cert-manager addon deployment %q is not available: %w", deployment, err)
-		}
+		g.Go(func() error {
+			if err := m.k8sClient.WaitForDeploymentAvailable("cert-manager", deployment, 5*time.Minute); err != nil {
+				return fmt.Errorf("cert-manager addon deployment %q is not available: %w", deployment, err)
+			}
+			return nil
+		})
+	}
+	if err := g.Wait(); err != nil {
+		return err
 	}
 
 	log.Info("✓ cert-manager is installed and ready on cluster %s", clusterName)
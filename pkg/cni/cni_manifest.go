@@ -6,6 +6,7 @@ import (
 	"io"
 	"net/http"
 	"strings"
+	"sync"
 	"time"
 )
 
@@ -36,7 +37,18 @@ func (m *CNIManager) shouldUseWritableCNIBinDir() bool {
 	return false
 }
 
+// manifestCache holds the manifests downloaded during this run, keyed by URL.
+// Every cluster applies the same upstream manifests, so only the first
+// cluster pays for the download.
+var manifestCache sync.Map
+
+// downloadManifest returns the manifest at url, downloading it on first use.
+// Callers must not modify the returned bytes.
 func downloadManifest(url string) ([]byte, error) {
+	if cached, ok := manifestCache.Load(url); ok {
+		return cached.([]byte), nil
+	}
+
 	ctx, cancel := context.WithTimeout(context.Background(), 2*time.Minute)
 	defer cancel()
 
@@ -60,9 +72,20 @@ func downloadManifest(url string) ([]byte, error) {
 		return nil, fmt.Errorf("failed to read manifest body: %w", err)
 	}
 
+	manifestCache.Store(url, body)
 	return body, nil
 }
 
+// applyManifestFromURL applies the manifest at url, reusing an earlier
+// download of it.
+func (m *CNIManager) applyManifestFromURL(url string) error {
+	manifest, err := downloadManifest(url)
+	if err != nil {
+		return err
+	}
+	return m.k8sClient.ApplyManifest(manifest)
+}
+
 func rewriteCNIBinPath(manifest []byte, hostPath string) []byte {
 	content := string(manifest)
 	hostMountPath := "/host" + hostPath
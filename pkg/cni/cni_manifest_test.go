@@ -1,6 +1,9 @@
 package cni
 
 import (
+	"net/http"
+	"net/http/httptest"
+	"sync/atomic"
 	"testing"
 
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
@@ -71,3 +74,26 @@ func TestShouldUseWritableCNIBinDir(t *testing.T) {
 		})
 	}
 }
+
+func TestDownloadManifestIsCached(t *testing.T) {
+	t.Parallel()
+	var requests atomic.Int32
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		requests.Add(1)
+		_, _ = w.Write([]byte("kind: ConfigMap\n"))
+	}))
+	defer srv.Close()
+
+	for i := 0; i < 2; i++ {
+		manifest, err := downloadManifest(srv.URL + "/manifest.yaml")
+		if err != nil {
+			t.Fatalf("downloadManifest() error = %v", err)
+		}
+		if string(manifest) != "kind: ConfigMap\n" {
+			t.Fatalf("downloadManifest() = %q", manifest)
+		}
+	}
+	if got := requests.Load(); got != 1 {
+		t.Fatalf("server got %d requests, want 1", got)
+	}
+}
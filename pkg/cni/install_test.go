@@ -18,3 +18,29 @@ func TestResolveAddonInstallOrderDoesNotDuplicateWhereabouts(t *testing.T) {
 	ordered := resolveAddonInstallOrder(addons)
 	require.Equal(t, addons, ordered)
 }
+
+func TestPatchCorefile(t *testing.T) {
+	corefile := `.:53 {
+    errors
+    kubernetes cluster.local in-addr.arpa ip6.arpa {
+       pods insecure
+       fallthrough in-addr.arpa ip6.arpa
+    }
+    forward . /etc/resolv.conf {
+       max_concurrent 1000
+    }
+    loop
+    reload
+}`
+	want := `.:53 {
+    errors
+    kubernetes cluster.local net in-addr.arpa ip6.arpa {
+       pods insecure
+    }
+    forward . 8.8.8.8 {
+       max_concurrent 1000
+    }
+    reload
+}`
+	require.Equal(t, want, patchCorefile(corefile, "8.8.8.8"))
+}
@@ -66,6 +66,37 @@ func (m *CNIManager) detectOVNKMode(clusterName string) ovnkMode {
 	return ovnkModeDPUHost
 }
 
+// Corefile edits applied by patchCorefile, compiled once.
+var (
+	corefileUpstreamRe    = regexp.MustCompile(`^\s*upstream\s*$`)
+	corefileFallthroughRe = regexp.MustCompile(`^\s*fallthrough.*$`)
+	corefileLoopRe        = regexp.MustCompile(`^\s*loop\s*$`)
+	corefileKubernetesRe  = regexp.MustCompile(`^(\s*kubernetes cluster\.local)`)
+	corefileForwardRe     = regexp.MustCompile(`^(\s*forward \.)\s*.*$`)
+)
+
+// patchCorefile returns corefile with the edits described on patchCoreDNS.
+func patchCorefile(corefile, dnsServer string) string {
+	forward := fmt.Sprintf("${1} %s {", dnsServer)
+	var patchedLines []string
+	for _, line := range strings.Split(corefile, "\n") {
+		// Skip lines containing 'upstream', 'fallthrough', or 'loop'
+		// These are problematic lines that need to be removed
+		if corefileUpstreamRe.MatchString(line) || corefileFallthroughRe.MatchString(line) || corefileLoopRe.MatchString(line) {
+			continue
+		}
+
+		// Add 'net' after 'kubernetes cluster.local' to handle .net. domain
+		line = corefileKubernetesRe.ReplaceAllString(line, "${1} net")
+
+		// Replace forward line to use specified DNS server
+		line = corefileForwardRe.ReplaceAllString(line, forward)
+
+		patchedLines = append(patchedLines, line)
+	}
+	return strings.Join(patchedLines, "\n")
+}
+
 // patchCoreDNSForOVN patches the CoreDNS configmap for OVN-Kubernetes compatibility.
 // This modifies CoreDNS to:
 // 1. Work in an offline environment (no IPv6 connectivity)
@@ -89,31 +120,7 @@ func (m *CNIManager) patchCoreDNS(dnsServer string) error {
 		return fmt.Errorf("corefile not found in CoreDNS configmap")
 	}
 
-	// Apply patches to the Corefile
-	var patchedLines []string
-	for _, line := range strings.Split(corefile, "\n") {
-		// Skip lines containing 'upstream', 'fallthrough', or 'loop'
-		// These are problematic lines that need to be removed
-		if regexp.MustCompile(`^\s*upstream\s*$`).MatchString(line) {
-			continue
-		}
-		if regexp.MustCompile(`^\s*fallthrough.*$`).MatchString(line) {
-			continue
-		}
-		if regexp.MustCompile(`^\s*loop\s*$`).MatchString(line) {
-			continue
-		}
-
-		// Add 'net' after 'kubernetes cluster.local' to handle .net. domain
-		line = regexp.MustCompile(`^(\s*kubernetes cluster\.local)`).ReplaceAllString(line, "${1} net")
-
-		// Replace forward line to use specified DNS server
-		line = regexp.MustCompile(`^(\s*forward \.)\s*.*$`).ReplaceAllString(line, fmt.Sprintf("${1} %s {", dnsServer))
-
-		patchedLines = append(patchedLines, line)
-	}
-
-	patchedCorefile := strings.Join(patchedLines, "\n")
+	patchedCorefile := patchCorefile(corefile, dnsServer)
 
 	// Update the configmap with the patched Corefile
 	configMap.Data["Corefile"] = patchedCorefile
@@ -377,7 +384,7 @@ func (m *CNIManager) installExternalCRDs() error {
 	}
 
 	for _, url := range externalCRDs {
-		if err := m.k8sClient.ApplyManifestFromURL(url); err != nil {
+		if err := m.applyManifestFromURL(url); err != nil {
 			return fmt.Errorf("failed to apply external CRD from %s: %w", url, err)
 		}
 		log.Debug("✓ Applied external CRD from %s", url)
@@ -591,7 +598,10 @@ func EnsureOVNKubernetesSource(cmdExec platform.CommandExecutor, overridePath st
 		return "", fmt.Errorf("failed to get project root: %w", err)
 	}
 
-	if err := cmdExec.RunCmdInDir(log.LevelInfo, projectRoot, "git", "clone", "--branch", "master", DefaultOVNRepoURL, ovnPath); err != nil {
+	// A blobless clone keeps the full commit history but only downloads the
+	// file contents of the checked-out tree, a fraction of a full clone.
+	// Older blobs are fetched on demand if they are ever needed.
+	if err := cmdExec.RunCmdInDir(log.LevelInfo, projectRoot, "git", "clone", "--filter=blob:none", "--branch", "master", DefaultOVNRepoURL, ovnPath); err != nil {
 		return "", fmt.Errorf("failed to clone OVN-Kubernetes repository: %w", err)
 	}
 
@@ -985,21 +995,27 @@ func (m *CNIManager) createDPUAccessSecret() error {
 		return fmt.Errorf("failed to create DPU access secret: %w", err)
 	}
 
-	// Wait for the token controller to populate the secret
+	// Wait for the token controller to populate the secret. It usually does
+	// so within a fraction of a second, so check right away and back off
+	// from a short interval rather than sleeping a fixed 2s up front.
 	log.Info("Waiting for DPU access secret to be populated...")
-	for i := 0; i < 30; i++ {
-		time.Sleep(2 * time.Second)
+	interval := 100 * time.Millisecond
+	for {
 		populated, getErr := m.k8sClient.Clientset().CoreV1().Secrets("ovn-kubernetes").Get(ctx, "ovnkube-node-sa-for-dpu", metav1.GetOptions{})
-		if getErr != nil {
-			continue
+		if getErr == nil {
+			if _, hasToken := populated.Data["token"]; hasToken {
+				log.Info("✓ DPU access secret created and populated")
+				return nil
+			}
 		}
-		if _, hasToken := populated.Data["token"]; hasToken {
-			log.Info("✓ DPU access secret created and populated")
-			return nil
+
+		select {
+		case <-ctx.Done():
+			return fmt.Errorf("timed out waiting for DPU access secret to be populated")
+		case <-time.After(interval):
 		}
+		interval = min(interval*2, 2*time.Second)
 	}
-
-	return fmt.Errorf("timed out waiting for DPU access secret to be populated")
 }
 
 // getDPUHostClusterCredentials retrieves the service account token and CA
@@ -1336,7 +1352,7 @@ func (m *CNIManager) applyOVNKubernetesManifests(ovnPath string, clusterName str
 
 	log.Info("Applying external CRD manifests...")
 	for _, url := range externalCRDs {
-		if err := m.k8sClient.ApplyManifestFromURL(url); err != nil {
+		if err := m.applyManifestFromURL(url); err != nil {
 			return fmt.Errorf("failed to apply external CRD from %s: %w", url, err)
 		}
 	}
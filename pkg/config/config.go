@@ -5,12 +5,19 @@
 package config
 
 import (
+	"bytes"
+	"errors"
 	"fmt"
+	"io"
 	"net"
+	"net/url"
 	"os"
 	"path/filepath"
 	"strconv"
 	"strings"
+	"sync"
+	"syscall"
+	"time"
 
 	"github.com/ovn-kubernetes/dpu-simulator/lib/dpusim"
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/log"
@@ -18,25 +25,113 @@ import (
 	"gopkg.in/yaml.v3"
 )
 
-// LoadConfig loads configuration from a YAML file
+// configStamp identifies one on-disk revision of a config file. The size
+// catches rewrites that land within the filesystem's mtime granularity, and
+// the inode catches a same-size file being renamed over the old one, which
+// is how many editors and config generators save.
+type configStamp struct {
+	modTime time.Time
+	size    int64
+	ino     uint64
+}
+
+// configCacheEntry is the most recently parsed revision of one config file.
+type configCacheEntry struct {
+	stamp configStamp
+	cfg   *Config
+}
+
+var (
+	configCacheMu sync.Mutex
+	// configCache maps absolute config paths to their latest parsed
+	// revision; a newer revision replaces the old entry rather than
+	// accumulating next to it.
+	configCache = make(map[string]configCacheEntry)
+)
+
+// LoadConfig loads configuration from a YAML file.
+//
+// Parsed configs are cached by absolute path, modification time and size, so
+// repeated loads of an unchanged file skip decoding and validation. Each
+// caller receives its own shallow copy of the cached Config; top-level fields
+// (e.g. OVNKubernetesPath) can be set freely, but slices and nested sections
+// are shared and must be treated as read-only.
 func LoadConfig(path string) (*Config, error) {
-	data, err := os.ReadFile(path)
+	f, err := os.Open(path)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read config file %s: %w", path, err)
 	}
+	defer f.Close()
+
+	absPath, stamp, cacheable := configCacheStamp(path, f)
+	if cacheable {
+		configCacheMu.Lock()
+		entry, ok := configCache[absPath]
+		configCacheMu.Unlock()
+		if ok && entry.stamp == stamp {
+			cfg := *entry.cfg
+			return &cfg, nil
+		}
+	}
 
+	// Decode straight from the file handle instead of reading the whole file
+	// into an intermediate buffer first.
+	cfg, err := decodeConfig(f, "config file "+path)
+	if err != nil {
+		return nil, err
+	}
+
+	if cacheable {
+		cached := *cfg
+		configCacheMu.Lock()
+		configCache[absPath] = configCacheEntry{stamp: stamp, cfg: &cached}
+		configCacheMu.Unlock()
+	}
+
+	return cfg, nil
+}
+
+// ParseConfig parses and validates configuration from YAML already in memory,
+// for callers that have the document without a file to point LoadConfig at
+// (e.g. generated configs or tests). The result is not cached.
+func ParseConfig(data []byte) (*Config, error) {
+	return decodeConfig(bytes.NewReader(data), "config")
+}
+
+// decodeConfig decodes one YAML document from r and validates it. what names
+// the source in parse errors. An empty document decodes to io.EOF, which
+// Unmarshal treated as an empty config, so keep that behavior.
+func decodeConfig(r io.Reader, what string) (*Config, error) {
 	var cfg Config
-	if err := yaml.Unmarshal(data, &cfg); err != nil {
-		return nil, fmt.Errorf("failed to parse config file %s: %w", path, err)
+	if err := yaml.NewDecoder(r).Decode(&cfg); err != nil && !errors.Is(err, io.EOF) {
+		return nil, fmt.Errorf("failed to parse %s: %w", what, err)
 	}
 
 	if err := cfg.validateAndSetDefaults(); err != nil {
 		return nil, fmt.Errorf("config validation and set defaults failed: %w", err)
 	}
-
 	return &cfg, nil
 }
 
+// configCacheStamp returns the cache key and revision stamp for an opened
+// config file. The last return value is false when the file cannot be
+// stat'ed, in which case the caller should parse without caching.
+func configCacheStamp(path string, f *os.File) (string, configStamp, bool) {
+	absPath, err := filepath.Abs(path)
+	if err != nil {
+		return "", configStamp{}, false
+	}
+	info, err := f.Stat()
+	if err != nil {
+		return "", configStamp{}, false
+	}
+	stamp := configStamp{modTime: info.ModTime(), size: info.Size()}
+	if st, ok := info.Sys().(*syscall.Stat_t); ok {
+		stamp.ino = st.Ino
+	}
+	return absPath, stamp, true
+}
+
 // validate and set defaults checks that all mandatory fields in the configuration are set
 // and sets default values for optional fields.
 func (c *Config) validateAndSetDefaults() error {
@@ -223,6 +318,11 @@ func (c *Config) validateAndSetDefaults() error {
 			errors = append(errors, "VMs are defined, operating_system: 'image_name' is required")
 		}
 	}
+	if proxy := c.OperatingSystem.PackageProxy; proxy != "" {
+		if u, err := url.Parse(proxy); err != nil || (u.Scheme != "http" && u.Scheme != "https") || u.Host == "" {
+			errors = append(errors, fmt.Sprintf("operating_system: package_proxy %q must be an http:// or https:// URL", proxy))
+		}
+	}
 
 	if c.SSH.User == "" {
 		c.SSH.User = "root"
@@ -232,6 +332,10 @@ func (c *Config) validateAndSetDefaults() error {
 		c.SSH.Password = "redhat"
 	}
 
+	if c.SSH.ConnectRate < 0 {
+		errors = append(errors, fmt.Sprintf("ssh.connect_rate must not be negative, got %d", c.SSH.ConnectRate))
+	}
+
 	// Expand tilde in SSH key path
 	if c.SSH.KeyPath != "" {
 		expanded, err := expandTilde(c.SSH.KeyPath)
@@ -288,6 +392,10 @@ func (c *Config) validateAndSetDefaults() error {
 		c.Kubernetes.KubeconfigDir = "kubeconfig"
 	}
 
+	if c.Kubernetes.MaxParallel < 0 {
+		errors = append(errors, fmt.Sprintf("kubernetes.max_parallel must not be negative, got %d", c.Kubernetes.MaxParallel))
+	}
+
 	// Validate Kubernetes clusters
 	for i, cluster := range c.Kubernetes.Clusters {
 		if cluster.Name == "" {
@@ -382,6 +490,9 @@ func (c *Config) validateAndSetDefaults() error {
 		return fmt.Errorf("validation errors:\n  - %s", strings.Join(errors, "; "))
 	}
 
+	c.hostDPUs = buildHostDPUIndex(c.VMs)
+	c.names = c.buildNameIndex()
+
 	return nil
 }
 
@@ -458,41 +569,125 @@ func (c *Config) IsVMMode() bool {
 	return mode == VMDeploymentMode
 }
 
-// GetHostDPUMappings returns all host-to-DPU mappings from VM configuration
+// GetHostDPUMappings returns all host-to-DPU mappings from VM configuration.
+// Mappings are ordered by host declaration order in the VMs section.
 func (c *Config) GetHostDPUMappings() []HostDPUMapping {
-	// Build map of hosts by name for lookup
+	return c.hostDPUIndex().mappings
+}
+
+// GetDPUConnectionsForHost returns the DPUs attached to the given VM host, or
+// nil if the host has none.
+func (c *Config) GetDPUConnectionsForHost(hostName string) []DPUConnection {
+	idx := c.hostDPUIndex()
+	i, ok := idx.byHost[hostName]
+	if !ok {
+		return nil
+	}
+	return idx.mappings[i].Connections
+}
+
+// GetHostForDPU returns the name of the VM host the given DPU is attached to.
+func (c *Config) GetHostForDPU(dpuName string) (string, bool) {
+	hostName, ok := c.hostDPUIndex().hostOfDPU[dpuName]
+	return hostName, ok
+}
+
+// hostDPUIndex returns the index built at load time, or builds a fresh one for
+// configs that did not go through LoadConfig (e.g. constructed in tests).
+func (c *Config) hostDPUIndex() *hostDPUIndex {
+	if c.hostDPUs != nil {
+		return c.hostDPUs
+	}
+	return buildHostDPUIndex(c.VMs)
+}
+
+// buildHostDPUIndex walks the VM list once and groups DPUs under their hosts.
+// DPUs referencing a host that is not defined are ignored.
+func buildHostDPUIndex(vms []VMConfig) *hostDPUIndex {
+	idx := &hostDPUIndex{
+		byHost:    make(map[string]int),
+		hostOfDPU: make(map[string]string),
+	}
+
 	hosts := make(map[string]VMConfig)
-	for _, vm := range c.VMs {
+	for _, vm := range vms {
 		if vm.Type == HostType {
 			hosts[vm.Name] = vm
 		}
 	}
 
-	// Build map of host name -> DPU connections
-	hostConnections := make(map[string][]DPUConnection)
-	for _, vm := range c.VMs {
-		if vm.Type == DpuType && vm.Host != "" {
-			if _, ok := hosts[vm.Host]; ok {
-				conn := DPUConnection{
-					DPU: vm,
-					Link: HostDPULink{
-						NetworkName: fmt.Sprintf("h2d-%s-%s", vm.Host, vm.Name),
-					},
-				}
-				hostConnections[vm.Host] = append(hostConnections[vm.Host], conn)
-			}
+	for _, vm := range vms {
+		if vm.Type != DpuType || vm.Host == "" {
+			continue
+		}
+		host, ok := hosts[vm.Host]
+		if !ok {
+			continue
 		}
+		i, ok := idx.byHost[vm.Host]
+		if !ok {
+			i = len(idx.mappings)
+			idx.byHost[vm.Host] = i
+			idx.mappings = append(idx.mappings, HostDPUMapping{Host: host})
+		}
+		idx.mappings[i].Connections = append(idx.mappings[i].Connections, DPUConnection{
+			DPU: vm,
+			Link: HostDPULink{
+				NetworkName: fmt.Sprintf("h2d-%s-%s", vm.Host, vm.Name),
+			},
+		})
+		idx.hostOfDPU[vm.Name] = vm.Host
 	}
 
-	var mappings []HostDPUMapping
-	for hostName, connections := range hostConnections {
-		mappings = append(mappings, HostDPUMapping{
-			Host:        hosts[hostName],
-			Connections: connections,
-		})
+	return idx
+}
+
+// nameIndex returns the index built at load time, or builds a fresh one for
+// configs that did not go through LoadConfig (e.g. constructed in tests).
+func (c *Config) nameIndex() *nameIndex {
+	if c.names != nil {
+		return c.names
+	}
+	return c.buildNameIndex()
+}
+
+// buildNameIndex records the position of each named VM, cluster and network.
+// When a name is repeated the first entry wins, matching a linear scan.
+func (c *Config) buildNameIndex() *nameIndex {
+	idx := &nameIndex{
+		vms:      make(map[string]int, len(c.VMs)),
+		clusters: make(map[string]int, len(c.Kubernetes.Clusters)),
+		networks: make(map[string]int, len(c.Networks)),
+	}
+	for i := range c.VMs {
+		if _, ok := idx.vms[c.VMs[i].Name]; !ok {
+			idx.vms[c.VMs[i].Name] = i
+		}
+	}
+	for i := range c.Kubernetes.Clusters {
+		if _, ok := idx.clusters[c.Kubernetes.Clusters[i].Name]; !ok {
+			idx.clusters[c.Kubernetes.Clusters[i].Name] = i
+		}
 	}
+	for i := range c.Networks {
+		if _, ok := idx.networks[c.Networks[i].Name]; !ok {
+			idx.networks[c.Networks[i].Name] = i
+		}
+	}
+	return idx
+}
 
-	return mappings
+// GetVMConfig returns the VM configuration by name
+func (c *Config) GetVMConfig(name string) *VMConfig {
+	if i, ok := c.nameIndex().vms[name]; ok && i < len(c.VMs) && c.VMs[i].Name == name {
+		return &c.VMs[i]
+	}
+	for i := range c.VMs {
+		if c.VMs[i].Name == name {
+			return &c.VMs[i]
+		}
+	}
+	return nil
 }
 
 // GetClusterRoleMapping returns a mapping of cluster names to roles and their VMs.
@@ -545,6 +740,9 @@ func (c *Config) GetClusterNames() []string {
 
 // GetClusterConfig returns the cluster configuration by name
 func (c *Config) GetClusterConfig(name string) *ClusterConfig {
+	if i, ok := c.nameIndex().clusters[name]; ok && i < len(c.Kubernetes.Clusters) && c.Kubernetes.Clusters[i].Name == name {
+		return &c.Kubernetes.Clusters[i]
+	}
 	for i := range c.Kubernetes.Clusters {
 		if c.Kubernetes.Clusters[i].Name == name {
 			return &c.Kubernetes.Clusters[i]
@@ -880,6 +1078,9 @@ func (c *Config) GetHostToDpuNumPairs() int {
 
 // GetNetworkByName returns the network configuration by name
 func (c *Config) GetNetworkByName(name string) *NetworkConfig {
+	if i, ok := c.nameIndex().networks[name]; ok && i < len(c.Networks) && c.Networks[i].Name == name {
+		return &c.Networks[i]
+	}
 	for i := range c.Networks {
 		if c.Networks[i].Name == name {
 			return &c.Networks[i]
@@ -1,10 +1,12 @@
 package config
 
 import (
+	"fmt"
 	"os"
 	"path/filepath"
 	"strings"
 	"testing"
+	"time"
 
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
@@ -79,6 +81,136 @@ kubernetes:
 	assert.Equal(t, "cluster-1", cfg.Kubernetes.Clusters[0].Name)
 }
 
+// cacheTestConfig is a minimal kind config for the LoadConfig cache tests;
+// %[1]s is the name of its single cluster.
+const cacheTestConfig = `
+kind:
+  nodes:
+    - name: "cp"
+      k8s_role: "control-plane"
+      k8s_cluster: "%[1]s"
+kubernetes:
+  version: "1.33"
+  clusters:
+    - name: "%[1]s"
+      cni: "ovn-kubernetes"
+operating_system:
+  image_name: "unused-in-kind"
+ssh:
+  user: "root"
+  key_path: "/tmp/dpu-sim-test-key"
+`
+
+// writeCacheTestConfig writes cacheTestConfig for cluster to path, stamps it
+// with modTime and returns the written content.
+func writeCacheTestConfig(t *testing.T, path, cluster string, modTime time.Time) string {
+	t.Helper()
+	content := fmt.Sprintf(cacheTestConfig, cluster)
+	require.NoError(t, os.WriteFile(path, []byte(content), 0o644))
+	require.NoError(t, os.Chtimes(path, modTime, modTime))
+	return content
+}
+
+func TestLoadConfigCachesByPathAndModTime(t *testing.T) {
+	configPath := filepath.Join(t.TempDir(), "config.yaml")
+	modTime := time.Now().Add(-time.Hour).Truncate(time.Second)
+	writeCacheTestConfig(t, configPath, "cluster-a", modTime)
+
+	first, err := LoadConfig(configPath)
+	require.NoError(t, err)
+	first.OVNKubernetesPath = "/tmp/ovnk"
+
+	second, err := LoadConfig(configPath)
+	require.NoError(t, err)
+	assert.NotSame(t, first, second)
+	assert.Empty(t, second.OVNKubernetesPath, "top-level fields must not leak between callers")
+	assert.Equal(t, "cluster-a", second.Kubernetes.Clusters[0].Name)
+
+	// Rewriting the file with a new mtime invalidates the cached entry.
+	writeCacheTestConfig(t, configPath, "cluster-b", modTime.Add(time.Minute))
+
+	third, err := LoadConfig(configPath)
+	require.NoError(t, err)
+	assert.Equal(t, "cluster-b", third.Kubernetes.Clusters[0].Name)
+}
+
+func TestLoadConfigCacheDetectsSameModTimeEdit(t *testing.T) {
+	configPath := filepath.Join(t.TempDir(), "config.yaml")
+	modTime := time.Now().Add(-time.Hour).Truncate(time.Second)
+	writeCacheTestConfig(t, configPath, "c1", modTime)
+
+	first, err := LoadConfig(configPath)
+	require.NoError(t, err)
+	assert.Equal(t, "c1", first.Kubernetes.Clusters[0].Name)
+
+	// Same mtime, different size: the edit must still be picked up.
+	updated := writeCacheTestConfig(t, configPath, "cluster-1", modTime)
+
+	second, err := LoadConfig(configPath)
+	require.NoError(t, err)
+	assert.Equal(t, "cluster-1", second.Kubernetes.Clusters[0].Name)
+
+	absPath, err := filepath.Abs(configPath)
+	require.NoError(t, err)
+	configCacheMu.Lock()
+	entry := configCache[absPath]
+	configCacheMu.Unlock()
+	assert.Equal(t, int64(len(updated)), entry.stamp.size, "the new revision replaces the old cache entry")
+}
+
+func TestLoadConfigCacheDetectsReplacedFile(t *testing.T) {
+	tmpDir := t.TempDir()
+	configPath := filepath.Join(tmpDir, "config.yaml")
+	modTime := time.Now().Add(-time.Hour).Truncate(time.Second)
+	writeCacheTestConfig(t, configPath, "c1", modTime)
+
+	first, err := LoadConfig(configPath)
+	require.NoError(t, err)
+	assert.Equal(t, "c1", first.Kubernetes.Clusters[0].Name)
+
+	// Same mtime and size, but a new file renamed into place.
+	tmpPath := filepath.Join(tmpDir, "config.yaml.new")
+	writeCacheTestConfig(t, tmpPath, "c2", modTime)
+	require.NoError(t, os.Rename(tmpPath, configPath))
+
+	second, err := LoadConfig(configPath)
+	require.NoError(t, err)
+	assert.Equal(t, "c2", second.Kubernetes.Clusters[0].Name)
+}
+
+func TestParseConfig(t *testing.T) {
+	cfg, err := ParseConfig([]byte(`
+networks:
+  - name: "host-to-dpu-link"
+    type: "HostToDpu"
+    num_pairs: 1
+kind:
+  nodes:
+    - name: "cp"
+      k8s_role: "control-plane"
+      k8s_cluster: "dpu-sim-host"
+kubernetes:
+  version: "1.33"
+  clusters:
+    - name: "dpu-sim-host"
+      cni: "ovn-kubernetes"
+operating_system:
+  image_name: "unused-in-kind"
+ssh:
+  user: "root"
+  key_path: "/tmp/dpu-sim-test-key"
+`))
+	require.NoError(t, err)
+	assert.Equal(t, "dpu-sim-host", cfg.Kubernetes.Clusters[0].Name)
+	assert.Equal(t, DefaultSSHConnectRate, cfg.SSH.GetConnectRate())
+
+	_, err = ParseConfig([]byte("networks: [unterminated"))
+	assert.ErrorContains(t, err, "failed to parse config")
+
+	_, err = ParseConfig([]byte("kubernetes:\n  max_parallel: -1\n"))
+	assert.ErrorContains(t, err, "validation")
+}
+
 func TestGetDeploymentMode(t *testing.T) {
 	tests := []struct {
 		name        string
@@ -188,6 +320,32 @@ func TestGetHostDPUMappings(t *testing.T) {
 	assert.Equal(t, "h2d-host-2-dpu-2", host2Mapping.Connections[0].Link.NetworkName)
 }
 
+func TestHostDPULookups(t *testing.T) {
+	cfg := Config{
+		VMs: []VMConfig{
+			{Name: "host-1", Type: HostType},
+			{Name: "dpu-1a", Type: DpuType, Host: "host-1"},
+			{Name: "dpu-1b", Type: DpuType, Host: "host-1"},
+			{Name: "host-2", Type: HostType},
+			{Name: "dpu-orphan", Type: DpuType, Host: "missing-host"},
+		},
+	}
+	cfg.hostDPUs = buildHostDPUIndex(cfg.VMs)
+
+	conns := cfg.GetDPUConnectionsForHost("host-1")
+	require.Len(t, conns, 2)
+	assert.Equal(t, "dpu-1a", conns[0].DPU.Name)
+	assert.Equal(t, "dpu-1b", conns[1].DPU.Name)
+	assert.Empty(t, cfg.GetDPUConnectionsForHost("host-2"))
+
+	hostName, ok := cfg.GetHostForDPU("dpu-1b")
+	assert.True(t, ok)
+	assert.Equal(t, "host-1", hostName)
+
+	_, ok = cfg.GetHostForDPU("dpu-orphan")
+	assert.False(t, ok, "DPUs referencing an undefined host are not indexed")
+}
+
 func TestGetClusterConfig(t *testing.T) {
 	cfg := Config{
 		Kubernetes: KubernetesConfig{
@@ -209,6 +367,41 @@ func TestGetClusterConfig(t *testing.T) {
 	assert.Nil(t, cluster)
 }
 
+func TestNameLookups(t *testing.T) {
+	cfg := Config{
+		VMs: []VMConfig{
+			{Name: "host-1", K8sNodeIP: "192.168.100.10"},
+			{Name: "dpu-1", K8sNodeIP: "192.168.100.11"},
+			{Name: "host-1", K8sNodeIP: "192.168.100.99"},
+		},
+		Networks: []NetworkConfig{
+			{Name: "mgmt-network"},
+			{Name: "k8s-network"},
+		},
+		Kubernetes: KubernetesConfig{
+			Clusters: []ClusterConfig{{Name: "cluster-1"}},
+		},
+	}
+	cfg.names = cfg.buildNameIndex()
+
+	vm := cfg.GetVMConfig("dpu-1")
+	require.NotNil(t, vm)
+	assert.Equal(t, "192.168.100.11", vm.K8sNodeIP)
+	assert.Same(t, &cfg.VMs[1], vm, "lookups return a pointer into the config")
+
+	vm = cfg.GetVMConfig("host-1")
+	require.NotNil(t, vm)
+	assert.Equal(t, "192.168.100.10", vm.K8sNodeIP, "the first entry wins for repeated names")
+	assert.Nil(t, cfg.GetVMConfig("missing"))
+
+	assert.Same(t, &cfg.Networks[1], cfg.GetNetworkByName("k8s-network"))
+	assert.Same(t, &cfg.Kubernetes.Clusters[0], cfg.GetClusterConfig("cluster-1"))
+
+	// Entries added after the index was built are still found.
+	cfg.VMs = append(cfg.VMs, VMConfig{Name: "host-2"})
+	require.NotNil(t, cfg.GetVMConfig("host-2"))
+}
+
 func TestGetKindNodeCounts(t *testing.T) {
 	cfg := Config{
 		Kubernetes: KubernetesConfig{
@@ -251,6 +444,42 @@ func TestIsKindMode(t *testing.T) {
 	assert.False(t, kindConfig.IsVMMode())
 }
 
+func TestGetMaxParallel(t *testing.T) {
+	k := KubernetesConfig{}
+	assert.Equal(t, DefaultMaxParallel, k.GetMaxParallel())
+
+	k.MaxParallel = 3
+	assert.Equal(t, 3, k.GetMaxParallel())
+
+	cfg := Config{
+		Kubernetes: KubernetesConfig{
+			MaxParallel: -1,
+			Clusters:    []ClusterConfig{{Name: "cluster-1", CNI: CNIOVNKubernetes}},
+		},
+	}
+	err := cfg.validateAndSetDefaults()
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "max_parallel")
+}
+
+func TestGetSSHConnectRate(t *testing.T) {
+	s := SSHConfig{}
+	assert.Equal(t, DefaultSSHConnectRate, s.GetConnectRate())
+
+	s.ConnectRate = 5
+	assert.Equal(t, 5, s.GetConnectRate())
+
+	cfg := Config{
+		SSH: SSHConfig{ConnectRate: -1},
+		Kubernetes: KubernetesConfig{
+			Clusters: []ClusterConfig{{Name: "cluster-1", CNI: CNIOVNKubernetes}},
+		},
+	}
+	err := cfg.validateAndSetDefaults()
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "connect_rate")
+}
+
 func TestValidateOperatingSystemAllowsImageRef(t *testing.T) {
 	cfg := Config{
 		Networks: []NetworkConfig{
@@ -421,6 +650,25 @@ func TestValidateOperatingSystemRequiresURLOrRef(t *testing.T) {
 	assert.True(t, strings.Contains(err.Error(), "one of 'image_url' or 'image_ref' is required"))
 }
 
+func TestValidatePackageProxy(t *testing.T) {
+	newCfg := func(proxy string) Config {
+		return Config{
+			Kubernetes: KubernetesConfig{
+				Clusters: []ClusterConfig{{Name: "cluster-1", CNI: CNIOVNKubernetes}},
+			},
+			OperatingSystem: OSConfig{PackageProxy: proxy},
+		}
+	}
+
+	cfg := newCfg("http://192.168.120.1:3128")
+	require.NoError(t, cfg.validateAndSetDefaults())
+
+	cfg = newCfg("192.168.120.1:3128")
+	err := cfg.validateAndSetDefaults()
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "package_proxy")
+}
+
 func TestValidateOperatingSystemRejectsURLAndRefTogether(t *testing.T) {
 	cfg := Config{
 		Networks: []NetworkConfig{{
@@ -60,12 +60,23 @@ type Config struct {
 	// point dpu-sim at a separate checkout (e.g. an OVN-Kubernetes PR).
 	// This is not populated from YAML.
 	OVNKubernetesPath string `yaml:"-"`
+	// ForceK8sInstall re-runs every Kubernetes install step on each machine
+	// even when its check already passes. Set via --force-k8s-install; this
+	// is not populated from YAML.
+	ForceK8sInstall bool `yaml:"-"`
 	// TFT is the kubernetes-traffic-flow-tests "tft" document subtree (optional).
 	// Used by `dpu-sim tft run` to generate a TFT config when --tft-config is not set.
 	TFT *TrafficFlowTestsSubtree `yaml:"tft,omitempty"`
 	// TrafficFlowTestsKubeconfig is the kubeconfig path for TFT (yaml key "kubeconfig").
 	// When empty, tft run defaults to the first kubernetes.clusters entry (Kind or VM).
 	TrafficFlowTestsKubeconfig string `yaml:"kubeconfig,omitempty"`
+
+	// hostDPUs indexes VM hosts and their DPUs. It is built once by
+	// validateAndSetDefaults; see hostDPUIndex().
+	hostDPUs *hostDPUIndex
+	// names maps VM, cluster and network names to their slice positions. It
+	// is built once by validateAndSetDefaults; see nameIndex().
+	names *nameIndex
 }
 
 // TrafficFlowTestsSubtree holds the raw tft: YAML value (sequence or mapping) for the TFT harness.
@@ -194,6 +205,14 @@ type OSConfig struct {
 	ImageURL  string `yaml:"image_url,omitempty"`
 	ImageRef  string `yaml:"image_ref,omitempty"`
 	ImageName string `yaml:"image_name"`
+	// PackageProxy is an HTTP proxy URL (e.g. a caching proxy on the
+	// hypervisor) that dnf on every machine uses, so packages shared by all
+	// nodes are fetched from upstream once.
+	PackageProxy string `yaml:"package_proxy,omitempty"`
+	// CacheK8sImage saves a VM disk with Kubernetes packages installed as the
+	// base image for later deployments with the same OS image and Kubernetes
+	// version, so they skip the package installs.
+	CacheK8sImage bool `yaml:"cache_k8s_image,omitempty"`
 }
 
 // SSHConfig represents SSH configuration
@@ -201,6 +220,23 @@ type SSHConfig struct {
 	User     string `yaml:"user"`
 	KeyPath  string `yaml:"key_path"`
 	Password string `yaml:"password"`
+	// ConnectRate caps how many new SSH connections are opened per second
+	// across all machines, so a large fan-out does not hit every sshd (and
+	// the local agent) with a burst of handshakes at once.
+	ConnectRate int `yaml:"connect_rate,omitempty"`
+}
+
+// DefaultSSHConnectRate is the default number of new SSH connections opened
+// per second.
+const DefaultSSHConnectRate = 20
+
+// GetConnectRate returns the SSH connection rate, defaulting to
+// DefaultSSHConnectRate if not set
+func (s *SSHConfig) GetConnectRate() int {
+	if s.ConnectRate <= 0 {
+		return DefaultSSHConnectRate
+	}
+	return s.ConnectRate
 }
 
 // KubernetesConfig represents Kubernetes configuration
@@ -208,9 +244,14 @@ type KubernetesConfig struct {
 	Version       string          `yaml:"version"`
 	KubeconfigDir string          `yaml:"kubeconfig_dir,omitempty"`
 	OffloadDPU    bool            `yaml:"offload_dpu,omitempty"`
+	MaxParallel   int             `yaml:"max_parallel,omitempty"`
 	Clusters      []ClusterConfig `yaml:"clusters"`
 }
 
+// DefaultMaxParallel is the default number of VMs that Kubernetes setup
+// steps run on concurrently.
+const DefaultMaxParallel = 8
+
 // GetKubeconfigDir returns the kubeconfig directory, defaulting to "kubeconfig" if not set
 func (k *KubernetesConfig) GetKubeconfigDir() string {
 	if k.KubeconfigDir == "" {
@@ -219,6 +260,15 @@ func (k *KubernetesConfig) GetKubeconfigDir() string {
 	return k.KubeconfigDir
 }
 
+// GetMaxParallel returns how many VMs Kubernetes setup steps may run on at
+// once, defaulting to DefaultMaxParallel if not set
+func (k *KubernetesConfig) GetMaxParallel() int {
+	if k.MaxParallel <= 0 {
+		return DefaultMaxParallel
+	}
+	return k.MaxParallel
+}
+
 // ClusterConfig represents a Kubernetes cluster configuration
 type ClusterConfig struct {
 	Name        string      `yaml:"name"`
@@ -245,6 +295,22 @@ type HostDPUMapping struct {
 	Connections []DPUConnection
 }
 
+// hostDPUIndex is a precomputed view of the host-to-DPU relationships in the
+// VMs section, so per-VM lookups don't rescan the whole VM list.
+type hostDPUIndex struct {
+	mappings  []HostDPUMapping
+	byHost    map[string]int    // host name -> index into mappings
+	hostOfDPU map[string]string // DPU name -> host name
+}
+
+// nameIndex maps names to their position in the VMs, Kubernetes.Clusters and
+// Networks slices, so by-name lookups don't rescan the whole list.
+type nameIndex struct {
+	vms      map[string]int
+	clusters map[string]int
+	networks map[string]int
+}
+
 type ClusterRole string
 
 const (
@@ -4,6 +4,7 @@ import (
 	"bufio"
 	"bytes"
 	"context"
+	"encoding/json"
 	"fmt"
 	"io"
 	"net/http"
@@ -19,7 +20,9 @@ import (
 	"k8s.io/apimachinery/pkg/api/meta"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+	"k8s.io/apimachinery/pkg/types"
 	"k8s.io/apimachinery/pkg/util/yaml"
+	"k8s.io/apimachinery/pkg/watch"
 	"k8s.io/client-go/discovery"
 	discoverycache "k8s.io/client-go/discovery/cached/memory"
 	"k8s.io/client-go/dynamic"
@@ -284,132 +287,178 @@ func IsPodReady(pod *corev1.Pod) bool {
 
 // WaitForPodRunning waits for a specific pod to be in Running state
 func (c *K8sClient) WaitForPodRunning(namespace, name string, timeout time.Duration) error {
-	ctx, cancel := context.WithTimeout(context.Background(), timeout)
-	defer cancel()
-
-	ticker := time.NewTicker(5 * time.Second)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			return fmt.Errorf("timeout waiting for pod %s/%s to be running", namespace, name)
-		case <-ticker.C:
-			pod, err := c.clientset.CoreV1().Pods(namespace).Get(ctx, name, metav1.GetOptions{})
-			if err != nil {
-				continue
-			}
-			if pod.Status.Phase == corev1.PodRunning && IsPodReady(pod) {
-				return nil
-			}
-		}
-	}
+	return c.waitForPodsReady(namespace, metav1.ListOptions{FieldSelector: "metadata.name=" + name},
+		fmt.Sprintf("pod %s/%s", namespace, name), timeout)
 }
 
 // WaitForPodsReady waits for pods to be ready. If labelSelector is empty,
 // it waits for all pods in the namespace.
 func (c *K8sClient) WaitForPodsReady(namespace, labelSelector string, timeout time.Duration) error {
+	what := fmt.Sprintf("all pods in namespace: %s", namespace)
+	if labelSelector != "" {
+		what = fmt.Sprintf("pods in namespace: %s label: %s", namespace, labelSelector)
+	}
+	return c.waitForPodsReady(namespace, metav1.ListOptions{LabelSelector: labelSelector}, what, timeout)
+}
+
+// waitForPodsReady waits for every pod selected by opts to be ready.
+//
+// Like kubectl wait, it lists the pods once and then watches them, so it
+// returns as soon as the last pod turns ready instead of on a polling tick.
+// If the watch ends early the pods are listed again.
+func (c *K8sClient) waitForPodsReady(namespace string, opts metav1.ListOptions, what string, timeout time.Duration) error {
 	ctx, cancel := context.WithTimeout(context.Background(), timeout)
 	defer cancel()
 
-	ticker := time.NewTicker(10 * time.Second)
-	defer ticker.Stop()
-
-	if labelSelector != "" {
-		log.Info("Waiting for pods in namespace: %s label: %s to be ready...", namespace, labelSelector)
-	} else {
-		log.Info("Waiting for all pods in namespace: %s to be ready...", namespace)
-	}
+	log.Info("Waiting for %s to be ready...", what)
 
 	for {
-		select {
-		case <-ctx.Done():
-			if labelSelector != "" {
-				return fmt.Errorf("timeout waiting for pods in namespace: %s label: %s", namespace, labelSelector)
-			} else {
-				return fmt.Errorf("timeout waiting for all pods in namespace: %s", namespace)
+		pods, err := c.clientset.CoreV1().Pods(namespace).List(ctx, opts)
+		if err != nil {
+			if ctx.Err() != nil {
+				return fmt.Errorf("timeout waiting for %s", what)
 			}
-		case <-ticker.C:
-			pods, err := c.clientset.CoreV1().Pods(namespace).List(ctx, metav1.ListOptions{
-				LabelSelector: labelSelector,
-			})
-			if err != nil {
-				if labelSelector != "" {
-					log.Warn("Warning: failed to list pods in namespace: %s label: %s: %v", namespace, labelSelector, err)
-				} else {
-					log.Warn("Warning: failed to list all pods in namespace: %s: %v", namespace, err)
-				}
-				continue
+			log.Warn("Warning: failed to list %s: %v", what, err)
+		} else {
+			ready := make(map[string]bool, len(pods.Items))
+			for i := range pods.Items {
+				ready[pods.Items[i].Name] = IsPodReady(&pods.Items[i])
 			}
-
-			if len(pods.Items) == 0 {
-				if labelSelector != "" {
-					log.Debug("No pods found in namespace: %s label: %s", namespace, labelSelector)
-				} else {
-					log.Debug("No pods found in namespace: %s", namespace)
-				}
-				continue
+			if allPodsReady(ready, what) {
+				log.Info("✓ %s are ready", what)
+				return nil
 			}
-
-			allReady := true
-			readyCount := 0
-			for _, pod := range pods.Items {
-				if IsPodReady(&pod) {
-					readyCount++
-				} else {
-					allReady = false
-				}
+			if c.watchPodsUntilReady(ctx, namespace, opts, pods.ResourceVersion, ready, what) {
+				log.Info("✓ %s are ready", what)
+				return nil
 			}
+		}
 
-			if labelSelector != "" {
-				log.Debug("✓ Pods in namespace: %s label: %s ready: %d/%d", namespace, labelSelector, readyCount, len(pods.Items))
-			} else {
-				log.Debug("✓ All Pods in namespace: %s ready: %d/%d", namespace, readyCount, len(pods.Items))
-			}
+		select {
+		case <-ctx.Done():
+			return fmt.Errorf("timeout waiting for %s", what)
+		case <-time.After(2 * time.Second):
+		}
+	}
+}
 
-			if allReady {
-				if labelSelector != "" {
-					log.Info("✓ Pods in namespace: %s label: %s are ready", namespace, labelSelector)
-				} else {
-					log.Info("✓ All Pods in namespace: %s are ready", namespace)
-				}
-				return nil
-			}
+// watchPodsUntilReady applies pod watch events to ready, starting from
+// resourceVersion, and reports whether every pod became ready. It returns
+// false when the watch could not be started, closed, or ctx expired.
+func (c *K8sClient) watchPodsUntilReady(ctx context.Context, namespace string, opts metav1.ListOptions, resourceVersion string, ready map[string]bool, what string) bool {
+	opts.ResourceVersion = resourceVersion
+	w, err := c.clientset.CoreV1().Pods(namespace).Watch(ctx, opts)
+	if err != nil {
+		log.Debug("Failed to watch %s: %v", what, err)
+		return false
+	}
+	defer w.Stop()
+
+	for event := range w.ResultChan() {
+		pod, ok := event.Object.(*corev1.Pod)
+		if !ok {
+			// A watch error (e.g. an expired resource version) ends this
+			// watch; the caller lists again.
+			return false
+		}
+		switch event.Type {
+		case watch.Deleted:
+			delete(ready, pod.Name)
+		case watch.Added, watch.Modified:
+			ready[pod.Name] = IsPodReady(pod)
+		default:
+			continue
+		}
+		if allPodsReady(ready, what) {
+			return true
 		}
 	}
+	return false
+}
+
+// allPodsReady reports whether ready holds at least one pod and all of them
+// are ready.
+func allPodsReady(ready map[string]bool, what string) bool {
+	if len(ready) == 0 {
+		log.Debug("No pods found for %s", what)
+		return false
+	}
+	readyCount := 0
+	for _, r := range ready {
+		if r {
+			readyCount++
+		}
+	}
+	log.Debug("✓ %s ready: %d/%d", what, readyCount, len(ready))
+	return readyCount == len(ready)
 }
 
 // WaitForDeploymentAvailable waits for a deployment to report Available=True.
+//
+// Like WaitForPodsReady, it gets the deployment once and then watches it, so
+// it returns as soon as the deployment turns available instead of on a
+// polling tick.
 func (c *K8sClient) WaitForDeploymentAvailable(namespace, name string, timeout time.Duration) error {
 	ctx, cancel := context.WithTimeout(context.Background(), timeout)
 	defer cancel()
 
-	ticker := time.NewTicker(5 * time.Second)
-	defer ticker.Stop()
-
 	log.Info("Waiting for deployment %s/%s to be available...", namespace, name)
 
+	opts := metav1.ListOptions{FieldSelector: "metadata.name=" + name}
 	for {
-		select {
-		case <-ctx.Done():
-			return fmt.Errorf("timeout waiting for deployment %s/%s to be available", namespace, name)
-		case <-ticker.C:
-			deployment, err := c.clientset.AppsV1().Deployments(namespace).Get(ctx, name, metav1.GetOptions{})
-			if err != nil {
-				log.Warn("Warning: failed to get deployment %s/%s: %v", namespace, name, err)
-				continue
+		deployments, err := c.clientset.AppsV1().Deployments(namespace).List(ctx, opts)
+		if err != nil {
+			if ctx.Err() != nil {
+				return fmt.Errorf("timeout waiting for deployment %s/%s to be available", namespace, name)
 			}
-
-			if deployment.Status.ObservedGeneration < deployment.Generation {
-				continue
+			log.Warn("Warning: failed to get deployment %s/%s: %v", namespace, name, err)
+		} else {
+			if len(deployments.Items) == 1 && isDeploymentRolledOut(&deployments.Items[0]) {
+				log.Info("✓ Deployment %s/%s is available", namespace, name)
+				return nil
 			}
-
-			if isDeploymentAvailable(deployment) {
+			if c.watchDeploymentUntilAvailable(ctx, namespace, opts, deployments.ResourceVersion) {
 				log.Info("✓ Deployment %s/%s is available", namespace, name)
 				return nil
 			}
 		}
+
+		select {
+		case <-ctx.Done():
+			return fmt.Errorf("timeout waiting for deployment %s/%s to be available", namespace, name)
+		case <-time.After(2 * time.Second):
+		}
+	}
+}
+
+// watchDeploymentUntilAvailable watches the deployment selected by opts from
+// resourceVersion and reports whether it became available. It returns false
+// when the watch could not be started, closed, or ctx expired.
+func (c *K8sClient) watchDeploymentUntilAvailable(ctx context.Context, namespace string, opts metav1.ListOptions, resourceVersion string) bool {
+	opts.ResourceVersion = resourceVersion
+	w, err := c.clientset.AppsV1().Deployments(namespace).Watch(ctx, opts)
+	if err != nil {
+		log.Debug("Failed to watch deployments in %s (%s): %v", namespace, opts.FieldSelector, err)
+		return false
+	}
+	defer w.Stop()
+
+	for event := range w.ResultChan() {
+		deployment, ok := event.Object.(*appsv1.Deployment)
+		if !ok {
+			return false
+		}
+		if (event.Type == watch.Added || event.Type == watch.Modified) && isDeploymentRolledOut(deployment) {
+			return true
+		}
 	}
+	return false
+}
+
+// isDeploymentRolledOut reports whether the controller has observed the
+// deployment's latest generation and reports it available.
+func isDeploymentRolledOut(deployment *appsv1.Deployment) bool {
+	return deployment.Status.ObservedGeneration >= deployment.Generation && isDeploymentAvailable(deployment)
 }
 
 func isDeploymentAvailable(deployment *appsv1.Deployment) bool {
@@ -444,26 +493,7 @@ func (c *K8sClient) GetNode(name string) (*corev1.Node, error) {
 
 // LabelNode adds or updates labels on a node
 func (c *K8sClient) LabelNode(name string, labels map[string]string) error {
-	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
-	defer cancel()
-
-	err := retry.RetryOnConflict(retry.DefaultRetry, func() error {
-		node, err := c.clientset.CoreV1().Nodes().Get(ctx, name, metav1.GetOptions{})
-		if err != nil {
-			return fmt.Errorf("failed to get node %s: %w", name, err)
-		}
-
-		if node.Labels == nil {
-			node.Labels = make(map[string]string)
-		}
-		for k, v := range labels {
-			node.Labels[k] = v
-		}
-
-		_, err = c.clientset.CoreV1().Nodes().Update(ctx, node, metav1.UpdateOptions{})
-		return err
-	})
-	if err != nil {
+	if err := c.mergeNodeMetadata(name, "labels", labels); err != nil {
 		return fmt.Errorf("failed to update node %s labels: %w", name, err)
 	}
 	return nil
@@ -471,29 +501,27 @@ func (c *K8sClient) LabelNode(name string, labels map[string]string) error {
 
 // AnnotateNode adds or updates annotations on a node
 func (c *K8sClient) AnnotateNode(name string, annotations map[string]string) error {
+	if err := c.mergeNodeMetadata(name, "annotations", annotations); err != nil {
+		return fmt.Errorf("failed to update node %s annotations: %w", name, err)
+	}
+	return nil
+}
+
+// mergeNodeMetadata sets values under the node's metadata.<field> with a
+// single merge patch. Unlike a get and update it is one API call and cannot
+// conflict with other writers, since only the given keys are sent.
+func (c *K8sClient) mergeNodeMetadata(name, field string, values map[string]string) error {
 	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
 	defer cancel()
 
-	err := retry.RetryOnConflict(retry.DefaultRetry, func() error {
-		node, err := c.clientset.CoreV1().Nodes().Get(ctx, name, metav1.GetOptions{})
-		if err != nil {
-			return fmt.Errorf("failed to get node %s: %w", name, err)
-		}
-
-		if node.Annotations == nil {
-			node.Annotations = make(map[string]string)
-		}
-		for k, v := range annotations {
-			node.Annotations[k] = v
-		}
-
-		_, err = c.clientset.CoreV1().Nodes().Update(ctx, node, metav1.UpdateOptions{})
-		return err
+	patch, err := json.Marshal(map[string]any{
+		"metadata": map[string]any{field: values},
 	})
 	if err != nil {
-		return fmt.Errorf("failed to update node %s annotations: %w", name, err)
+		return err
 	}
-	return nil
+	_, err = c.clientset.CoreV1().Nodes().Patch(ctx, name, types.MergePatchType, patch, metav1.PatchOptions{})
+	return err
 }
 
 // RemoveNodeTaint removes a taint from a node by key and effect (best effort, ignores if not found)
@@ -515,6 +543,9 @@ func (c *K8sClient) RemoveNodeTaint(name string, taintKey string, effect corev1.
 			}
 			newTaints = append(newTaints, taint)
 		}
+		if len(newTaints) == len(node.Spec.Taints) {
+			return nil // Not tainted; skip the write
+		}
 
 		node.Spec.Taints = newTaints
 
@@ -814,21 +845,22 @@ func (c *K8sClient) DeletePodsByLabel(namespace, labelSelector string) error {
 	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
 	defer cancel()
 
-	pods, err := c.clientset.CoreV1().Pods(namespace).List(ctx, metav1.ListOptions{
-		LabelSelector: labelSelector,
-	})
+	listOpts := metav1.ListOptions{LabelSelector: labelSelector}
+	pods, err := c.clientset.CoreV1().Pods(namespace).List(ctx, listOpts)
 	if err != nil {
 		return fmt.Errorf("failed to list pods in %s with label %s: %w", namespace, labelSelector, err)
 	}
+	if len(pods.Items) == 0 {
+		log.Debug("No pods in %s with label %s to delete", namespace, labelSelector)
+		return nil
+	}
 
-	for _, pod := range pods.Items {
-		if err := c.clientset.CoreV1().Pods(namespace).Delete(ctx, pod.Name, metav1.DeleteOptions{}); err != nil {
-			log.Warn("Warning: failed to delete pod %s/%s: %v", namespace, pod.Name, err)
-		} else {
-			log.Info("✓ Deleted pod %s/%s", namespace, pod.Name)
-		}
+	// One DeleteCollection call instead of a delete per pod.
+	if err := c.clientset.CoreV1().Pods(namespace).DeleteCollection(ctx, metav1.DeleteOptions{}, listOpts); err != nil {
+		return fmt.Errorf("failed to delete pods in %s with label %s: %w", namespace, labelSelector, err)
 	}
 
+	log.Info("✓ Deleted %d pod(s) in %s with label %s", len(pods.Items), namespace, labelSelector)
 	return nil
 }
 
@@ -23,52 +23,89 @@ func (m *K8sMachineManager) InstallKubernetes(cmdExec platform.CommandExecutor,
 		return fmt.Errorf("failed to set hostname for Kubernetes: %w", err)
 	}
 
+	if proxy := m.config.OperatingSystem.PackageProxy; proxy != "" {
+		distro, err := cmdExec.GetDistro()
+		if err != nil {
+			return fmt.Errorf("failed to detect distribution on %s: %w", cmdExec.String(), err)
+		}
+		if err := linux.ConfigurePackageProxy(cmdExec, distro, proxy); err != nil {
+			return err
+		}
+	}
+
 	reason := "Required for Kubernetes installation"
-	deps := []platform.Dependency{
-		{
-			Name:        "Swap Off",
-			Reason:      reason,
-			CheckFunc:   linux.CheckSwapDisabled,
-			InstallFunc: linux.DisableSwap,
-		},
-		{
-			Name:        "K8s Kernel Modules",
-			Reason:      reason,
-			CheckFunc:   linux.CheckK8sKernelModules,
-			InstallFunc: linux.ConfigureK8sKernelModules,
-		},
+	// Swap and kernel modules only touch runtime state, so they run
+	// alongside the package steps. Everything that goes through the package
+	// manager shares one group because dnf serializes on the rpmdb lock; the
+	// first step of that group installs all the packages in one transaction
+	// so the steps after it only configure services.
+	groups := [][]platform.Dependency{
 		{
-			Name:        "crio",
-			Reason:      reason,
-			CheckCmd:    []string{"systemctl", "is-active", "crio"},
-			InstallFunc: linux.InstallCRIO,
+			{
+				Name:        "Swap Off",
+				Reason:      reason,
+				CheckFunc:   linux.CheckSwapDisabled,
+				InstallFunc: linux.DisableSwap,
+			},
 		},
 		{
-			Name:        "openvswitch",
-			Reason:      reason,
-			CheckCmd:    []string{"ovs-vsctl", "--version"},
-			InstallFunc: linux.InstallSystemdOpenVSwitch,
+			{
+				Name:        "K8s Kernel Modules",
+				Reason:      reason,
+				CheckFunc:   linux.CheckK8sKernelModules,
+				InstallFunc: linux.ConfigureK8sKernelModules,
+			},
 		},
 		{
-			Name:        "NetworkManager-ovs",
-			Reason:      reason,
-			CheckFunc:   linux.CheckGenericPackage,
-			InstallFunc: linux.InstallNetworkManagerOpenVSwitch,
-		},
-		{
-			Name:        "Kubelet Tools",
-			Reason:      reason,
-			CheckCmd:    []string{"kubeadm", "version", "-o", "short"},
-			InstallFunc: linux.InstallKubelet,
-		},
-		{
-			Name:        "Disable firewalld",
-			Reason:      reason,
-			CheckFunc:   linux.CheckFirewallDisabled,
-			InstallFunc: linux.DisableFirewall,
+			{
+				Name:        "K8s Packages",
+				Reason:      reason,
+				CheckFunc:   linux.CheckK8sPackages,
+				InstallFunc: linux.InstallK8sPackages,
+			},
+			{
+				Name:        "crio",
+				Reason:      reason,
+				CheckCmd:    []string{"systemctl", "is-active", "crio"},
+				InstallFunc: linux.InstallCRIO,
+			},
+			{
+				Name:        "openvswitch",
+				Reason:      reason,
+				CheckCmd:    []string{"ovs-vsctl", "--version"},
+				InstallFunc: linux.InstallSystemdOpenVSwitch,
+			},
+			{
+				Name:        "NetworkManager-ovs",
+				Reason:      reason,
+				CheckFunc:   linux.CheckGenericPackage,
+				InstallFunc: linux.InstallNetworkManagerOpenVSwitch,
+			},
+			{
+				Name:        "Kubelet Tools",
+				Reason:      reason,
+				CheckCmd:    []string{"kubeadm", "version", "-o", "short"},
+				InstallFunc: linux.InstallKubelet,
+			},
+			{
+				Name:        "Disable firewalld",
+				Reason:      reason,
+				CheckFunc:   linux.CheckFirewallDisabled,
+				InstallFunc: linux.DisableFirewall,
+			},
 		},
 	}
-	if err := platform.EnsureDependenciesWithExecutor(cmdExec, deps, m.config); err != nil {
+	if m.config.ForceK8sInstall {
+		var deps []platform.Dependency
+		for _, group := range groups {
+			deps = append(deps, group...)
+		}
+		if err := platform.ReinstallDependenciesWithExecutor(cmdExec, deps, m.config); err != nil {
+			return fmt.Errorf("failed to ensure dependencies: %w", err)
+		}
+	} else if m.nodeAlreadyInstalled(cmdExec) {
+		log.Info("✓ Kubernetes packages and services already set up on %s, skipping dependency checks", machineName)
+	} else if err := platform.EnsureDependencyGroupsWithExecutor(cmdExec, groups, m.config); err != nil {
 		return fmt.Errorf("failed to ensure dependencies: %w", err)
 	}
 	if err := linux.EnsureCRIOCNIPluginPaths(cmdExec); err != nil {
@@ -85,23 +122,63 @@ func (m *K8sMachineManager) InstallKubernetes(cmdExec platform.CommandExecutor,
 	return nil
 }
 
+// nodeAlreadyInstalled reports whether a previous run already completed every
+// dependency step on the machine. Any probe failure just means the regular
+// per-dependency path runs.
+func (m *K8sMachineManager) nodeAlreadyInstalled(cmdExec platform.CommandExecutor) bool {
+	distro, err := cmdExec.GetDistro()
+	if err != nil {
+		return false
+	}
+	if err := linux.CheckK8sNodeInstalled(cmdExec, distro); err != nil {
+		log.Debug("Running Kubernetes dependency steps on %s: %v", cmdExec.String(), err)
+		return false
+	}
+	return true
+}
+
 // EnsureOVNBridges creates the given OVS bridges and restarts openvswitch so
 // that ovs-vswitchd creates the kernel datapaths and management sockets.
 // Without the restart, bridges can exist in the DB but ovs-vswitchd may not
 // have created the kernel datapath, causing "ovs-ofctl: <bridge> is not a
 // bridge or a socket".
+//
+// Bridges that already exist with their management socket are left alone,
+// and openvswitch is only restarted when a bridge had to be (re)created, so
+// rerunning setup on a healthy node costs one round trip and does not bounce
+// OVS under a running cluster.
 func (m *K8sMachineManager) EnsureOVNBridges(cmdExec platform.CommandExecutor, bridges ...string) error {
-	for _, br := range bridges {
-		if err := cmdExec.RunCmd(log.LevelDebug, "sudo", "ovs-vsctl", "--may-exist", "add-br", br); err != nil {
-			return fmt.Errorf("failed to create %s: %w", br, err)
-		}
-	}
-	if err := cmdExec.RunCmd(log.LevelDebug, "sudo", "systemctl", "restart", "openvswitch"); err != nil {
-		return fmt.Errorf("failed to restart openvswitch (needed so bridge datapaths are created): %w", err)
+	stdout, stderr, err := cmdExec.ExecuteWithTimeout(ensureOVNBridgesScript(bridges), 2*time.Minute)
+	if err != nil {
+		return fmt.Errorf("failed to ensure OVS bridges %s (restart is needed so bridge datapaths are created): %w, stdout: %s, stderr: %s",
+			strings.Join(bridges, ", "), err, stdout, stderr)
 	}
 	return nil
 }
 
+// ensureOVNBridgesScript renders the script used by EnsureOVNBridges.
+func ensureOVNBridgesScript(bridges []string) string {
+	quoted := make([]string, len(bridges))
+	for i, br := range bridges {
+		quoted[i] = platform.ShQuote(br)
+	}
+
+	sb := strings.Builder{}
+	sb.WriteString("set -e\n")
+	sb.WriteString("restart=0\n")
+	fmt.Fprintf(&sb, "for br in %s; do\n", strings.Join(quoted, " "))
+	sb.WriteString("  if sudo ovs-vsctl br-exists \"$br\" && sudo test -S \"/var/run/openvswitch/$br.mgmt\"; then\n")
+	sb.WriteString("    continue\n")
+	sb.WriteString("  fi\n")
+	sb.WriteString("  sudo ovs-vsctl --may-exist add-br \"$br\"\n")
+	sb.WriteString("  restart=1\n")
+	sb.WriteString("done\n")
+	sb.WriteString("if [ \"$restart\" = 1 ]; then\n")
+	sb.WriteString("  sudo systemctl restart openvswitch\n")
+	sb.WriteString("fi\n")
+	return sb.String()
+}
+
 // EnsureOVNBrInt creates br-int and restarts openvswitch.
 // Convenience wrapper around EnsureOVNBridges for non-DPU nodes.
 func (m *K8sMachineManager) EnsureOVNBrInt(cmdExec platform.CommandExecutor) error {
@@ -111,16 +188,13 @@ func (m *K8sMachineManager) EnsureOVNBrInt(cmdExec platform.CommandExecutor) err
 func (m *K8sMachineManager) SetupOVNBrEx(cmdExec platform.CommandExecutor, mgmtIP string, k8sIP string) error {
 	log.Info("--- Setting up OVN br-ex on %s (%s) ---", mgmtIP, cmdExec.String())
 
-	mgmtInterfaceInfo, err := network.GetInterfaceByIP(cmdExec, mgmtIP)
+	// Both interfaces come out of one 'ip addr' listing.
+	ifaces, err := network.GetInterfacesByIP(cmdExec, mgmtIP, k8sIP)
 	if err != nil {
 		return fmt.Errorf("failed to get interface information: %w", err)
 	}
+	mgmtInterfaceInfo, k8sInterfaceInfo := ifaces[0], ifaces[1]
 	log.Info("Mgmt Interface information: %s", mgmtInterfaceInfo.String())
-
-	k8sInterfaceInfo, err := network.GetInterfaceByIP(cmdExec, k8sIP)
-	if err != nil {
-		return fmt.Errorf("failed to get interface information: %w", err)
-	}
 	log.Info("K8s Interface information: %s", k8sInterfaceInfo.String())
 
 	sb := strings.Builder{}
@@ -146,33 +220,27 @@ func (m *K8sMachineManager) SetupOVNBrEx(cmdExec platform.CommandExecutor, mgmtI
 	sb.WriteString("nmcli conn mod $BRIDGE_NAME connection.autoconnect yes\n")
 	sb.WriteString("nmcli conn mod ovs-if-$IF2 connection.autoconnect yes\n")
 	sb.WriteString("nmcli conn mod ovs-port-$IF2 connection.autoconnect yes\n")
-	sb.WriteString("nmcli conn mod ovs-if-$BRIDGE_NAME connection.autoconnect yes\n")
 	sb.WriteString("nmcli conn mod ovs-port-$BRIDGE_NAME connection.autoconnect yes\n")
 
-	// Set the br-ex interface to use DHCP
-	sb.WriteString("nmcli conn mod ovs-if-$BRIDGE_NAME ipv4.method auto\n")
-	sb.WriteString("nmcli conn mod ovs-if-$BRIDGE_NAME ipv4.route-metric 50\n")
-
-	// Set the br-ex interface to be the default route
-	sb.WriteString("nmcli conn mod ovs-if-$BRIDGE_NAME ipv4.never-default no\n")
-
-	// Set the MAC address of the br-ex interface to the MAC address of the IF2 interface
-	// to get the same DHCP lease on the br-ex interface as the IF2 interface
-	sb.WriteString("nmcli conn mod ovs-if-$BRIDGE_NAME 802-3-ethernet.cloned-mac-address $IF2_MAC\n")
+	// Configure the br-ex interface with a single nmcli call:
+	// - autoconnect and DHCP
+	// - be the default route
+	// - take the MAC address of the IF2 interface to get the same DHCP lease
+	//   on the br-ex interface as the IF2 interface
+	sb.WriteString("nmcli conn mod ovs-if-$BRIDGE_NAME connection.autoconnect yes ipv4.method auto ipv4.route-metric 50 " +
+		"ipv4.never-default no 802-3-ethernet.cloned-mac-address $IF2_MAC\n")
 
 	// Make sure the MGMT interface is not the default route (only if IF1_CONN is a valid NM connection)
 	sb.WriteString("if [ -n \"$IF1_CONN_EXISTS\" ]; then\n")
-	sb.WriteString("  nmcli conn mod \"$IF1_CONN\" ipv4.never-default yes\n")
-	sb.WriteString("  nmcli conn mod \"$IF1_CONN\" ipv4.ignore-auto-dns yes\n")
+	sb.WriteString("  nmcli conn mod \"$IF1_CONN\" ipv4.never-default yes ipv4.ignore-auto-dns yes\n")
 	sb.WriteString("  nmcli conn up \"$IF1_CONN\"\n")
 	sb.WriteString("fi\n")
 
-	// Activate the OVS connections immediately (order matters: bridge first, then ports)
-	sb.WriteString("nmcli conn up $BRIDGE_NAME\n")
+	// Activate the OVS connections immediately. Bringing up a port activates
+	// its controllers first, so activating the two interfaces also brings up
+	// their ovs-port connections and the bridge.
 	sb.WriteString("nmcli conn up ovs-if-$IF2\n")
-	sb.WriteString("nmcli conn up ovs-port-$IF2\n")
 	sb.WriteString("nmcli conn up ovs-if-$BRIDGE_NAME\n")
-	sb.WriteString("nmcli conn up ovs-port-$BRIDGE_NAME\n")
 
 	// Known issue for br-int bridge (not properly created by OVN)
 	sb.WriteString("ovs-vsctl add-br br-int\n")
@@ -188,8 +256,12 @@ func (m *K8sMachineManager) SetupOVNBrEx(cmdExec platform.CommandExecutor, mgmtI
 }
 
 // PrintOVNBrExStatus prints the status of the OVN br-ex bridge
-// Does not return an error, just prints the status.
+// Does not return an error, just prints the status. Everything it gathers is
+// logged at debug level, so it returns without running anything otherwise.
 func (m *K8sMachineManager) PrintOVNBrExStatus(cmdExec platform.CommandExecutor) {
+	if log.GetLevel() < log.LevelDebug {
+		return
+	}
 	log.Debug("\n========== OVN/OVS Status on %s ==========", cmdExec)
 	log.Debug("--- OVS Bridges ---")
 	stdout, stderr, err := cmdExec.ExecuteWithTimeout("sudo ovs-vsctl list-br", 30*time.Second)
@@ -265,16 +337,22 @@ func (m *K8sMachineManager) PrintOVNBrExStatus(cmdExec platform.CommandExecutor)
 	log.Debug("==========================================")
 }
 
+const (
+	setupKubectlScript = "mkdir -p /root/.kube\n" +
+		"sudo cp /etc/kubernetes/admin.conf /root/.kube/config\n" +
+		"sudo chown root:root /root/.kube/config\n"
+	controlPlaneReadyScript = "KUBECTL='sudo kubectl --kubeconfig /etc/kubernetes/admin.conf'\n" +
+		"$KUBECTL wait --for=condition=Ready node/$(hostname) --timeout=5m\n" +
+		"$KUBECTL wait --for=condition=Ready pod -n kube-system -l component=kube-controller-manager --timeout=5m\n"
+	workerJoinCommandScript = "sudo kubeadm token create --print-join-command\n"
+	certificateKeyScript    = "sudo kubeadm init phase upload-certs --upload-certs 2>/dev/null | tail -1\n"
+	kubeconfigScript        = "sudo cat /etc/kubernetes/admin.conf"
+)
+
 func (m *K8sMachineManager) SetupKubectlForRootUser(cmdExec platform.CommandExecutor, machineName string) error {
 	log.Info("Setting up kubectl on %s (%s)...", machineName, cmdExec.String())
 
-	sb := strings.Builder{}
-	sb.WriteString("set -e\n")
-	sb.WriteString("mkdir -p /root/.kube\n")
-	sb.WriteString("sudo cp /etc/kubernetes/admin.conf /root/.kube/config\n")
-	sb.WriteString("sudo chown root:root /root/.kube/config\n")
-
-	stdout, stderr, err := cmdExec.ExecuteWithTimeout(sb.String(), 1*time.Minute)
+	stdout, stderr, err := cmdExec.ExecuteWithTimeout("set -e\n"+setupKubectlScript, 1*time.Minute)
 	if err != nil {
 		return fmt.Errorf("failed to setup kubectl: %w, stdout: %s, stderr: %s", err, stdout, stderr)
 	}
@@ -284,13 +362,7 @@ func (m *K8sMachineManager) SetupKubectlForRootUser(cmdExec platform.CommandExec
 // WaitForControlPlaneReady waits until bootstrap-critical control plane components
 // are ready enough for additional nodes to join (CSR approval/signing path available).
 func (m *K8sMachineManager) WaitForControlPlaneReady(cmdExec platform.CommandExecutor) error {
-	sb := strings.Builder{}
-	sb.WriteString("set -e\n")
-	sb.WriteString("KUBECTL='sudo kubectl --kubeconfig /etc/kubernetes/admin.conf'\n")
-	sb.WriteString("$KUBECTL wait --for=condition=Ready node/$(hostname) --timeout=5m\n")
-	sb.WriteString("$KUBECTL wait --for=condition=Ready pod -n kube-system -l component=kube-controller-manager --timeout=5m\n")
-
-	stdout, stderr, err := cmdExec.ExecuteWithTimeout(sb.String(), 6*time.Minute)
+	stdout, stderr, err := cmdExec.ExecuteWithTimeout("set -e\n"+controlPlaneReadyScript, 6*time.Minute)
 	if err != nil {
 		return fmt.Errorf("failed waiting for control plane readiness: %w, stdout: %s, stderr: %s", err, stdout, stderr)
 	}
@@ -300,11 +372,7 @@ func (m *K8sMachineManager) WaitForControlPlaneReady(cmdExec platform.CommandExe
 
 // ExtractWorkerJoinCommand extracts the worker join command from the machine
 func (m *K8sMachineManager) ExtractWorkerJoinCommand(cmdExec platform.CommandExecutor, machineName string) (string, error) {
-	sb := strings.Builder{}
-	sb.WriteString("set -e\n")
-	sb.WriteString("sudo kubeadm token create --print-join-command\n")
-
-	stdout, stderr, err := cmdExec.ExecuteWithTimeout(sb.String(), 1*time.Minute)
+	stdout, stderr, err := cmdExec.ExecuteWithTimeout("set -e\n"+workerJoinCommandScript, 1*time.Minute)
 	if err != nil {
 		return "", fmt.Errorf("failed to extract join command: %w, stderr: %s", err, stderr)
 	}
@@ -314,12 +382,7 @@ func (m *K8sMachineManager) ExtractWorkerJoinCommand(cmdExec platform.CommandExe
 
 // GenerateCertificateKey generates a new certificate key for control plane joins
 func (m *K8sMachineManager) GenerateCertificateKey(cmdExec platform.CommandExecutor, machineName string) (string, error) {
-	// Generate a new certificate key for control plane joins
-	sb := strings.Builder{}
-	sb.WriteString("set -e\n")
-	sb.WriteString("sudo kubeadm init phase upload-certs --upload-certs 2>/dev/null | tail -1\n")
-
-	stdout, stderr, err := cmdExec.ExecuteWithTimeout(sb.String(), 1*time.Minute)
+	stdout, stderr, err := cmdExec.ExecuteWithTimeout("set -e\n"+certificateKeyScript, 1*time.Minute)
 	if err != nil {
 		return "", fmt.Errorf("failed to get certificate key: %w, stderr: %s", err, stderr)
 	}
@@ -374,33 +437,24 @@ func (m *K8sMachineManager) InitializeControlPlane(cmdExec platform.CommandExecu
 
 	log.Debug("Control plane initialization output: %s", stdout)
 
-	if err := m.SetupKubectlForRootUser(cmdExec, machineName); err != nil {
-		return nil, fmt.Errorf("failed to setup kubectl for root user: %w", err)
-	}
-
-	if err := m.WaitForControlPlaneReady(cmdExec); err != nil {
-		return nil, fmt.Errorf("control plane is not ready for node joins: %w", err)
-	}
-
-	workerJoinCommand, err := m.ExtractWorkerJoinCommand(cmdExec, machineName)
+	// Everything after kubeadm init runs as one remote script; each step used
+	// to be its own round trip.
+	log.Info("Setting up kubectl and collecting join data on %s (%s)...", machineName, cmdExec.String())
+	outputs, err := platform.RunSteps(cmdExec, []platform.ScriptStep{
+		{Name: "setup kubectl", Script: setupKubectlScript},
+		{Name: "wait for control plane", Script: controlPlaneReadyScript},
+		{Name: "create join token", Script: workerJoinCommandScript},
+		{Name: "upload certificates", Script: certificateKeyScript},
+		{Name: "read kubeconfig", Script: kubeconfigScript},
+	}, 10*time.Minute)
 	if err != nil {
-		return nil, fmt.Errorf("failed to extract worker join command: %w", err)
-	}
-
-	certificateKey, err := m.GenerateCertificateKey(cmdExec, machineName)
-	if err != nil {
-		return nil, fmt.Errorf("failed to generate certificate key: %w", err)
+		return nil, fmt.Errorf("control plane post-init failed: %w", err)
 	}
+	workerJoinCommand, certificateKey, kubeconfig := outputs[2], outputs[3], outputs[4]
 
 	// Build the control plane join command
 	controlPlaneJoinCommand := fmt.Sprintf("%s --control-plane --certificate-key %s", workerJoinCommand, certificateKey)
 
-	// Get the kubeconfig for API access
-	kubeconfig, err := m.getKubeconfigContent(cmdExec)
-	if err != nil {
-		return nil, fmt.Errorf("failed to get kubeconfig: %w", err)
-	}
-
 	// Build the API server endpoint
 	apiServerEndpoint := fmt.Sprintf("https://%s:6443", k8sIP)
 	if strings.TrimSpace(controlPlaneEndpoint) != "" {
@@ -463,9 +517,7 @@ func (m *K8sMachineManager) JoinWorker(cmdExec platform.CommandExecutor, machine
 
 // getKubeconfigContent retrieves the kubeconfig content from a control plane node
 func (m *K8sMachineManager) getKubeconfigContent(cmdExec platform.CommandExecutor) (string, error) {
-	script := "sudo cat /etc/kubernetes/admin.conf"
-
-	stdout, stderr, err := cmdExec.ExecuteWithTimeout(script, 30*time.Second)
+	stdout, stderr, err := cmdExec.ExecuteWithTimeout(kubeconfigScript, 30*time.Second)
 	if err != nil {
 		return "", fmt.Errorf("failed to get kubeconfig: %w, stderr: %s", err, stderr)
 	}
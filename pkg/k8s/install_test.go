@@ -0,0 +1,21 @@
+package k8s
+
+import (
+	"strings"
+	"testing"
+)
+
+// Existing bridges with a management socket must be skipped, and openvswitch restarted only when one was created.
+func TestEnsureOVNBridgesScript(t *testing.T) {
+	script := ensureOVNBridgesScript([]string{"br-int", "breth0-0"})
+	for _, want := range []string{
+		"for br in 'br-int' 'breth0-0'; do",
+		"ovs-vsctl br-exists \"$br\" && sudo test -S \"/var/run/openvswitch/$br.mgmt\"",
+		"--may-exist add-br \"$br\"\n  restart=1",
+		"if [ \"$restart\" = 1 ]; then\n  sudo systemctl restart openvswitch",
+	} {
+		if !strings.Contains(script, want) {
+			t.Fatalf("script missing %q:\n%s", want, script)
+		}
+	}
+}
@@ -120,13 +120,35 @@ func EnsureKubeletK8sNodeIP(cmdExec platform.CommandExecutor, k8sNodeIP string)
 	return nil
 }
 
-// WaitAllNodesReady runs kubectl wait against the given cluster admin kubeconfig on the executor.
-func WaitAllNodesReady(cmdExec platform.CommandExecutor, timeout time.Duration) error {
-	script := "sudo kubectl --kubeconfig /etc/kubernetes/admin.conf wait --for=condition=Ready nodes --all --timeout=" +
-		fmt.Sprintf("%ds", int(timeout.Round(time.Second).Seconds()))
+// WaitAllNodesReady waits, on the executor, until at least minNodes nodes
+// have registered and every registered node is Ready.
+//
+// "kubectl wait --all" only covers nodes that exist when it starts, so a
+// node whose kubelet has not registered yet right after kubeadm join would
+// be missed; waiting for the count first closes that gap.
+func WaitAllNodesReady(cmdExec platform.CommandExecutor, minNodes int, timeout time.Duration) error {
+	script := waitNodesReadyScript(minNodes, timeout)
 	stdout, stderr, err := cmdExec.ExecuteWithTimeout(script, timeout+30*time.Second)
 	if err != nil {
 		return fmt.Errorf("kubectl wait nodes: %w\nstdout: %s\nstderr: %s", err, strings.TrimSpace(stdout), strings.TrimSpace(stderr))
 	}
 	return nil
 }
+
+// waitNodesReadyScript renders the shell loop behind WaitAllNodesReady. Both
+// phases share one deadline so the whole wait is bounded by timeout.
+func waitNodesReadyScript(minNodes int, timeout time.Duration) string {
+	const kubectl = "sudo kubectl --kubeconfig /etc/kubernetes/admin.conf"
+	secs := int(timeout.Round(time.Second).Seconds())
+	sb := strings.Builder{}
+	sb.WriteString("set -e\n")
+	fmt.Fprintf(&sb, "deadline=$(($(date +%%s) + %d))\n", secs)
+	fmt.Fprintf(&sb, "until [ \"$(%s get nodes --no-headers 2>/dev/null | wc -l)\" -ge %d ]; do\n", kubectl, minNodes)
+	fmt.Fprintf(&sb, "  if [ \"$(date +%%s)\" -ge $deadline ]; then echo \"fewer than %d nodes registered\" >&2; exit 1; fi\n", minNodes)
+	sb.WriteString("  sleep 1\n")
+	sb.WriteString("done\n")
+	sb.WriteString("remaining=$((deadline - $(date +%s)))\n")
+	sb.WriteString("[ $remaining -gt 0 ] || remaining=1\n")
+	fmt.Fprintf(&sb, "%s wait --for=condition=Ready nodes --all --timeout=${remaining}s\n", kubectl)
+	return sb.String()
+}
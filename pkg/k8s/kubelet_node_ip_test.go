@@ -3,6 +3,7 @@ package k8s
 import (
 	"strings"
 	"testing"
+	"time"
 )
 
 // This replaces an existing --node-ip while keeping other flags; this output must match exactly.
@@ -190,3 +191,20 @@ func TestMergeNodeIPIntoKubeadmArgsLineErrors(t *testing.T) {
 		})
 	}
 }
+
+// The node wait must first wait for the expected registrations, then for readiness, within one deadline.
+func TestWaitNodesReadyScript(t *testing.T) {
+	script := waitNodesReadyScript(3, 6*time.Minute)
+	for _, want := range []string{
+		"deadline=$(($(date +%s) + 360))",
+		"get nodes --no-headers 2>/dev/null | wc -l)\" -ge 3 ]",
+		"wait --for=condition=Ready nodes --all --timeout=${remaining}s",
+	} {
+		if !strings.Contains(script, want) {
+			t.Fatalf("script missing %q:\n%s", want, script)
+		}
+	}
+	if strings.Index(script, "get nodes") > strings.Index(script, "wait --for") {
+		t.Fatalf("registration check must come before kubectl wait:\n%s", script)
+	}
+}
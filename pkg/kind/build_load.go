@@ -36,14 +36,18 @@ func (m *KindManager) BuildAndLoadImagesFromRegistryConfig(cmdExec platform.Comm
 			if err != nil {
 				return fmt.Errorf("prepare registry container %q image for Kind: %w", container.Name, err)
 			}
+			var clusters []string
 			for _, cl := range cfg.Kubernetes.Clusters {
-				if !cfg.ClusterNeedsOVNKubernetesImage(cl.Name) {
-					continue
+				if cfg.ClusterNeedsOVNKubernetesImage(cl.Name) {
+					clusters = append(clusters, cl.Name)
 				}
-				if err := m.KindLoadImage(cmdExec, cl.Name, kindRef); err != nil {
-					return fmt.Errorf("kind load %q into cluster %q: %w", kindRef, cl.Name, err)
-				}
-				log.Info("✓ OVN-Kubernetes image loaded into cluster %s", cl.Name)
+			}
+			// Export the image once and load the same archive into each cluster.
+			if err := m.KindLoadImageIntoClusters(cmdExec, clusters, kindRef); err != nil {
+				return fmt.Errorf("kind load %q: %w", kindRef, err)
+			}
+			for _, cl := range clusters {
+				log.Info("✓ OVN-Kubernetes image loaded into cluster %s", cl)
 			}
 		default:
 			return fmt.Errorf("unsupported CNI type for registry container build: %q", container.CNI)
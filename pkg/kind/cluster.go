@@ -440,11 +440,23 @@ func (m *KindManager) kindExperimentalProviderEnv() []string {
 // store (Docker 27+ default; see kubernetes-sigs/kind#3795) or when images were
 // built with Podman while Kind is configured for the podman provider.
 func (m *KindManager) KindLoadImage(cmdExec platform.CommandExecutor, clusterName, imageName string) error {
-	if !m.ClusterExists(clusterName) {
-		return fmt.Errorf("cluster %s does not exist", clusterName)
+	return m.KindLoadImageIntoClusters(cmdExec, []string{clusterName}, imageName)
+}
+
+// KindLoadImageIntoClusters loads a container image into several Kind clusters
+// like KindLoadImage, but saves the image archive only once and loads that same
+// file into every cluster instead of re-exporting the image per cluster.
+func (m *KindManager) KindLoadImageIntoClusters(cmdExec platform.CommandExecutor, clusterNames []string, imageName string) error {
+	if len(clusterNames) == 0 {
+		return nil
+	}
+	for _, clusterName := range clusterNames {
+		if !m.ClusterExists(clusterName) {
+			return fmt.Errorf("cluster %s does not exist", clusterName)
+		}
 	}
 
-	log.Info("Loading image %s into cluster %s (via %s save + kind load image-archive)...", imageName, clusterName, m.containerBin)
+	log.Info("Loading image %s into cluster(s) %s (via %s save + kind load image-archive)...", imageName, strings.Join(clusterNames, ", "), m.containerBin)
 
 	tmpFile, err := os.CreateTemp("", "dpu-sim-kind-image-*.tar")
 	if err != nil {
@@ -461,8 +473,10 @@ func (m *KindManager) KindLoadImage(cmdExec platform.CommandExecutor, clusterNam
 		return fmt.Errorf("failed to save image %q with %s: %w", imageName, m.containerBin, err)
 	}
 
-	if err := cmdExec.RunCmdWithExtraEnv(log.LevelInfo, m.kindExperimentalProviderEnv(), "kind", "load", "image-archive", tmpPath, "--name", clusterName); err != nil {
-		return fmt.Errorf("failed to kind load image archive for %s: %w", imageName, err)
+	for _, clusterName := range clusterNames {
+		if err := cmdExec.RunCmdWithExtraEnv(log.LevelInfo, m.kindExperimentalProviderEnv(), "kind", "load", "image-archive", tmpPath, "--name", clusterName); err != nil {
+			return fmt.Errorf("failed to kind load image archive for %s into cluster %s: %w", imageName, clusterName, err)
+		}
 	}
 
 	log.Info("✓ Loaded image: %s", imageName)
@@ -4,7 +4,6 @@ import (
 	"encoding/json"
 	"fmt"
 	"net"
-	"strings"
 
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/log"
@@ -193,16 +192,22 @@ func (m *KindManager) GetKindSubnetAndAllocatedIPs() (*net.IPNet, []net.IP) {
 // getKindNodeNetworkCIDR reads the IPv4 address and subnet of eth0 inside a
 // container which by default is part of the default Kind network.
 func getKindNodeNetworkCIDR(exec platform.CommandExecutor) (net.IP, *net.IPNet, error) {
-	stdout, _, err := exec.Execute("ip -4 -o addr show eth0 | awk '{print $4}'")
+	iface, err := network.GetInterfaceByName(exec, "eth0")
 	if err != nil {
 		return nil, nil, err
 	}
-	cidr := strings.TrimSpace(stdout)
-	ip, ipNet, err := net.ParseCIDR(cidr)
-	if err != nil {
-		return nil, nil, fmt.Errorf("failed to parse CIDR %q: %w", cidr, err)
+	for _, addr := range iface.Addresses {
+		if addr.Family != "inet" {
+			continue
+		}
+		cidr := fmt.Sprintf("%s/%d", addr.Local, addr.Prefixlen)
+		ip, ipNet, err := net.ParseCIDR(cidr)
+		if err != nil {
+			return nil, nil, fmt.Errorf("failed to parse CIDR %q: %w", cidr, err)
+		}
+		return ip, ipNet, nil
 	}
-	return ip, ipNet, nil
+	return nil, nil, fmt.Errorf("no IPv4 address found on eth0")
 }
 
 // assignGatewayVethIP assigns gwIP to eth0-0 inside the host container and
@@ -13,6 +13,11 @@ import (
 
 // Sets the hostname on the target machine
 func SetHostname(cmdExec platform.CommandExecutor, hostname string) error {
+	if stdout, _, err := cmdExec.Execute("cat /etc/hostname"); err == nil && strings.TrimSpace(stdout) == hostname {
+		log.Debug("✓ Hostname is already %s", hostname)
+		return nil
+	}
+
 	log.Debug("Setting hostname to %s on %s...", hostname, cmdExec.String())
 
 	script := fmt.Sprintf("sudo hostnamectl set-hostname %s", hostname)
@@ -165,14 +170,37 @@ func CheckAarch64UEFIFirmware(cmdExec platform.CommandExecutor, distro *platform
 	return fmt.Errorf("missing aarch64 UEFI firmware files: expected AAVMF/QEMU_EFI code+vars pair")
 }
 
-// Disables swap on the target machine
-func DisableSwap(cmdExec platform.CommandExecutor, distro *platform.Distro, cfg *config.Config, dep *platform.Dependency) error {
+// ConfigurePackageProxy points the machine's package manager at proxy so
+// every node fetches packages through a shared cache. An empty proxy removes
+// any proxy previously set by this function.
+func ConfigurePackageProxy(cmdExec platform.CommandExecutor, distro *platform.Distro, proxy string) error {
 	sb := strings.Builder{}
 	sb.WriteString("set -e\n")
-	sb.WriteString("sudo swapoff -a\n")
-	sb.WriteString("sudo sed -i '/ swap / s/^/#/' /etc/fstab\n")
+	switch distro.PackageManager {
+	case platform.DNF:
+		sb.WriteString("sudo sed -i '/^proxy=/d' /etc/dnf/dnf.conf\n")
+		if proxy != "" {
+			fmt.Fprintf(&sb, "echo %s | sudo tee -a /etc/dnf/dnf.conf >/dev/null\n", platform.ShQuote("proxy="+proxy))
+		}
+	default:
+		return platform.UnsupportedPackageManager(distro)
+	}
 
 	stdout, stderr, err := cmdExec.Execute(sb.String())
+	if err != nil {
+		return fmt.Errorf("failed to configure package proxy: %w, stdout: %s, stderr: %s", err, stdout, stderr)
+	}
+	return nil
+}
+
+// disableSwapScript turns swap off now and comments it out of fstab.
+const disableSwapScript = "set -e\n" +
+	"sudo swapoff -a\n" +
+	"sudo sed -i '/ swap / s/^/#/' /etc/fstab\n"
+
+// Disables swap on the target machine
+func DisableSwap(cmdExec platform.CommandExecutor, distro *platform.Distro, cfg *config.Config, dep *platform.Dependency) error {
+	stdout, stderr, err := cmdExec.Execute(disableSwapScript)
 	if err != nil {
 		return fmt.Errorf("failed to disable swap: %w, stdout: %s, stderr: %s", err, stdout, stderr)
 	}
@@ -191,76 +219,100 @@ func CheckSwapDisabled(cmdExec platform.CommandExecutor, distro *platform.Distro
 	return nil
 }
 
+// k8sKernelModules are the kernel modules Kubernetes networking needs loaded.
+var k8sKernelModules = []string{"overlay", "br_netfilter"}
+
+// k8sKernelModulesScript writes the module and sysctl files and applies
+// them. It depends only on package-level values, so it is rendered once
+// instead of on every machine.
+var k8sKernelModulesScript = func() string {
+	sb := strings.Builder{}
+	sb.WriteString("set -e\n")
+	// Load kernel modules on boot
+	sb.WriteString("sudo tee /etc/modules-load.d/k8s.conf >/dev/null <<'EOF'\n")
+	for _, mod := range k8sKernelModules {
+		fmt.Fprintf(&sb, "%s\n", mod)
+	}
+	sb.WriteString("EOF\n")
+	// Load kernel modules now; -a lets one modprobe load them all
+	fmt.Fprintf(&sb, "sudo modprobe -a %s\n", strings.Join(k8sKernelModules, " "))
+	// Enable IPv4 packets to be routed between interfaces
+	sb.WriteString("sudo tee /etc/sysctl.d/k8s.conf >/dev/null <<'EOF'\n")
+	sb.WriteString("net.bridge.bridge-nf-call-iptables = 1\n")
+	sb.WriteString("net.bridge.bridge-nf-call-ip6tables = 1\n")
+	sb.WriteString("net.ipv4.ip_forward = 1\n")
+	sb.WriteString("EOF\n")
+	// Apply sysctl params without reboot. Only load the file written above
+	// rather than re-reading every sysctl.d directory with --system.
+	sb.WriteString("sudo sysctl -q -p /etc/sysctl.d/k8s.conf\n")
+	return sb.String()
+}()
+
 // Configure kernel modules on the target machine for Kubernetes
+//
+// The module and sysctl files, modprobe and sysctl reload are sent as a
+// single script so the step costs one remote round trip instead of five.
 func ConfigureK8sKernelModules(cmdExec platform.CommandExecutor, distro *platform.Distro, cfg *config.Config, dep *platform.Dependency) error {
-	// Load kernel modules
-	loadModulesContent := strings.Builder{}
-	loadModulesContent.WriteString("overlay\n")
-	loadModulesContent.WriteString("br_netfilter\n")
-	loadModulesContent.WriteString("EOF\n")
-	if err := cmdExec.WriteFile("/etc/modules-load.d/k8s.conf", []byte(loadModulesContent.String()), 0o644); err != nil {
-		return fmt.Errorf("failed to write modules load file: %w", err)
-	}
-	// Load kernel modules
-	if err := cmdExec.RunCmd(log.LevelDebug, "sudo", "modprobe", "overlay"); err != nil {
-		return fmt.Errorf("failed to modprobe overlay: %w", err)
-	}
-	if err := cmdExec.RunCmd(log.LevelDebug, "sudo", "modprobe", "br_netfilter"); err != nil {
-		return fmt.Errorf("failed to modprobe br_netfilter: %w", err)
-	}
-	// Enable IPv4 packets to be routed between interfaces
-	sysctlContent := strings.Builder{}
-	sysctlContent.WriteString("net.bridge.bridge-nf-call-iptables = 1\n")
-	sysctlContent.WriteString("net.bridge.bridge-nf-call-ip6tables = 1\n")
-	sysctlContent.WriteString("net.ipv4.ip_forward = 1\n")
-	if err := cmdExec.WriteFile("/etc/sysctl.d/k8s.conf", []byte(sysctlContent.String()), 0o644); err != nil {
-		return fmt.Errorf("failed to write sysctl file: %w", err)
-	}
-	// Apply sysctl params without reboot
-	if err := cmdExec.RunCmd(log.LevelDebug, "sudo", "sysctl", "--system"); err != nil {
-		return fmt.Errorf("failed to apply sysctl params: %w", err)
+	stdout, stderr, err := cmdExec.ExecuteWithTimeout(k8sKernelModulesScript, 2*time.Minute)
+	if err != nil {
+		return fmt.Errorf("failed to configure kernel modules: %w, stdout: %s, stderr: %s", err, stdout, stderr)
 	}
 	return nil
 }
 
 // Check if Kubernetes specific kernel modules are loaded on the target machine
 func CheckK8sKernelModules(cmdExec platform.CommandExecutor, distro *platform.Distro, cfg *config.Config, dep *platform.Dependency) error {
-	stdout, stderr, err := cmdExec.Execute("lsmod | grep overlay")
+	stdout, stderr, err := cmdExec.Execute("lsmod")
 	if err != nil {
-		return fmt.Errorf("failed to check overlay module: %w, stderr: %s", err, stderr)
-	}
-	if strings.TrimSpace(stdout) == "" {
-		return fmt.Errorf("overlay kernel module is not loaded")
+		return fmt.Errorf("failed to list kernel modules: %w, stderr: %s", err, stderr)
 	}
-
-	stdout, stderr, err = cmdExec.Execute("lsmod | grep br_netfilter")
-	if err != nil {
-		return fmt.Errorf("failed to check br_netfilter module: %w, stderr: %s", err, stderr)
+	loaded := make(map[string]bool)
+	for _, line := range strings.Split(stdout, "\n") {
+		if fields := strings.Fields(line); len(fields) > 0 {
+			loaded[fields[0]] = true
+		}
 	}
-	if strings.TrimSpace(stdout) == "" {
-		return fmt.Errorf("br_netfilter kernel module is not loaded")
+	for _, mod := range k8sKernelModules {
+		if !loaded[mod] {
+			return fmt.Errorf("%s kernel module is not loaded", mod)
+		}
 	}
 	return nil
 }
 
+// pkgsK8sRepoFile renders a dnf .repo file for a pkgs.k8s.io project pinned
+// to the stable stream of k8sVersion. project is the path prefix before
+// ":/stable:", e.g. "core" or "addons:/cri-o". exclude is optional. Unlike
+// k8sKernelModulesScript it depends on the configured version, so it is
+// rendered per call rather than once at init.
+func pkgsK8sRepoFile(id, name, project, k8sVersion, exclude string) string {
+	baseURL := fmt.Sprintf("https://pkgs.k8s.io/%s:/stable:/v%s/rpm/", project, k8sVersion)
+	sb := strings.Builder{}
+	fmt.Fprintf(&sb, "[%s]\n", id)
+	fmt.Fprintf(&sb, "name=%s\n", name)
+	fmt.Fprintf(&sb, "baseurl=%s\n", baseURL)
+	sb.WriteString("enabled=1\n")
+	sb.WriteString("gpgcheck=1\n")
+	fmt.Fprintf(&sb, "gpgkey=%srepodata/repomd.xml.key\n", baseURL)
+	if exclude != "" {
+		fmt.Fprintf(&sb, "exclude=%s\n", exclude)
+	}
+	return sb.String()
+}
+
 // Install CRI-O on the target machine
 func InstallCRIO(cmdExec platform.CommandExecutor, distro *platform.Distro, cfg *config.Config, dep *platform.Dependency) error {
-	k8sVersion := cfg.Kubernetes.Version
 	if distro.PackageManager == platform.DNF {
-		// Add CRI-O repository
-		repoContent := strings.Builder{}
-		repoContent.WriteString("[cri-o]\n")
-		repoContent.WriteString("name=CRI-O\n")
-		repoContent.WriteString(fmt.Sprintf("baseurl=https://pkgs.k8s.io/addons:/cri-o:/stable:/v%s/rpm/\n", k8sVersion))
-		repoContent.WriteString("enabled=1\n")
-		repoContent.WriteString("gpgcheck=1\n")
-		repoContent.WriteString(fmt.Sprintf("gpgkey=https://pkgs.k8s.io/addons:/cri-o:/stable:/v%s/rpm/repodata/repomd.xml.key\n", k8sVersion))
-		if err := cmdExec.WriteFile("/etc/yum.repos.d/cri-o.repo", []byte(repoContent.String()), 0o644); err != nil {
-			return fmt.Errorf("failed to write cri-o repo file: %w", err)
-		}
-		// Install CRI-O, iproute-tc, and containernetworking-plugins (standard CNI plugins like bridge, host-local, etc.)
-		if err := cmdExec.RunCmd(log.LevelDebug, "sudo", platform.DNF, "install", "-y", "cri-o", "iproute-tc", "containernetworking-plugins"); err != nil {
-			return fmt.Errorf("failed to install CRI-O: %w", err)
+		// After InstallK8sPackages the packages and their repo file are
+		// already in place, so only a fresh host writes the repo.
+		if !dnfPackagesInstalled(cmdExec, crioPackages...) {
+			if err := writeCRIORepo(cmdExec, cfg.Kubernetes.Version); err != nil {
+				return err
+			}
+			// Install CRI-O, iproute-tc, and containernetworking-plugins (standard CNI plugins like bridge, host-local, etc.)
+			if err := dnfInstall(cmdExec, nil, crioPackages...); err != nil {
+				return fmt.Errorf("failed to install CRI-O: %w", err)
+			}
 		}
 		// On Fedora, CNI plugins are installed to /usr/libexec/cni/. Mirror them into
 		// /var/lib/cni/bin and (when writable) into /opt/cni/bin with real copies so
@@ -275,11 +327,8 @@ func InstallCRIO(cmdExec platform.CommandExecutor, distro *platform.Distro, cfg
 		return err
 	}
 
-	if err := cmdExec.RunCmd(log.LevelDebug, "sudo", "systemctl", "enable", "crio"); err != nil {
-		return fmt.Errorf("failed to enable CRI-O: %w", err)
-	}
-	if err := cmdExec.RunCmd(log.LevelDebug, "sudo", "systemctl", "start", "crio"); err != nil {
-		return fmt.Errorf("failed to start CRI-O: %w", err)
+	if err := cmdExec.RunCmd(log.LevelDebug, "sudo", "systemctl", "enable", "--now", "crio"); err != nil {
+		return fmt.Errorf("failed to enable and start CRI-O: %w", err)
 	}
 	return nil
 }
@@ -401,14 +450,19 @@ func enableRHELOVSRepos(cmdExec platform.CommandExecutor, distro *platform.Distr
 func installOpenVSwitchPackages(cmdExec platform.CommandExecutor, distro *platform.Distro, cfg *config.Config, _ *platform.Dependency, includeNetworkManagerOvs bool) error {
 	switch distro.PackageManager {
 	case platform.DNF:
+		pkgs := []string{"openvswitch"}
+		if includeNetworkManagerOvs {
+			pkgs = append(pkgs, "NetworkManager-ovs")
+		}
+		// On a rerun the packages are already in place; skip the
+		// subscription-manager calls too, each of which contacts the CDN.
+		if dnfPackagesInstalled(cmdExec, pkgs...) {
+			return nil
+		}
 		if err := enableRHELOVSRepos(cmdExec, distro); err != nil {
 			return fmt.Errorf("failed to enable RHEL OVS repos: %w", err)
 		}
-		dnfArgs := []string{platform.DNF, "install", "-y", "openvswitch"}
-		if includeNetworkManagerOvs {
-			dnfArgs = append(dnfArgs, "NetworkManager-ovs")
-		}
-		if err := cmdExec.RunCmd(log.LevelDebug, "sudo", dnfArgs...); err != nil {
+		if err := dnfInstall(cmdExec, nil, pkgs...); err != nil {
 			return fmt.Errorf("failed to install openvswitch: %w", err)
 		}
 	case platform.APT:
@@ -474,18 +528,21 @@ func InstallSystemdOpenVSwitch(cmdExec platform.CommandExecutor, distro *platfor
 		return nil
 	}
 	// RHEL/Fedora: manually enable the service, restart NetworkManager, then restart OVS.
-	if err := cmdExec.RunCmd(log.LevelDebug, "sudo", "systemctl", "enable", "openvswitch"); err != nil {
-		return fmt.Errorf("failed to enable openvswitch: %w", err)
-	}
-	if err := cmdExec.RunCmd(log.LevelDebug, "sudo", "systemctl", "restart", "NetworkManager"); err != nil {
-		return fmt.Errorf("failed to restart NetworkManager: %w", err)
-	}
-	if err := reviveOpenVSwitchSystemd(cmdExec); err != nil {
+	if _, err := platform.RunSteps(cmdExec, openVSwitchSystemdSteps, 5*time.Minute); err != nil {
 		return fmt.Errorf("failed to start openvswitch: %w", err)
 	}
 	return nil
 }
 
+// openVSwitchSystemdSteps enables openvswitch, restarts NetworkManager and
+// then revives openvswitch the same way reviveOpenVSwitchSystemd does, as one
+// remote script instead of a command each.
+var openVSwitchSystemdSteps = []platform.ScriptStep{
+	{Name: "enable openvswitch", Script: "sudo systemctl enable openvswitch"},
+	{Name: "restart NetworkManager", Script: "sudo systemctl restart NetworkManager"},
+	{Name: "restart openvswitch", Script: "sudo systemctl reset-failed ovsdb-server ovs-vswitchd openvswitch 2>/dev/null || true\nsudo systemctl restart openvswitch"},
+}
+
 // InstallOpenVSwitchDirect installs OVS and starts it directly with ovs-ctl.
 // Use this for environments without full systemd init (e.g. Kind containers).
 func InstallOpenVSwitchWithoutSystemd(cmdExec platform.CommandExecutor, distro *platform.Distro, cfg *config.Config, dep *platform.Dependency) error {
@@ -538,24 +595,16 @@ func InstallNetworkManagerOpenVSwitch(cmdExec platform.CommandExecutor, distro *
 // From https://kubernetes.io/docs/setup/production-environment/tools/kubeadm/install-kubeadm/#installing-kubeadm-kubelet-and-kubectl
 // And https://kubernetes.io/docs/setup/production-environment/container-runtimes/#installing-cri-o
 func InstallKubelet(cmdExec platform.CommandExecutor, distro *platform.Distro, cfg *config.Config, dep *platform.Dependency) error {
-	k8sVersion := cfg.Kubernetes.Version
 	switch distro.PackageManager {
 	case platform.DNF:
-		// Add Kubernetes repository
-		repoContent := strings.Builder{}
-		repoContent.WriteString("[kubernetes]\n")
-		repoContent.WriteString("name=Kubernetes\n")
-		repoContent.WriteString(fmt.Sprintf("baseurl=https://pkgs.k8s.io/core:/stable:/v%s/rpm/\n", k8sVersion))
-		repoContent.WriteString("enabled=1\n")
-		repoContent.WriteString("gpgcheck=1\n")
-		repoContent.WriteString(fmt.Sprintf("gpgkey=https://pkgs.k8s.io/core:/stable:/v%s/rpm/repodata/repomd.xml.key\n", k8sVersion))
-		repoContent.WriteString("exclude=kubelet kubeadm kubectl cri-tools kubernetes-cni\n")
-		if err := cmdExec.WriteFile("/etc/yum.repos.d/kubernetes.repo", []byte(repoContent.String()), 0o644); err != nil {
-			return fmt.Errorf("failed to write repo file: %w", err)
-		}
-		// Install kubelet, kubeadm, kubectl
-		if err := cmdExec.RunCmd(log.LevelDebug, "sudo", platform.DNF, "install", "-y", "kubelet", "kubeadm", "kubectl", "--setopt=disable_excludes=kubernetes"); err != nil {
-			return fmt.Errorf("failed to install kubelet, kubeadm, kubectl: %w", err)
+		if !dnfPackagesInstalled(cmdExec, kubeletPackages...) {
+			if err := writeKubernetesRepo(cmdExec, cfg.Kubernetes.Version); err != nil {
+				return err
+			}
+			// Install kubelet, kubeadm, kubectl
+			if err := dnfInstall(cmdExec, kubeletDNFOptions, kubeletPackages...); err != nil {
+				return fmt.Errorf("failed to install kubelet, kubeadm, kubectl: %w", err)
+			}
 		}
 	default:
 		return platform.UnsupportedPackageManager(distro)
@@ -566,22 +615,184 @@ func InstallKubelet(cmdExec platform.CommandExecutor, distro *platform.Distro, c
 	return nil
 }
 
-// Disable firewall on the targetmachine
-func DisableFirewall(cmdExec platform.CommandExecutor, distro *platform.Distro, cfg *config.Config, dep *platform.Dependency) error {
+var (
+	crioPackages    = []string{"cri-o", "iproute-tc", "containernetworking-plugins"}
+	ovsPackages     = []string{"openvswitch", "NetworkManager-ovs"}
+	kubeletPackages = []string{"kubelet", "kubeadm", "kubectl"}
+	// k8sNodePackages is everything InstallK8sPackages puts on a DNF node.
+	k8sNodePackages = func() []string {
+		var pkgs []string
+		pkgs = append(pkgs, crioPackages...)
+		pkgs = append(pkgs, ovsPackages...)
+		return append(pkgs, kubeletPackages...)
+	}()
+	// The kubernetes repo excludes its own packages so routine upgrades
+	// don't move them; installs have to lift that explicitly.
+	kubeletDNFOptions = []string{"--setopt=disable_excludes=kubernetes"}
+)
+
+// dnfParallelDownloads raises dnf's default of 3 concurrent downloads so the
+// RPMs of a large transaction are fetched side by side instead of mostly
+// one after another.
+const dnfParallelDownloads = "--setopt=max_parallel_downloads=10"
+
+// dnfInstallTimeout bounds a single dnf transaction. The batched node
+// install pulls a few hundred MB through a fresh metadata refresh, which can
+// take well past RunCmd's fixed five minutes on a slow mirror.
+const dnfInstallTimeout = 30 * time.Minute
+
+func writeCRIORepo(cmdExec platform.CommandExecutor, k8sVersion string) error {
+	repoContent := pkgsK8sRepoFile("cri-o", "CRI-O", "addons:/cri-o", k8sVersion, "")
+	if err := cmdExec.WriteFile("/etc/yum.repos.d/cri-o.repo", []byte(repoContent), 0o644); err != nil {
+		return fmt.Errorf("failed to write cri-o repo file: %w", err)
+	}
+	return nil
+}
+
+func writeKubernetesRepo(cmdExec platform.CommandExecutor, k8sVersion string) error {
+	repoContent := pkgsK8sRepoFile("kubernetes", "Kubernetes", "core", k8sVersion, "kubelet kubeadm kubectl cri-tools kubernetes-cni")
+	if err := cmdExec.WriteFile("/etc/yum.repos.d/kubernetes.repo", []byte(repoContent), 0o644); err != nil {
+		return fmt.Errorf("failed to write repo file: %w", err)
+	}
+	return nil
+}
+
+// dnfInstallMissing runs "dnf install" for pkgs unless rpm already reports
+// all of them installed, which saves a metadata refresh per step once
+// InstallK8sPackages has pulled everything in.
+func dnfInstallMissing(cmdExec platform.CommandExecutor, opts []string, pkgs ...string) error {
+	if dnfPackagesInstalled(cmdExec, pkgs...) {
+		return nil
+	}
+	return dnfInstall(cmdExec, opts, pkgs...)
+}
+
+// dnfPackagesInstalled reports whether rpm has every one of pkgs installed.
+func dnfPackagesInstalled(cmdExec platform.CommandExecutor, pkgs ...string) bool {
+	if _, _, err := cmdExec.Execute("rpm -q " + strings.Join(pkgs, " ") + " >/dev/null 2>&1"); err != nil {
+		return false
+	}
+	log.Debug("%s already installed on %s", strings.Join(pkgs, ", "), cmdExec.String())
+	return true
+}
+
+// dnfInstall installs pkgs in one dnf transaction, allowing it up to
+// dnfInstallTimeout.
+func dnfInstall(cmdExec platform.CommandExecutor, opts []string, pkgs ...string) error {
+	args := append([]string{platform.DNF, "install", "-y", dnfParallelDownloads}, pkgs...)
+	args = append(args, opts...)
+
+	var sb strings.Builder
+	sb.WriteString("sudo")
+	for _, arg := range args {
+		sb.WriteString(" ")
+		sb.WriteString(platform.ShQuote(arg))
+	}
+	stdout, stderr, err := cmdExec.ExecuteWithTimeout(sb.String(), dnfInstallTimeout)
+	if err != nil {
+		return fmt.Errorf("command failed: %w\nstdout: %s\nstderr: %s", err, stdout, stderr)
+	}
+	return nil
+}
+
+// InstallK8sPackages configures the CRI-O, Kubernetes and (on RHEL) OVS
+// repositories and installs every Kubernetes node package in a single dnf
+// transaction: one metadata refresh and one dependency solve instead of one
+// per component. The crio, openvswitch and kubelet steps that follow then
+// only enable and configure their services.
+func InstallK8sPackages(cmdExec platform.CommandExecutor, distro *platform.Distro, cfg *config.Config, dep *platform.Dependency) error {
+	if distro.PackageManager != platform.DNF {
+		return platform.UnsupportedPackageManager(distro)
+	}
+	if err := writeCRIORepo(cmdExec, cfg.Kubernetes.Version); err != nil {
+		return err
+	}
+	if err := writeKubernetesRepo(cmdExec, cfg.Kubernetes.Version); err != nil {
+		return err
+	}
+	if err := enableRHELOVSRepos(cmdExec, distro); err != nil {
+		return fmt.Errorf("failed to enable RHEL OVS repos: %w", err)
+	}
+
+	if err := dnfInstallMissing(cmdExec, kubeletDNFOptions, k8sNodePackages...); err != nil {
+		return fmt.Errorf("failed to install Kubernetes packages: %w", err)
+	}
+	return nil
+}
+
+// CheckK8sPackages checks that every package InstallK8sPackages would install
+// is present. Only DNF systems are batched; elsewhere the per-component steps
+// install their own packages, so there is nothing to do here.
+func CheckK8sPackages(cmdExec platform.CommandExecutor, distro *platform.Distro, cfg *config.Config, dep *platform.Dependency) error {
+	if distro.PackageManager != platform.DNF {
+		return nil
+	}
+	if err := cmdExec.RunCmd(log.LevelDebug, "rpm", append([]string{"-q"}, k8sNodePackages...)...); err != nil {
+		return fmt.Errorf("kubernetes packages are not all installed: %w", err)
+	}
+	return nil
+}
+
+// k8sNodeInstalledSteps are the checks run by CheckK8sNodeInstalled, one
+// step per component so a failed probe names what is missing. Like
+// k8sKernelModulesScript they are fixed for the process and rendered once.
+var k8sNodeInstalledSteps = func() []platform.ScriptStep {
+	var modules strings.Builder
+	for _, mod := range k8sKernelModules {
+		fmt.Fprintf(&modules, "grep -q '^%s ' /proc/modules\n", mod)
+	}
+
+	return []platform.ScriptStep{
+		{Name: "packages", Script: fmt.Sprintf("rpm -q %s >/dev/null", strings.Join(k8sNodePackages, " "))},
+		{Name: "crio", Script: "systemctl is-active --quiet crio"},
+		{Name: "openvswitch", Script: "systemctl is-active --quiet openvswitch"},
+		{Name: "kubelet", Script: "systemctl is-enabled --quiet kubelet"},
+		{Name: "swap", Script: "test -z \"$(swapon --show --noheadings)\""},
+		{Name: "kernel modules", Script: modules.String()},
+		{Name: "firewalld", Script: "if systemctl is-active --quiet firewalld; then exit 1; fi"},
+	}
+}()
+
+// CheckK8sNodeInstalled checks, in a single remote round trip, everything
+// the Kubernetes install steps leave behind: packages, running CRI-O and
+// OVS, an enabled kubelet, swap off, kernel modules loaded and firewalld
+// stopped. It lets a re-run skip the individual dependency checks on
+// machines a previous run already finished.
+func CheckK8sNodeInstalled(cmdExec platform.CommandExecutor, distro *platform.Distro) error {
+	if distro.PackageManager != platform.DNF {
+		return platform.UnsupportedPackageManager(distro)
+	}
+
+	if _, err := platform.RunSteps(cmdExec, k8sNodeInstalledSteps, 30*time.Second); err != nil {
+		return fmt.Errorf("kubernetes node setup is incomplete: %w", err)
+	}
+	return nil
+}
+
+// dnfDisableFirewallScript stops and removes firewalld on DNF hosts. It is
+// the same for every machine, so it is rendered once rather than per VM.
+var dnfDisableFirewallScript = func() string {
 	sb := strings.Builder{}
 	sb.WriteString("set -e\n")
+	// Check if firewalld is installed before trying to disable/remove it
+	sb.WriteString("if rpm -q firewalld &>/dev/null; then\n")
+	sb.WriteString("  sudo systemctl disable --now firewalld\n")
+	fmt.Fprintf(&sb, "  sudo %s remove -y firewalld\n", platform.DNF)
+	sb.WriteString("fi\n")
+	return sb.String()
+}()
+
+// Disable firewall on the targetmachine
+func DisableFirewall(cmdExec platform.CommandExecutor, distro *platform.Distro, cfg *config.Config, dep *platform.Dependency) error {
+	var script string
 	switch distro.PackageManager {
 	case platform.DNF:
-		// Check if firewalld is installed before trying to disable/remove it
-		sb.WriteString("if rpm -q firewalld &>/dev/null; then\n")
-		sb.WriteString("  sudo systemctl disable --now firewalld\n")
-		sb.WriteString(fmt.Sprintf("  sudo %s remove -y firewalld\n", platform.DNF))
-		sb.WriteString("fi\n")
+		script = dnfDisableFirewallScript
 	default:
 		return platform.UnsupportedPackageManager(distro)
 	}
 
-	stdout, stderr, err := cmdExec.Execute(sb.String())
+	stdout, stderr, err := cmdExec.Execute(script)
 	if err != nil {
 		return fmt.Errorf("failed to configure firewall: %w, stdout: %s, stderr: %s", err, stdout, stderr)
 	}
@@ -0,0 +1,34 @@
+package linux
+
+import (
+	"testing"
+)
+
+// TestPkgsK8sRepoFile verifies the rendered repo files point at the
+// version-pinned pkgs.k8s.io streams.
+func TestPkgsK8sRepoFile(t *testing.T) {
+	t.Parallel()
+
+	got := pkgsK8sRepoFile("cri-o", "CRI-O", "addons:/cri-o", "1.33", "")
+	want := "[cri-o]\n" +
+		"name=CRI-O\n" +
+		"baseurl=https://pkgs.k8s.io/addons:/cri-o:/stable:/v1.33/rpm/\n" +
+		"enabled=1\n" +
+		"gpgcheck=1\n" +
+		"gpgkey=https://pkgs.k8s.io/addons:/cri-o:/stable:/v1.33/rpm/repodata/repomd.xml.key\n"
+	if got != want {
+		t.Fatalf("unexpected cri-o repo file:\n%s\nwant:\n%s", got, want)
+	}
+
+	got = pkgsK8sRepoFile("kubernetes", "Kubernetes", "core", "1.33", "kubelet kubeadm")
+	want = "[kubernetes]\n" +
+		"name=Kubernetes\n" +
+		"baseurl=https://pkgs.k8s.io/core:/stable:/v1.33/rpm/\n" +
+		"enabled=1\n" +
+		"gpgcheck=1\n" +
+		"gpgkey=https://pkgs.k8s.io/core:/stable:/v1.33/rpm/repodata/repomd.xml.key\n" +
+		"exclude=kubelet kubeadm\n"
+	if got != want {
+		t.Fatalf("unexpected kubernetes repo file:\n%s\nwant:\n%s", got, want)
+	}
+}
@@ -74,6 +74,10 @@ type Logger struct {
 	mu     sync.RWMutex
 	level  Level
 	output io.Writer
+
+	// writeMu serializes writes to output so each message reaches it in a
+	// single Write, without holding mu while the message is formatted.
+	writeMu sync.Mutex
 }
 
 // New creates a new Logger with the specified level and output writer
@@ -105,12 +109,14 @@ func (l *Logger) SetOutput(w io.Writer) {
 	l.output = w
 }
 
-// log writes a message if the message level is >= the logger's level
+// log writes a message if the message level is >= the logger's level.
+// Filtered messages are dropped before formatting, and formatting happens
+// outside any lock, so concurrent callers only contend for the write itself.
 func (l *Logger) log(level Level, format string, args ...interface{}) {
-	l.mu.Lock()
+	l.mu.RLock()
 	currentLevel := l.level
 	output := l.output
-	defer l.mu.Unlock()
+	l.mu.RUnlock()
 
 	if level > currentLevel {
 		return
@@ -121,7 +127,10 @@ func (l *Logger) log(level Level, format string, args ...interface{}) {
 	if !strings.HasSuffix(msg, "\n") {
 		msg += "\n"
 	}
-	fmt.Fprint(output, msg)
+
+	l.writeMu.Lock()
+	defer l.writeMu.Unlock()
+	_, _ = io.WriteString(output, msg)
 }
 
 // Error logs an error message (always printed unless output is nil)
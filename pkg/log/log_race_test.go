@@ -2,6 +2,8 @@ package log
 
 import (
 	"bytes"
+	"fmt"
+	"strings"
 	"sync"
 	"testing"
 )
@@ -28,3 +30,37 @@ func TestConcurrentLogWritesRace(t *testing.T) {
 	}
 	wg.Wait()
 }
+
+// TestConcurrentLogLinesIntact tests that messages logged concurrently are
+// never interleaved within a line.
+func TestConcurrentLogLinesIntact(t *testing.T) {
+	var buf bytes.Buffer
+	logger := New(LevelInfo, &buf)
+
+	const goroutines = 8
+	const iterations = 200
+
+	var wg sync.WaitGroup
+	wg.Add(goroutines)
+	for i := 0; i < goroutines; i++ {
+		go func(id int) {
+			defer wg.Done()
+			for j := 0; j < iterations; j++ {
+				logger.Info("goroutine %d iteration %d", id, j)
+				logger.Debug("filtered %d", j)
+			}
+		}(i)
+	}
+	wg.Wait()
+
+	lines := strings.Split(strings.TrimSuffix(buf.String(), "\n"), "\n")
+	if len(lines) != goroutines*iterations {
+		t.Fatalf("got %d lines, want %d", len(lines), goroutines*iterations)
+	}
+	for _, line := range lines {
+		var id, j int
+		if n, err := fmt.Sscanf(line, "goroutine %d iteration %d", &id, &j); n != 2 || err != nil {
+			t.Fatalf("malformed line %q", line)
+		}
+	}
+}
@@ -12,6 +12,7 @@ import (
 	"net"
 	"regexp"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/ovn-kubernetes/dpu-simulator/lib/dpusim"
@@ -32,9 +33,12 @@ func GenerateMACForHostToDpu(nodeName, role string, index int) string {
 	return fmt.Sprintf("%s:%02x:%02x:%02x", dpusim.MacOUI, h[0], h[1], index&0xff)
 }
 
+var hostDataIfRe = regexp.MustCompile(`^eth0-\d+$`)
+
 // GetRegexForHostDataIf returns a regex that matches the host-to-DPU interface names.
+// The regex is compiled once and shared; it is safe for concurrent use.
 func GetRegexForHostDataIf() *regexp.Regexp {
-	return regexp.MustCompile(`^eth0-\d+$`)
+	return hostDataIfRe
 }
 
 // GetFreeIPv4AddressInSubnet picks the highest usable IPv4 address in subnet that is
@@ -113,33 +117,44 @@ func (i *InterfaceInfo) String() string {
 // GetInterfaceByIP retrieves interface information for the interface that has the specified IP address
 // using a CommandExecutor.
 func GetInterfaceByIP(cmdExec platform.CommandExecutor, searchIP string) (*InterfaceInfo, error) {
-	return getInterfaceByIPWithTimeout(cmdExec, searchIP, 30*time.Second)
+	ifaces, err := GetInterfacesByIP(cmdExec, searchIP)
+	if err != nil {
+		return nil, err
+	}
+	return ifaces[0], nil
 }
 
-// getInterfaceByIPWithTimeout retrieves interface information with a custom timeout using an executor.
-func getInterfaceByIPWithTimeout(cmdExec platform.CommandExecutor, searchIP string, timeout time.Duration) (*InterfaceInfo, error) {
-	cmd := "ip -j addr show"
-
-	stdout, stderr, err := cmdExec.ExecuteWithTimeout(cmd, timeout)
+// GetInterfacesByIP looks up the interface holding each of searchIPs from a
+// single 'ip addr' listing, so several lookups on one machine cost one remote
+// command. The result is in the same order as searchIPs.
+func GetInterfacesByIP(cmdExec platform.CommandExecutor, searchIPs ...string) ([]*InterfaceInfo, error) {
+	interfaces, err := getAllInterfacesWithTimeout(cmdExec, 30*time.Second)
 	if err != nil {
-		return nil, fmt.Errorf("failed to execute ip command: %w, stderr: %s", err, stderr)
+		return nil, err
 	}
 
-	var interfaces []InterfaceInfo
-	if err := json.Unmarshal([]byte(stdout), &interfaces); err != nil {
-		return nil, fmt.Errorf("failed to parse ip command output: %w", err)
+	result := make([]*InterfaceInfo, len(searchIPs))
+	for i, searchIP := range searchIPs {
+		result[i] = findInterfaceByIP(interfaces, searchIP)
+		if result[i] == nil {
+			return nil, fmt.Errorf("no interface found with IP address %s", searchIP)
+		}
 	}
+	return result, nil
+}
 
+// findInterfaceByIP returns a copy of the interface in interfaces that has
+// searchIP, with TargetIP set, or nil if none does.
+func findInterfaceByIP(interfaces []InterfaceInfo, searchIP string) *InterfaceInfo {
 	for _, iface := range interfaces {
 		for _, addr := range iface.Addresses {
 			if addr.Local == searchIP {
 				iface.TargetIP = searchIP
-				return &iface, nil
+				return &iface
 			}
 		}
 	}
-
-	return nil, fmt.Errorf("no interface found with IP address %s", searchIP)
+	return nil
 }
 
 // GetAllInterfaces retrieves information about all network interfaces on a remote machine.
@@ -190,18 +205,69 @@ func getInterfaceByNameWithTimeout(cmdExec platform.CommandExecutor, ifaceName s
 	return &interfaces[0], nil
 }
 
+// RouteInfo is the route the kernel would use to reach a destination, as
+// reported by 'ip -j route get'.
+type RouteInfo struct {
+	Dst     string `json:"dst"`               // Destination address
+	Gateway string `json:"gateway,omitempty"` // Next hop, empty for directly connected destinations
+	Dev     string `json:"dev"`               // Egress interface
+	PrefSrc string `json:"prefsrc,omitempty"` // Source address used for the destination
+}
+
+// GetRouteTo returns the IPv4 route used to reach dstIP. The route is parsed
+// from 'ip -j' output locally rather than through a remote awk pipeline.
+func GetRouteTo(cmdExec platform.CommandExecutor, dstIP string) (*RouteInfo, error) {
+	cmd := fmt.Sprintf("ip -4 -j route get %s", platform.ShQuote(dstIP))
+
+	stdout, stderr, err := cmdExec.ExecuteWithTimeout(cmd, 30*time.Second)
+	if err != nil {
+		return nil, fmt.Errorf("failed to execute ip command: %w, stderr: %s", err, stderr)
+	}
+
+	return parseRouteGet(stdout, dstIP)
+}
+
+// parseRouteGet parses the output of 'ip -j route get'.
+func parseRouteGet(output, dstIP string) (*RouteInfo, error) {
+	var routes []RouteInfo
+	if err := json.Unmarshal([]byte(output), &routes); err != nil {
+		return nil, fmt.Errorf("failed to parse ip command output: %w", err)
+	}
+	if len(routes) == 0 || routes[0].Dev == "" {
+		return nil, fmt.Errorf("no route found to %s", dstIP)
+	}
+	return &routes[0], nil
+}
+
 // GenerateBridgeName generates a bridge name for a specific channel in a
 // host-DPU pair.
 // Format: h2d-<short-hash> where hash is from "hostName-dpuName-index"
 func GenerateBridgeName(hostName, dpuName string, index int) string {
+	key := bridgeNameKey{hostName: hostName, dpuName: dpuName, index: index}
+	if name, ok := bridgeNames.Load(key); ok {
+		return name.(string)
+	}
+
 	input := fmt.Sprintf("%s-%s-%d", hostName, dpuName, index)
 	hash := sha256.Sum256([]byte(input))
 	shortHash := fmt.Sprintf("%x", hash[:8])
 
-	bridgeName := fmt.Sprintf("h2d-%s", shortHash)
-	return SanitizeBridgeName(bridgeName)
+	bridgeName := SanitizeBridgeName(fmt.Sprintf("h2d-%s", shortHash))
+	bridgeNames.Store(key, bridgeName)
+	return bridgeName
+}
+
+// bridgeNameKey identifies one host-to-DPU channel for bridge name lookups.
+type bridgeNameKey struct {
+	hostName, dpuName string
+	index             int
 }
 
+// bridgeNames memoizes GenerateBridgeName. The same channels are named
+// repeatedly while networks and VMs are created and cleaned up, and each
+// name otherwise costs a SHA-256 plus several formatting passes.
+var bridgeNames sync.Map
+
 // GetHostToDPUNetworkName generates the libvirt network name for a specific
 // channel in a host-DPU pair.
 func GetHostToDPUNetworkName(hostName, dpuName string, index int) string {
@@ -280,17 +280,8 @@ func TestFindInterfaceByIP(t *testing.T) {
 	err := json.Unmarshal([]byte(sampleJSON), &interfaces)
 	assert.NoError(t, err)
 
-	// Helper function to simulate finding interface by IP
 	findByIP := func(searchIP string) *InterfaceInfo {
-		for _, iface := range interfaces {
-			for _, addr := range iface.Addresses {
-				if addr.Local == searchIP {
-					iface.TargetIP = searchIP
-					return &iface
-				}
-			}
-		}
-		return nil
+		return findInterfaceByIP(interfaces, searchIP)
 	}
 
 	// Test finding eth0 by IP
@@ -312,4 +303,56 @@ func TestFindInterfaceByIP(t *testing.T) {
 	// Test IP not found
 	found = findByIP("10.10.10.10")
 	assert.Nil(t, found)
+
+	// The returned interface is a copy; the listing is left untouched
+	assert.Empty(t, interfaces[1].TargetIP)
+}
+
+func TestParseRouteGet(t *testing.T) {
+	tests := []struct {
+		name      string
+		output    string
+		wantDev   string
+		wantSrc   string
+		wantGw    string
+		wantError bool
+	}{
+		{
+			name:    "via gateway",
+			output:  `[{"dst":"8.8.8.8","gateway":"192.168.122.1","dev":"enp1s0","prefsrc":"192.168.122.10","flags":[],"uid":0,"cache":[]}]`,
+			wantDev: "enp1s0",
+			wantSrc: "192.168.122.10",
+			wantGw:  "192.168.122.1",
+		},
+		{
+			name:    "directly connected",
+			output:  `[{"dst":"10.0.0.5","dev":"br0","prefsrc":"10.0.0.1","flags":[],"uid":0,"cache":[]}]`,
+			wantDev: "br0",
+			wantSrc: "10.0.0.1",
+		},
+		{
+			name:      "empty",
+			output:    `[]`,
+			wantError: true,
+		},
+		{
+			name:      "not json",
+			output:    "8.8.8.8 via 192.168.122.1 dev enp1s0",
+			wantError: true,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			route, err := parseRouteGet(tt.output, "dst")
+			if tt.wantError {
+				assert.Error(t, err)
+				return
+			}
+			assert.NoError(t, err)
+			assert.Equal(t, tt.wantDev, route.Dev)
+			assert.Equal(t, tt.wantSrc, route.PrefSrc)
+			assert.Equal(t, tt.wantGw, route.Gateway)
+		})
+	}
 }
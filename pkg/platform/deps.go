@@ -7,6 +7,8 @@ import (
 	"path/filepath"
 	"strings"
 
+	"golang.org/x/sync/errgroup"
+
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/log"
 )
@@ -69,6 +71,46 @@ func checkDependency(cmdExec CommandExecutor, dep Dependency, distro *Distro, cf
 	return result
 }
 
+// checkDependencies checks every dependency in deps. The CheckCmd probes are
+// sent to the target as one script so a machine with many command-based
+// dependencies costs a single round trip; CheckFunc dependencies and any
+// probe the batch could not answer are checked one by one.
+func checkDependencies(cmdExec CommandExecutor, deps []Dependency, distro *Distro, cfg *config.Config) []DependencyResult {
+	results := make([]DependencyResult, len(deps))
+	batched := make(map[int]bool)
+	sb := strings.Builder{}
+	for i, dep := range deps {
+		if len(dep.CheckCmd) == 0 {
+			continue
+		}
+		batched[i] = true
+		fmt.Fprintf(&sb, "if %s >/dev/null 2>&1; then echo %q; else echo %q; fi\n",
+			strings.Join(dep.CheckCmd, " "), fmt.Sprintf("%d ok", i), fmt.Sprintf("%d missing", i))
+	}
+
+	answered := make(map[int]bool)
+	if len(batched) > 1 {
+		if stdout, _, err := cmdExec.Execute(sb.String()); err == nil {
+			for _, line := range strings.Split(stdout, "\n") {
+				var idx int
+				var status string
+				if _, err := fmt.Sscanf(line, "%d %s", &idx, &status); err != nil || !batched[idx] {
+					continue
+				}
+				results[idx] = DependencyResult{Name: deps[idx].Name, Installed: status == "ok"}
+				answered[idx] = true
+			}
+		}
+	}
+
+	for i, dep := range deps {
+		if !answered[i] {
+			results[i] = checkDependency(cmdExec, dep, distro, cfg)
+		}
+	}
+	return results
+}
+
 // installDependency attempts to install a dependency using its install function
 func installDependency(cmdExec CommandExecutor, dep Dependency, distro *Distro, cfg *config.Config) error {
 	if dep.InstallFunc == nil {
@@ -109,8 +151,8 @@ func EnsureDependenciesWithExecutorAndDistro(cmdExec CommandExecutor, distro *Di
 	log.Info("✓ Detected Linux distribution: %s %s (package manager: %s, architecture: %s)", distro.ID, distro.VersionID, distro.PackageManager, distro.Architecture)
 
 	var missing []Dependency
-	for _, dep := range deps {
-		result := checkDependency(cmdExec, dep, distro, cfg)
+	for i, result := range checkDependencies(cmdExec, deps, distro, cfg) {
+		dep := deps[i]
 		if result.Installed {
 			log.Info("✓ %s is installed", dep.Name)
 		} else {
@@ -125,18 +167,64 @@ func EnsureDependenciesWithExecutorAndDistro(cmdExec CommandExecutor, distro *Di
 			names = append(names, dep.Name)
 		}
 		log.Info("Installing missing dependencies: %s", strings.Join(names, ", "))
-		for _, dep := range missing {
-			if err := installDependency(cmdExec, dep, distro, cfg); err != nil {
-				return fmt.Errorf("failed to install dependency %s: %w", dep.Name, err)
-			}
-
-			result := checkDependency(cmdExec, dep, distro, cfg)
-			if !result.Installed {
-				return fmt.Errorf("dependency %s was installed but verification failed", dep.Name)
-			}
+		if err := installAndVerifyDependencies(cmdExec, missing, distro, cfg); err != nil {
+			return err
 		}
 	}
 
 	log.Info("✓ All dependencies are available")
 	return nil
 }
+
+// EnsureDependencyGroupsWithExecutor behaves like EnsureDependenciesWithExecutor
+// for each group, running the groups concurrently. Dependencies within a
+// group are still checked and installed in order, so steps that contend for
+// a shared resource such as the package manager lock belong in one group.
+func EnsureDependencyGroupsWithExecutor(cmdExec CommandExecutor, groups [][]Dependency, cfg *config.Config) error {
+	distro, err := cmdExec.GetDistro()
+	if err != nil {
+		return fmt.Errorf("failed to detect distribution on %s: %w", cmdExec.String(), err)
+	}
+	// Probe sudo before fanning out so the groups only read the cached result.
+	cmdExec.HasSudo()
+
+	var g errgroup.Group
+	for _, deps := range groups {
+		g.Go(func() error {
+			return EnsureDependenciesWithExecutorAndDistro(cmdExec, distro, deps, cfg)
+		})
+	}
+	return g.Wait()
+}
+
+// ReinstallDependenciesWithExecutor runs every dependency's install function
+// without checking first, then verifies each one. It is used when the caller
+// explicitly asks to redo work that a previous run may have left half done.
+func ReinstallDependenciesWithExecutor(cmdExec CommandExecutor, deps []Dependency, cfg *config.Config) error {
+	distro, err := cmdExec.GetDistro()
+	if err != nil {
+		return fmt.Errorf("failed to detect distribution on %s: %w", cmdExec.String(), err)
+	}
+	log.Info("Reinstalling %d dependencies on %s...", len(deps), cmdExec.String())
+	if err := installAndVerifyDependencies(cmdExec, deps, distro, cfg); err != nil {
+		return err
+	}
+	log.Info("✓ All dependencies are available")
+	return nil
+}
+
+// installAndVerifyDependencies installs each dependency in order and checks
+// it afterwards, stopping at the first failure.
+func installAndVerifyDependencies(cmdExec CommandExecutor, deps []Dependency, distro *Distro, cfg *config.Config) error {
+	for _, dep := range deps {
+		if err := installDependency(cmdExec, dep, distro, cfg); err != nil {
+			return fmt.Errorf("failed to install dependency %s: %w", dep.Name, err)
+		}
+
+		result := checkDependency(cmdExec, dep, distro, cfg)
+		if !result.Installed {
+			return fmt.Errorf("dependency %s was installed but verification failed", dep.Name)
+		}
+	}
+	return nil
+}
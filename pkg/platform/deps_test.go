@@ -0,0 +1,36 @@
+package platform
+
+import (
+	"fmt"
+	"testing"
+
+	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
+)
+
+// TestCheckDependencies verifies batched CheckCmd probes and CheckFunc
+// dependencies each report their own result, in order.
+func TestCheckDependencies(t *testing.T) {
+	cmdExec := NewLocalExecutor()
+	deps := []Dependency{
+		{Name: "present", CheckCmd: []string{"true"}},
+		{Name: "absent", CheckCmd: []string{"false"}},
+		{Name: "func", CheckFunc: func(CommandExecutor, *Distro, *config.Config, *Dependency) error {
+			return fmt.Errorf("not installed")
+		}},
+		{Name: "also-present", CheckCmd: []string{"test", "-d", "/"}},
+	}
+
+	results := checkDependencies(cmdExec, deps, &Distro{}, nil)
+	want := []bool{true, false, false, true}
+	if len(results) != len(want) {
+		t.Fatalf("expected %d results, got %d", len(want), len(results))
+	}
+	for i, result := range results {
+		if result.Name != deps[i].Name {
+			t.Errorf("result %d: expected name %s, got %s", i, deps[i].Name, result.Name)
+		}
+		if result.Installed != want[i] {
+			t.Errorf("%s: expected installed=%v, got %v", deps[i].Name, want[i], result.Installed)
+		}
+	}
+}
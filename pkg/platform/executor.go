@@ -9,6 +9,7 @@ import (
 	"os"
 	"os/exec"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
@@ -86,6 +87,99 @@ func ShQuote(s string) string {
 	return "'" + strings.ReplaceAll(s, "'", "'\"'\"'") + "'"
 }
 
+// lineWriter forwards only complete lines to w, each preceded by prefix, so
+// output streamed from several machines at once is interleaved by line
+// rather than mid-line and every line says where it came from. It is safe
+// for concurrent use.
+type lineWriter struct {
+	mu     sync.Mutex
+	w      io.Writer
+	prefix []byte
+	buf    []byte
+}
+
+func newLineWriter(w io.Writer, prefix string) *lineWriter {
+	return &lineWriter{w: w, prefix: []byte(prefix)}
+}
+
+// Write buffers p and writes out every complete line it now holds.
+func (lw *lineWriter) Write(p []byte) (int, error) {
+	lw.mu.Lock()
+	defer lw.mu.Unlock()
+
+	lw.buf = append(lw.buf, p...)
+	i := bytes.LastIndexByte(lw.buf, '\n')
+	if i < 0 {
+		return len(p), nil
+	}
+	var out []byte
+	for _, line := range bytes.SplitAfter(lw.buf[:i+1], []byte("\n")) {
+		if len(line) > 0 {
+			out = append(out, lw.prefix...)
+			out = append(out, line...)
+		}
+	}
+	if _, err := lw.w.Write(out); err != nil {
+		return 0, err
+	}
+	lw.buf = append(lw.buf[:0], lw.buf[i+1:]...)
+	return len(p), nil
+}
+
+// Flush writes out any trailing partial line.
+func (lw *lineWriter) Flush() error {
+	lw.mu.Lock()
+	defer lw.mu.Unlock()
+
+	if len(lw.buf) == 0 {
+		return nil
+	}
+	if _, err := lw.w.Write(append(append([]byte{}, lw.prefix...), lw.buf...)); err != nil {
+		return err
+	}
+	lw.buf = lw.buf[:0]
+	return nil
+}
+
+// runOutputTail is how much of a hidden RunCmd's stdout and stderr is kept
+// for its error message. Package installs can print megabytes; the end of
+// the output is where the failure is.
+const runOutputTail = 64 * 1024
+
+// tailBuffer keeps only the last max bytes written to it.
+type tailBuffer struct {
+	max       int
+	buf       []byte
+	truncated bool
+}
+
+func newTailBuffer(max int) *tailBuffer {
+	return &tailBuffer{max: max}
+}
+
+// Write appends p, discarding the oldest bytes beyond max.
+func (tb *tailBuffer) Write(p []byte) (int, error) {
+	n := len(p)
+	if len(p) > tb.max {
+		p = p[len(p)-tb.max:]
+		tb.truncated = true
+	}
+	if drop := len(tb.buf) + len(p) - tb.max; drop > 0 {
+		tb.buf = append(tb.buf[:0], tb.buf[drop:]...)
+		tb.truncated = true
+	}
+	tb.buf = append(tb.buf, p...)
+	return n, nil
+}
+
+// String returns the kept output, marked when earlier output was dropped.
+func (tb *tailBuffer) String() string {
+	if tb.truncated {
+		return "...(truncated)\n" + string(tb.buf)
+	}
+	return string(tb.buf)
+}
+
 func parseReadDirLines(stdout string) []string {
 	stdout = strings.TrimSpace(stdout)
 	if stdout == "" {
@@ -192,10 +286,15 @@ func executeRetryWithTimeout(exec CommandExecutor, command string, interval, tim
 	}
 }
 
-// probeSudo checks whether "sudo" is available on the target system.
-func probeSudo(cmdExec rawExecutor) bool {
-	_, _, err := cmdExec.rawExecuteWithTimeout("which sudo", 5*time.Second)
-	return err == nil
+// probeSudo checks whether "sudo" is available on the target system. ok is
+// false when the probe itself could not run (e.g. the host is not reachable
+// yet), in which case the answer must not be cached.
+func probeSudo(cmdExec rawExecutor) (hasSudo, ok bool) {
+	stdout, _, err := cmdExec.rawExecuteWithTimeout("if command -v sudo >/dev/null 2>&1; then echo yes; else echo no; fi", 5*time.Second)
+	if err != nil {
+		return false, false
+	}
+	return strings.TrimSpace(stdout) == "yes", true
 }
 
 // LocalExecutor executes commands on the local machine
@@ -219,8 +318,10 @@ func (e *LocalExecutor) HasSudo() bool {
 	if e.cachedSudo != nil {
 		return *e.cachedSudo
 	}
-	v := probeSudo(e)
-	e.cachedSudo = &v
+	v, ok := probeSudo(e)
+	if ok {
+		e.cachedSudo = &v
+	}
 	return v
 }
 
@@ -265,10 +366,10 @@ func (e *LocalExecutor) RunCmd(level log.Level, name string, args ...string) err
 		return cmd.Run()
 	}
 
-	// Otherwise capture output silently
-	var stdoutBuf, stderrBuf bytes.Buffer
-	cmd.Stdout = &stdoutBuf
-	cmd.Stderr = &stderrBuf
+	// Otherwise capture the end of the output silently
+	stdoutBuf, stderrBuf := newTailBuffer(runOutputTail), newTailBuffer(runOutputTail)
+	cmd.Stdout = stdoutBuf
+	cmd.Stderr = stderrBuf
 
 	err := cmd.Run()
 	if err != nil {
@@ -291,10 +392,10 @@ func (e *LocalExecutor) RunCmdInDir(level log.Level, dir string, name string, ar
 		return cmd.Run()
 	}
 
-	// Otherwise capture output silently
-	var stdoutBuf, stderrBuf bytes.Buffer
-	cmd.Stdout = &stdoutBuf
-	cmd.Stderr = &stderrBuf
+	// Otherwise capture the end of the output silently
+	stdoutBuf, stderrBuf := newTailBuffer(runOutputTail), newTailBuffer(runOutputTail)
+	cmd.Stdout = stdoutBuf
+	cmd.Stderr = stderrBuf
 
 	err := cmd.Run()
 	if err != nil {
@@ -318,9 +419,9 @@ func (e *LocalExecutor) RunCmdWithExtraEnv(level log.Level, extraEnv []string, n
 		return cmd.Run()
 	}
 
-	var stdoutBuf, stderrBuf bytes.Buffer
-	cmd.Stdout = &stdoutBuf
-	cmd.Stderr = &stderrBuf
+	stdoutBuf, stderrBuf := newTailBuffer(runOutputTail), newTailBuffer(runOutputTail)
+	cmd.Stdout = stdoutBuf
+	cmd.Stderr = stderrBuf
 
 	err := cmd.Run()
 	if err != nil {
@@ -394,11 +495,54 @@ func (e *LocalExecutor) String() string {
 
 // SSHExecutor executes commands on a remote machine via SSH
 type SSHExecutor struct {
-	client       *ssh.SSHClient
-	config       *config.SSHConfig
-	ip           string
-	cachedDistro *Distro
-	cachedSudo   *bool
+	client *ssh.SSHClient
+	config *config.SSHConfig
+	ip     string
+	probes *sshHostProbes
+}
+
+// sshHostProbes caches distro and sudo detection for one user@host. It is
+// shared by every SSHExecutor for that target, the same way their SSH
+// connection is, so the many short-lived executors created for a VM during a
+// deployment only probe it once.
+type sshHostProbes struct {
+	distroMu sync.Mutex
+	distro   *Distro
+	sudoMu   sync.Mutex
+	sudo     *bool
+}
+
+var sshProbeCache = struct {
+	sync.Mutex
+	hosts map[string]*sshHostProbes
+}{hosts: make(map[string]*sshHostProbes)}
+
+// sshHostProbesFor returns the shared probe cache for user@ip.
+func sshHostProbesFor(user, ip string) *sshHostProbes {
+	key := user + "@" + ip
+	sshProbeCache.Lock()
+	defer sshProbeCache.Unlock()
+	p, ok := sshProbeCache.hosts[key]
+	if !ok {
+		p = &sshHostProbes{}
+		sshProbeCache.hosts[key] = p
+	}
+	return p
+}
+
+// ForgetSSHHost drops everything cached about ip: its pooled SSH connections
+// and the distro/sudo probes shared by its executors. Call it when the host
+// reboots or is recreated, since it may come back as a different OS image
+// (e.g. after a bootc switch). Executors created afterwards probe it again.
+func ForgetSSHHost(ip string) {
+	sshProbeCache.Lock()
+	for key := range sshProbeCache.hosts {
+		if strings.HasSuffix(key, "@"+ip) {
+			delete(sshProbeCache.hosts, key)
+		}
+	}
+	sshProbeCache.Unlock()
+	ssh.CloseHostConnections(ip)
 }
 
 // NewSSHExecutor creates a new SSHExecutor for a specific remote host
@@ -407,6 +551,7 @@ func NewSSHExecutor(cfg *config.SSHConfig, ip string) *SSHExecutor {
 		client: ssh.NewSSHClient(cfg),
 		config: cfg,
 		ip:     ip,
+		probes: sshHostProbesFor(cfg.User, ip),
 	}
 }
 
@@ -417,11 +562,15 @@ func (e *SSHExecutor) WaitUntilReady(timeout time.Duration) error {
 
 // HasSudo returns true if "sudo" is available on the remote host.
 func (e *SSHExecutor) HasSudo() bool {
-	if e.cachedSudo != nil {
-		return *e.cachedSudo
+	e.probes.sudoMu.Lock()
+	defer e.probes.sudoMu.Unlock()
+	if e.probes.sudo != nil {
+		return *e.probes.sudo
+	}
+	v, ok := probeSudo(e)
+	if ok {
+		e.probes.sudo = &v
 	}
-	v := probeSudo(e)
-	e.cachedSudo = &v
 	return v
 }
 
@@ -454,24 +603,7 @@ func (e *SSHExecutor) RunCmd(level log.Level, name string, args ...string) error
 		command += " '" + escaped + "'"
 	}
 
-	stdout, stderr, err := e.ExecuteWithTimeout(command, 5*time.Minute)
-
-	// If the requested level is visible, print output
-	if level <= log.GetLevel() {
-		if stdout != "" {
-			fmt.Print(stdout)
-		}
-		if stderr != "" {
-			fmt.Fprint(os.Stderr, stderr)
-		}
-		return err
-	}
-
-	// Otherwise only include output in error
-	if err != nil {
-		return fmt.Errorf("command failed: %w\nstdout: %s\nstderr: %s", err, stdout, stderr)
-	}
-	return nil
+	return e.runCommand(level, command)
 }
 
 // RunCmdInDir executes a command with arguments in a specific working directory via SSH
@@ -482,24 +614,7 @@ func (e *SSHExecutor) RunCmdInDir(level log.Level, dir string, name string, args
 		command += " " + ShQuote(arg)
 	}
 
-	stdout, stderr, err := e.ExecuteWithTimeout(command, 5*time.Minute)
-
-	// If the requested level is visible, print output
-	if level <= log.GetLevel() {
-		if stdout != "" {
-			fmt.Print(stdout)
-		}
-		if stderr != "" {
-			fmt.Fprint(os.Stderr, stderr)
-		}
-		return err
-	}
-
-	// Otherwise only include output in error
-	if err != nil {
-		return fmt.Errorf("command failed: %w\nstdout: %s\nstderr: %s", err, stdout, stderr)
-	}
-	return nil
+	return e.runCommand(level, command)
 }
 
 // RunCmdWithExtraEnv runs a command on the remote host with extra environment variables.
@@ -517,18 +632,29 @@ func (e *SSHExecutor) RunCmdWithExtraEnv(level log.Level, extraEnv []string, nam
 		command += " " + ShQuote(arg)
 	}
 
-	stdout, stderr, err := e.ExecuteWithTimeout(command, 5*time.Minute)
+	return e.runCommand(level, command)
+}
 
+// runCommand runs an already-quoted command line for the RunCmd variants.
+// When level is visible the output is streamed line by line as the command
+// produces it, so long package installs show progress instead of one blob at
+// the end; otherwise the tail of it is captured and only included in the
+// error. ExecuteStreamWithTimeout only returns once the session has stopped
+// writing, so the unlocked writers are safe to flush or format here even
+// after a timeout.
+func (e *SSHExecutor) runCommand(level log.Level, command string) error {
 	if level <= log.GetLevel() {
-		if stdout != "" {
-			fmt.Print(stdout)
-		}
-		if stderr != "" {
-			fmt.Fprint(os.Stderr, stderr)
-		}
+		prefix := fmt.Sprintf("[%s] ", e.ip)
+		stdout := newLineWriter(os.Stdout, prefix)
+		stderr := newLineWriter(os.Stderr, prefix)
+		err := e.client.ExecuteStreamWithTimeout(e.ip, stripSudoScript(e.HasSudo(), command), 5*time.Minute, stdout, stderr)
+		stdout.Flush()
+		stderr.Flush()
 		return err
 	}
 
+	stdout, stderr := newTailBuffer(runOutputTail), newTailBuffer(runOutputTail)
+	err := e.client.ExecuteStreamWithTimeout(e.ip, stripSudoScript(e.HasSudo(), command), 5*time.Minute, stdout, stderr)
 	if err != nil {
 		return fmt.Errorf("command failed: %w\nstdout: %s\nstderr: %s", err, stdout, stderr)
 	}
@@ -565,15 +691,17 @@ func (e *SSHExecutor) ReadFile(path string) ([]byte, error) {
 
 // WriteFile writes content to a file on the remote system
 func (e *SSHExecutor) WriteFile(path string, content []byte, mode os.FileMode) error {
-	// Use heredoc to write file content
-	// This handles binary and multiline content safely
-	encodedContent := strings.ReplaceAll(string(content), "'", "'\"'\"'")
-	command := fmt.Sprintf("cat > '%s' << 'EOF'\n%s\nEOF\nchmod %o '%s'",
-		path, encodedContent, mode, path)
-
-	_, _, err := e.ExecuteWithTimeout(command, 30*time.Second)
+	// Stream the content over the session's stdin, like DockerExecutor does,
+	// rather than embedding it in the command. It is written byte for byte
+	// (no heredoc quoting or added trailing newline) and its size is not
+	// bounded by the remote command-line limit. Allow an extra second per
+	// MiB on top of the base timeout for large files.
+	command := fmt.Sprintf("cat > %s && chmod %o %s", ShQuote(path), mode, ShQuote(path))
+	timeout := 30*time.Second + time.Duration(len(content)>>20)*time.Second
+
+	_, stderr, err := e.client.ExecuteWithStdinTimeout(e.ip, command, bytes.NewReader(content), timeout)
 	if err != nil {
-		return fmt.Errorf("failed to write file via SSH: %w", err)
+		return fmt.Errorf("failed to write file via SSH: %w, stderr: %s", err, stderr)
 	}
 
 	return nil
@@ -587,14 +715,16 @@ func (e *SSHExecutor) RemoveAll(path string) error {
 
 // GetDistro returns the Linux distribution information for the remote machine
 func (e *SSHExecutor) GetDistro() (*Distro, error) {
-	if e.cachedDistro != nil {
-		return e.cachedDistro, nil
+	e.probes.distroMu.Lock()
+	defer e.probes.distroMu.Unlock()
+	if e.probes.distro != nil {
+		return e.probes.distro, nil
 	}
 	distro, err := DetectDistro(e)
 	if err != nil {
 		return nil, err
 	}
-	e.cachedDistro = distro
+	e.probes.distro = distro
 	return distro, nil
 }
 
@@ -635,8 +765,10 @@ func (e *DockerExecutor) HasSudo() bool {
 	if e.cachedSudo != nil {
 		return *e.cachedSudo
 	}
-	v := probeSudo(e)
-	e.cachedSudo = &v
+	v, ok := probeSudo(e)
+	if ok {
+		e.cachedSudo = &v
+	}
 	return v
 }
 
@@ -683,10 +815,10 @@ func (e *DockerExecutor) RunCmd(level log.Level, name string, args ...string) er
 		return cmd.Run()
 	}
 
-	// Otherwise capture output silently
-	var stdoutBuf, stderrBuf bytes.Buffer
-	cmd.Stdout = &stdoutBuf
-	cmd.Stderr = &stderrBuf
+	// Otherwise capture the end of the output silently
+	stdoutBuf, stderrBuf := newTailBuffer(runOutputTail), newTailBuffer(runOutputTail)
+	cmd.Stdout = stdoutBuf
+	cmd.Stderr = stderrBuf
 
 	err := cmd.Run()
 	if err != nil {
@@ -719,10 +851,10 @@ func (e *DockerExecutor) RunCmdInDir(level log.Level, dir string, name string, a
 		return cmd.Run()
 	}
 
-	// Otherwise capture output silently
-	var stdoutBuf, stderrBuf bytes.Buffer
-	cmd.Stdout = &stdoutBuf
-	cmd.Stderr = &stderrBuf
+	// Otherwise capture the end of the output silently
+	stdoutBuf, stderrBuf := newTailBuffer(runOutputTail), newTailBuffer(runOutputTail)
+	cmd.Stdout = stdoutBuf
+	cmd.Stderr = stderrBuf
 
 	err := cmd.Run()
 	if err != nil {
@@ -749,9 +881,9 @@ func (e *DockerExecutor) RunCmdWithExtraEnv(level log.Level, extraEnv []string,
 		return cmd.Run()
 	}
 
-	var stdoutBuf, stderrBuf bytes.Buffer
-	cmd.Stdout = &stdoutBuf
-	cmd.Stderr = &stderrBuf
+	stdoutBuf, stderrBuf := newTailBuffer(runOutputTail), newTailBuffer(runOutputTail)
+	cmd.Stdout = stdoutBuf
+	cmd.Stderr = stderrBuf
 
 	err := cmd.Run()
 	if err != nil {
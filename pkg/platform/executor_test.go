@@ -7,6 +7,7 @@ import (
 	"testing"
 	"time"
 
+	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/log"
 )
 
@@ -140,6 +141,55 @@ func TestMeaningfulDirEntries(t *testing.T) {
 	}
 }
 
+func TestLineWriter(t *testing.T) {
+	var out strings.Builder
+	lw := newLineWriter(&out, "[vm] ")
+
+	if _, err := lw.Write([]byte("Installing cri-o")); err != nil {
+		t.Fatalf("Write returned error: %v", err)
+	}
+	if out.String() != "" {
+		t.Fatalf("partial line written early: %q", out.String())
+	}
+	if _, err := lw.Write([]byte("...\nDone\nCompl")); err != nil {
+		t.Fatalf("Write returned error: %v", err)
+	}
+	if got, want := out.String(), "[vm] Installing cri-o...\n[vm] Done\n"; got != want {
+		t.Fatalf("after complete lines got %q, want %q", got, want)
+	}
+	if err := lw.Flush(); err != nil {
+		t.Fatalf("Flush returned error: %v", err)
+	}
+	if got, want := out.String(), "[vm] Installing cri-o...\n[vm] Done\n[vm] Compl"; got != want {
+		t.Fatalf("after Flush got %q, want %q", got, want)
+	}
+}
+
+func TestTailBuffer(t *testing.T) {
+	tb := newTailBuffer(8)
+	if _, err := tb.Write([]byte("abc")); err != nil {
+		t.Fatalf("Write returned error: %v", err)
+	}
+	if got := tb.String(); got != "abc" {
+		t.Fatalf("short output got %q, want %q", got, "abc")
+	}
+	if _, err := tb.Write([]byte("defgh")); err != nil {
+		t.Fatalf("Write returned error: %v", err)
+	}
+	if _, err := tb.Write([]byte("ij")); err != nil {
+		t.Fatalf("Write returned error: %v", err)
+	}
+	if got, want := tb.String(), "...(truncated)\ncdefghij"; got != want {
+		t.Fatalf("after overflow got %q, want %q", got, want)
+	}
+	if _, err := tb.Write([]byte("0123456789")); err != nil {
+		t.Fatalf("Write returned error: %v", err)
+	}
+	if got, want := tb.String(), "...(truncated)\n23456789"; got != want {
+		t.Fatalf("after oversized write got %q, want %q", got, want)
+	}
+}
+
 func TestLocalExecutor_ReadDirNames(t *testing.T) {
 	cmdExec := NewLocalExecutor()
 	tmpDir := t.TempDir()
@@ -459,3 +509,31 @@ func TestMockExecutor_FailureScenarios(t *testing.T) {
 		}
 	})
 }
+
+// TestSSHExecutorsShareHostProbes verifies executors for the same user and
+// host share one probe cache while other targets get their own.
+func TestSSHExecutorsShareHostProbes(t *testing.T) {
+	root := &config.SSHConfig{User: "root"}
+	core := &config.SSHConfig{User: "core"}
+
+	a := NewSSHExecutor(root, "192.0.2.10")
+	b := NewSSHExecutor(root, "192.0.2.10")
+	if a.probes != b.probes {
+		t.Fatalf("expected executors for the same target to share probes")
+	}
+	if NewSSHExecutor(root, "192.0.2.11").probes == a.probes {
+		t.Fatalf("expected a different host to get its own probes")
+	}
+	if NewSSHExecutor(core, "192.0.2.10").probes == a.probes {
+		t.Fatalf("expected a different user to get its own probes")
+	}
+
+	other := NewSSHExecutor(root, "192.0.2.110")
+	ForgetSSHHost("192.0.2.10")
+	if NewSSHExecutor(root, "192.0.2.10").probes == a.probes {
+		t.Fatalf("expected a forgotten host to be probed again")
+	}
+	if NewSSHExecutor(root, "192.0.2.110").probes != other.probes {
+		t.Fatalf("expected other hosts to keep their probes")
+	}
+}
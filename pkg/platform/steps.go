@@ -0,0 +1,67 @@
+package platform
+
+import (
+	"fmt"
+	"strconv"
+	"strings"
+	"time"
+)
+
+// ScriptStep is one named part of a script run by RunSteps.
+type ScriptStep struct {
+	Name   string
+	Script string
+}
+
+// stepMarker prefixes the line RunSteps prints before each step so the
+// combined stdout can be split back up and a failure pinned to its step.
+const stepMarker = "##STEP:"
+
+// buildStepScript joins steps into one set -e script, printing a marker line
+// before each one. The marker starts with a newline so it stays on its own
+// line even when the previous step's output did not end with one.
+func buildStepScript(steps []ScriptStep) string {
+	sb := strings.Builder{}
+	sb.WriteString("set -e\n")
+	for i, step := range steps {
+		fmt.Fprintf(&sb, "printf '\\n%s%d##\\n'\n", stepMarker, i)
+		sb.WriteString(strings.TrimRight(step.Script, "\n"))
+		sb.WriteString("\n")
+	}
+	return sb.String()
+}
+
+// splitStepOutput splits the stdout of a step script into each step's output.
+// It also returns the index of the last step that started, or -1 if none did.
+func splitStepOutput(stdout string, n int) ([]string, int) {
+	outputs := make([]string, n)
+	last := -1
+	for _, chunk := range strings.Split(stdout, "\n"+stepMarker)[1:] {
+		idx, rest, ok := strings.Cut(chunk, "##\n")
+		if !ok {
+			idx, rest, ok = strings.Cut(chunk, "##")
+		}
+		i, err := strconv.Atoi(idx)
+		if !ok || err != nil || i < 0 || i >= n {
+			continue
+		}
+		outputs[i] = strings.TrimSpace(rest)
+		last = i
+	}
+	return outputs, last
+}
+
+// RunSteps runs steps as a single remote script instead of one command per
+// step, saving a round trip for each. It returns the trimmed stdout of every
+// step. When the script fails, the error names the step that was running.
+func RunSteps(cmdExec CommandExecutor, steps []ScriptStep, timeout time.Duration) ([]string, error) {
+	stdout, stderr, err := cmdExec.ExecuteWithTimeout(buildStepScript(steps), timeout)
+	outputs, last := splitStepOutput(stdout, len(steps))
+	if err != nil {
+		if last < 0 {
+			return outputs, fmt.Errorf("failed to run steps: %w, stderr: %s", err, stderr)
+		}
+		return outputs, fmt.Errorf("step %q failed: %w, stdout: %s, stderr: %s", steps[last].Name, err, outputs[last], stderr)
+	}
+	return outputs, nil
+}
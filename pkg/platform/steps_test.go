@@ -0,0 +1,45 @@
+package platform
+
+import (
+	"strings"
+	"testing"
+	"time"
+)
+
+func TestRunSteps(t *testing.T) {
+	cmdExec := NewLocalExecutor()
+
+	outputs, err := RunSteps(cmdExec, []ScriptStep{
+		{Name: "first", Script: "echo one"},
+		{Name: "quiet", Script: "true"},
+		{Name: "no-newline", Script: "printf two"},
+	}, 10*time.Second)
+	if err != nil {
+		t.Fatalf("RunSteps() error = %v", err)
+	}
+	want := []string{"one", "", "two"}
+	for i := range want {
+		if outputs[i] != want[i] {
+			t.Fatalf("outputs[%d] = %q, want %q", i, outputs[i], want[i])
+		}
+	}
+}
+
+func TestRunStepsNamesFailingStep(t *testing.T) {
+	cmdExec := NewLocalExecutor()
+
+	outputs, err := RunSteps(cmdExec, []ScriptStep{
+		{Name: "ok", Script: "echo fine"},
+		{Name: "broken", Script: "echo partial; false"},
+		{Name: "never", Script: "echo unreachable"},
+	}, 10*time.Second)
+	if err == nil {
+		t.Fatal("RunSteps() expected error")
+	}
+	if !strings.Contains(err.Error(), `step "broken" failed`) {
+		t.Fatalf("error %q does not name the failing step", err)
+	}
+	if outputs[0] != "fine" || outputs[1] != "partial" || outputs[2] != "" {
+		t.Fatalf("outputs = %q", outputs)
+	}
+}
@@ -247,17 +247,32 @@ func (m *RegistryManager) tagAndPush(localImage, registryRef string) error {
 	return nil
 }
 
+const (
+	// readyPollInitialInterval and readyPollMaxInterval bound the backoff
+	// used while waiting for the registry to answer.
+	readyPollInitialInterval = 100 * time.Millisecond
+	readyPollMaxInterval     = 2 * time.Second
+)
+
 // waitForReady waits for the registry to respond to HTTP requests
 func (m *RegistryManager) waitForReady(timeout time.Duration) error {
 	endpoint := m.config.GetRegistryLocalEndpoint()
 	deadline := time.Now().Add(timeout)
-	for time.Now().Before(deadline) {
+	// A freshly started registry usually answers well within a second, so
+	// start polling fast and back off only if it is slow to come up.
+	interval := readyPollInitialInterval
+	for {
 		_, _, err := m.exec.Execute(
 			fmt.Sprintf("curl -sf http://%s/v2/ >/dev/null 2>&1", endpoint))
 		if err == nil {
 			return nil
 		}
-		time.Sleep(1 * time.Second)
+		remaining := time.Until(deadline)
+		if remaining <= 0 {
+			break
+		}
+		time.Sleep(min(interval, remaining))
+		interval = min(interval*2, readyPollMaxInterval)
 	}
 	return fmt.Errorf("registry at %s did not respond within %s", endpoint, timeout)
 }
@@ -8,8 +8,16 @@ package ssh
 import (
 	"bytes"
 	"context"
+	"errors"
 	"fmt"
+	"io"
+	"net"
 	"os"
+	"os/exec"
+	"path/filepath"
+	"strings"
+	"sync"
+	"syscall"
 	"time"
 
 	"golang.org/x/crypto/ssh"
@@ -79,11 +87,168 @@ func (c *SSHClient) ExecuteWithTimeout(ip, command string, timeout time.Duration
 	return c.ExecuteWithContext(ctx, ip, command)
 }
 
-// ExecuteWithContext executes a command with a context for cancellation
+// ExecuteWithContext executes a command with a context for cancellation.
+//
+// The underlying SSH connection is shared with every other command sent to
+// the same host with the same credentials (see getConn), so only the first
+// command pays for the TCP and SSH handshakes; later ones just open a new
+// session on it.
 func (c *SSHClient) ExecuteWithContext(ctx context.Context, ip, command string) (stdout, stderr string, err error) {
+	var stdoutBuf, stderrBuf bytes.Buffer
+	if err := c.run(ctx, ip, command, nil, &stdoutBuf, &stderrBuf); err != nil {
+		if ctx.Err() != nil {
+			return "", "", err
+		}
+		return stdoutBuf.String(), stderrBuf.String(), err
+	}
+	return stdoutBuf.String(), stderrBuf.String(), nil
+}
+
+// ExecuteStreamWithTimeout executes a command and copies its output to
+// stdout and stderr as it arrives instead of buffering it until the command
+// exits, so progress from long-running commands is visible immediately.
+// Like run, it returns only after the last write to stdout and stderr, so
+// the writers need no locking.
+func (c *SSHClient) ExecuteStreamWithTimeout(ip, command string, timeout time.Duration, stdout, stderr io.Writer) error {
+	ctx, cancel := context.WithTimeout(context.Background(), timeout)
+	defer cancel()
+
+	return c.run(ctx, ip, command, nil, stdout, stderr)
+}
+
+// ExecuteWithStdinTimeout executes a command with stdin connected to the
+// given reader. The data is streamed over the session as the command reads
+// it, so large payloads never have to fit in the command line.
+func (c *SSHClient) ExecuteWithStdinTimeout(ip, command string, stdin io.Reader, timeout time.Duration) (stdout, stderr string, err error) {
+	ctx, cancel := context.WithTimeout(context.Background(), timeout)
+	defer cancel()
+
+	var stdoutBuf, stderrBuf bytes.Buffer
+	err = c.run(ctx, ip, command, stdin, &stdoutBuf, &stderrBuf)
+	return stdoutBuf.String(), stderrBuf.String(), err
+}
+
+// run executes command on a session of the cached connection for ip,
+// feeding it stdin (if not nil) and writing its output to stdout and stderr.
+// It does not return until the session has stopped writing to them, even on
+// timeout.
+func (c *SSHClient) run(ctx context.Context, ip, command string, stdin io.Reader, stdout, stderr io.Writer) error {
+	key := c.connKey(ip)
+	client, err := c.getConn(key, ip)
+	if err != nil {
+		return err
+	}
+
+	session, err := newSession(ctx, client)
+	if err != nil {
+		if ctx.Err() != nil {
+			return fmt.Errorf("failed to create SSH session: %w", err)
+		}
+		// The cached connection may be stale (e.g. the VM rebooted). Drop it
+		// and retry once on a fresh connection.
+		dropConn(key, client)
+		if client, err = c.getConn(key, ip); err != nil {
+			return err
+		}
+		if session, err = newSession(ctx, client); err != nil {
+			dropConn(key, client)
+			return fmt.Errorf("failed to create SSH session: %w", err)
+		}
+	}
+	defer session.Close()
+
+	session.Stdin = stdin
+	session.Stdout = stdout
+	session.Stderr = stderr
+
+	// Execute command with context
+	done := make(chan error, 1)
+	go func() {
+		done <- session.Run(command)
+	}()
+
+	select {
+	case <-ctx.Done():
+		session.Signal(ssh.SIGKILL)
+		session.Close()
+		// Wait for Run, and with it the copies into stdout and stderr, so
+		// callers can read their buffers once run returns. A peer that does
+		// not answer the close is treated as gone: dropping the connection
+		// ends every channel on it.
+		select {
+		case <-done:
+		case <-time.After(sessionOpenTimeout):
+			dropConn(key, client)
+			<-done
+		}
+		return fmt.Errorf("command timed out: %w", ctx.Err())
+	case err := <-done:
+		if err != nil {
+			// A non-zero exit status leaves the connection usable; anything
+			// else (e.g. the remote end going away) means it is not.
+			var exitErr *ssh.ExitError
+			if !errors.As(err, &exitErr) {
+				dropConn(key, client)
+			}
+			return fmt.Errorf("command failed: %w", err)
+		}
+		return nil
+	}
+}
+
+// sessionOpenTimeout bounds how long opening a session on a cached
+// connection may take before the connection is considered dead.
+const sessionOpenTimeout = 5 * time.Second
+
+// conns caches open SSH connections, keyed by connKey. It plays the same role
+// as OpenSSH's ControlMaster: one TCP/SSH connection per host, many sessions.
+var conns = struct {
+	sync.Mutex
+	hosts map[string]*hostConn
+}{hosts: make(map[string]*hostConn)}
+
+// hostConn holds the shared connection for one connKey. Its mutex is held
+// while dialing so concurrent callers for the same host wait for a single
+// handshake instead of each dialing and throwing the extras away.
+type hostConn struct {
+	mu     sync.Mutex
+	client *ssh.Client
+}
+
+// connKey identifies a cached connection by user, host and credentials.
+func (c *SSHClient) connKey(ip string) string {
+	return fmt.Sprintf("%s@%s:22|%s", c.config.User, ip, c.config.KeyPath)
+}
+
+// connKeyIsHost reports whether key is a cached connection to ip.
+func connKeyIsHost(key, ip string) bool {
+	return strings.Contains(key, "@"+ip+":22|")
+}
+
+// hostConnFor returns the cache entry for key, creating it if needed.
+func hostConnFor(key string) *hostConn {
+	conns.Lock()
+	defer conns.Unlock()
+	hc, ok := conns.hosts[key]
+	if !ok {
+		hc = &hostConn{}
+		conns.hosts[key] = hc
+	}
+	return hc
+}
+
+// getConn returns the cached connection for key, dialing a new one if needed.
+func (c *SSHClient) getConn(key, ip string) (*ssh.Client, error) {
+	hc := hostConnFor(key)
+	hc.mu.Lock()
+	defer hc.mu.Unlock()
+	if hc.client != nil {
+		return hc.client, nil
+	}
+
 	authMethods, err := c.buildAuthMethods()
 	if err != nil {
-		return "", "", err
+		return nil, err
 	}
 
 	// Create SSH client config
@@ -95,41 +260,216 @@ func (c *SSHClient) ExecuteWithContext(ctx context.Context, ip, command string)
 	}
 
 	// Connect to SSH server
-	addr := fmt.Sprintf("%s:22", ip)
-	client, err := ssh.Dial("tcp", addr, sshConfig)
+	time.Sleep(dialSlots.reserve(time.Now(), c.config.GetConnectRate()))
+	client, err := ssh.Dial("tcp", sshAddr(ip), sshConfig)
 	if err != nil {
-		return "", "", fmt.Errorf("failed to dial SSH: %w", err)
+		return nil, fmt.Errorf("failed to dial SSH: %w", err)
 	}
-	defer client.Close()
+	hc.client = client
+	go keepAlive(key, client)
+	return client, nil
+}
 
-	// Create session
-	session, err := client.NewSession()
-	if err != nil {
-		return "", "", fmt.Errorf("failed to create SSH session: %w", err)
+// dialLimiter spaces out new SSH connections so that at most rate of them
+// start per second. Connections are pooled per host (see getConn), so this
+// only paces the initial fan-out and reconnects, not individual commands.
+type dialLimiter struct {
+	mu   sync.Mutex
+	next time.Time
+}
+
+// dialSlots is shared by every SSHClient, matching the process-wide pool.
+var dialSlots dialLimiter
+
+// reserve books the next dial slot at or after now and returns how long the
+// caller has to wait for it.
+func (l *dialLimiter) reserve(now time.Time, rate int) time.Duration {
+	l.mu.Lock()
+	defer l.mu.Unlock()
+
+	if l.next.Before(now) {
+		l.next = now
 	}
-	defer session.Close()
+	wait := l.next.Sub(now)
+	l.next = l.next.Add(time.Second / time.Duration(rate))
+	return wait
+}
 
-	// Capture stdout and stderr
-	var stdoutBuf, stderrBuf bytes.Buffer
-	session.Stdout = &stdoutBuf
-	session.Stderr = &stderrBuf
+const (
+	// keepaliveInterval and keepaliveMaxMissed mirror OpenSSH's
+	// ServerAliveInterval/ServerAliveCountMax for cached connections.
+	keepaliveInterval  = 15 * time.Second
+	keepaliveMaxMissed = 3
+)
 
-	// Execute command with context
-	done := make(chan error, 1)
+// keepAlive sends OpenSSH keepalive requests on client until it closes. Once
+// keepaliveMaxMissed requests in a row go unanswered the peer is treated as
+// gone and the connection is dropped, so commands running on it fail instead
+// of waiting out their full timeout on a dead VM.
+func keepAlive(key string, client *ssh.Client) {
+	closed := make(chan struct{})
 	go func() {
-		done <- session.Run(command)
+		_ = client.Wait()
+		close(closed)
 	}()
 
+	ticker := time.NewTicker(keepaliveInterval)
+	defer ticker.Stop()
+	missed := 0
+	for {
+		select {
+		case <-closed:
+			return
+		case <-ticker.C:
+		}
+
+		reply := make(chan error, 1)
+		go func() {
+			_, _, err := client.SendRequest("keepalive@openssh.com", true, nil)
+			reply <- err
+		}()
+		select {
+		case <-closed:
+			return
+		case err := <-reply:
+			if err == nil {
+				missed = 0
+				continue
+			}
+		case <-time.After(keepaliveInterval):
+		}
+
+		missed++
+		if missed >= keepaliveMaxMissed {
+			dropConn(key, client)
+			return
+		}
+	}
+}
+
+// dropConn closes client and removes it from the cache if it is still the
+// cached connection for key.
+func dropConn(key string, client *ssh.Client) {
+	hc := hostConnFor(key)
+	hc.mu.Lock()
+	if hc.client == client {
+		hc.client = nil
+	}
+	hc.mu.Unlock()
+	client.Close()
+}
+
+// CloseHostConnections closes the cached connections to ip. Callers use it
+// when they know the host is going away (reboot, shutdown, delete) so the next
+// command dials a fresh connection instead of first stalling on the dead one.
+//
+// The pool lock is only held to find the host's entries: closing a client
+// may wait for a dial in progress, and stopping the OpenSSH masters runs
+// subprocesses, neither of which should stall other hosts' commands.
+func CloseHostConnections(ip string) {
+	var hosts []*hostConn
+	conns.Lock()
+	for key, hc := range conns.hosts {
+		if connKeyIsHost(key, ip) {
+			hosts = append(hosts, hc)
+		}
+	}
+	conns.Unlock()
+
+	for _, hc := range hosts {
+		hc.mu.Lock()
+		if hc.client != nil {
+			hc.client.Close()
+			hc.client = nil
+		}
+		hc.mu.Unlock()
+	}
+	stopMuxMasters(ip)
+}
+
+// CloseAllConnections closes every cached SSH connection.
+//
+// Entries are emptied rather than removed from the pool: a getConn already
+// holding one may be about to store a freshly dialed client in it, and an
+// entry gone from the map would leave that client (and its keepalive)
+// where nothing could close it.
+func CloseAllConnections() {
+	conns.Lock()
+	hosts := make([]*hostConn, 0, len(conns.hosts))
+	for _, hc := range conns.hosts {
+		hosts = append(hosts, hc)
+	}
+	conns.Unlock()
+
+	for _, hc := range hosts {
+		hc.mu.Lock()
+		if hc.client != nil {
+			hc.client.Close()
+			hc.client = nil
+		}
+		hc.mu.Unlock()
+	}
+}
+
+// newSession opens a session on client. A cached connection whose peer went
+// away silently can block NewSession indefinitely, so after
+// sessionOpenTimeout the connection is closed to unblock it.
+func newSession(ctx context.Context, client *ssh.Client) (*ssh.Session, error) {
+	type result struct {
+		session *ssh.Session
+		err     error
+	}
+	done := make(chan result, 1)
+	go func() {
+		session, err := client.NewSession()
+		done <- result{session, err}
+	}()
+
+	timer := time.NewTimer(sessionOpenTimeout)
+	defer timer.Stop()
+
 	select {
+	case r := <-done:
+		return r.session, r.err
 	case <-ctx.Done():
-		session.Signal(ssh.SIGKILL)
-		return "", "", fmt.Errorf("command timed out: %w", ctx.Err())
-	case err := <-done:
-		if err != nil {
-			return stdoutBuf.String(), stderrBuf.String(), fmt.Errorf("command failed: %w", err)
-		}
-		return stdoutBuf.String(), stderrBuf.String(), nil
+		// The connection may be fine; just make sure a late session is
+		// not leaked.
+		go func() {
+			if r := <-done; r.session != nil {
+				r.session.Close()
+			}
+		}()
+		return nil, ctx.Err()
+	case <-timer.C:
+		client.Close()
+		return nil, fmt.Errorf("timed out opening SSH session")
+	}
+}
+
+const (
+	// sshPollInitialInterval and sshPollMaxInterval bound the backoff used
+	// by WaitForSSH between connection attempts.
+	sshPollInitialInterval = 100 * time.Millisecond
+	sshPollMaxInterval     = 2 * time.Second
+
+	// sshPortProbeTimeout bounds the plain TCP connect WaitForSSH uses to
+	// check that sshd is listening before attempting a full handshake.
+	sshPortProbeTimeout = time.Second
+)
+
+// sshAddr returns the host:port sshd listens on for ip.
+func sshAddr(ip string) string {
+	return net.JoinHostPort(ip, "22")
+}
+
+// sshPortOpen reports whether a TCP connection to sshd on ip succeeds.
+func sshPortOpen(ip string) bool {
+	conn, err := net.DialTimeout("tcp", sshAddr(ip), sshPortProbeTimeout)
+	if err != nil {
+		return false
 	}
+	conn.Close()
+	return true
 }
 
 // WaitForSSH waits for SSH to become available on a host
@@ -137,20 +477,108 @@ func (c *SSHClient) WaitForSSH(ip string, timeout time.Duration) error {
 	ctx, cancel := context.WithTimeout(context.Background(), timeout)
 	defer cancel()
 
-	ticker := time.NewTicker(2 * time.Second)
-	defer ticker.Stop()
-
+	// Probe immediately, then back off up to sshPollMaxInterval between
+	// attempts so a host that is already up doesn't pay a fixed delay.
+	// A cheap TCP connect gates each attempt so the SSH handshake and
+	// authentication are only spent once sshd is actually listening.
+	interval := sshPollInitialInterval
 	for {
+		if sshPortOpen(ip) {
+			if _, _, err := c.ExecuteWithTimeout(ip, "echo test", 10*time.Second); err == nil {
+				return nil
+			}
+		}
+
+		timer := time.NewTimer(interval)
 		select {
 		case <-ctx.Done():
+			timer.Stop()
 			return fmt.Errorf("timeout waiting for SSH on %s: %w", ip, ctx.Err())
-		case <-ticker.C:
-			_, _, err := c.ExecuteWithTimeout(ip, "echo test", 10*time.Second)
-			if err == nil {
-				return nil
-			}
-			// Continue waiting
+		case <-timer.C:
 		}
+		interval = min(interval*3/2, sshPollMaxInterval)
+	}
+}
+
+// SSHMuxDisableEnv, when set to any non-empty value, turns off OpenSSH
+// connection multiplexing in commands built by BuildSSHCommand.
+const SSHMuxDisableEnv = "DPU_SIM_DISABLE_SSH_MUX"
+
+// sshMuxOptions returns OpenSSH options that share one master connection per
+// local user, remote user, host and port across ssh invocations, the
+// subprocess counterpart of the in-process connection cache. The master
+// lingers for ControlPersist after the last session closes so back-to-back
+// commands skip the handshake.
+func sshMuxOptions() []string {
+	if os.Getenv(SSHMuxDisableEnv) != "" {
+		return nil
+	}
+	controlPath, err := muxControlPath("%r", "%h", "%p")
+	if err != nil {
+		// Without a private socket directory, run without multiplexing.
+		return nil
+	}
+	return []string{
+		"-o", "ControlMaster=auto",
+		"-o", "ControlPath=" + controlPath,
+		"-o", "ControlPersist=10m",
+	}
+}
+
+// muxDir returns the directory holding this user's OpenSSH master sockets,
+// creating it if needed. It must be private: anyone able to create a socket
+// in it could have ssh run over their own "master" connection, so a
+// directory not owned by the user or open to others is refused.
+func muxDir() (string, error) {
+	cacheDir, err := os.UserCacheDir()
+	if err != nil {
+		return "", fmt.Errorf("failed to find cache directory: %w", err)
+	}
+	dir := filepath.Join(cacheDir, "dpu-sim", "ssh-mux")
+	if err := os.MkdirAll(dir, 0o700); err != nil {
+		return "", fmt.Errorf("failed to create %s: %w", dir, err)
+	}
+	info, err := os.Lstat(dir)
+	if err != nil {
+		return "", fmt.Errorf("failed to stat %s: %w", dir, err)
+	}
+	st, ok := info.Sys().(*syscall.Stat_t)
+	if !info.IsDir() || !ok || int(st.Uid) != os.Getuid() {
+		return "", fmt.Errorf("%s is not a directory owned by the current user", dir)
+	}
+	if info.Mode().Perm() != 0o700 {
+		return "", fmt.Errorf("%s has mode %o, want 700", dir, info.Mode().Perm())
+	}
+	return dir, nil
+}
+
+// muxControlPath returns the ControlPath of an OpenSSH master. The arguments
+// are either ssh tokens (%r, %h, %p) or glob patterns.
+func muxControlPath(user, host, port string) (string, error) {
+	dir, err := muxDir()
+	if err != nil {
+		return "", err
+	}
+	return filepath.Join(dir, fmt.Sprintf("%s@%s:%s", user, host, port)), nil
+}
+
+// stopMuxMasters asks any OpenSSH master connected to ip to exit. A master
+// to a host that was deleted or rebooted would otherwise linger for
+// ControlPersist and stall the next ssh until its keepalives give up.
+func stopMuxMasters(ip string) {
+	pattern, err := muxControlPath("*", ip, "*")
+	if err != nil {
+		return
+	}
+	sockets, err := filepath.Glob(pattern)
+	if err != nil {
+		return
+	}
+	for _, socket := range sockets {
+		ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
+		// Best effort: a stale socket whose master already died just fails.
+		_ = exec.CommandContext(ctx, "ssh", "-o", "ControlPath="+socket, "-O", "exit", ip).Run()
+		cancel()
 	}
 }
 
@@ -163,8 +591,11 @@ func BuildSSHCommand(cfg *config.SSHConfig, ip, command string) []string {
 		"-o", "UserKnownHostsFile=/dev/null",
 		"-o", "LogLevel=ERROR",
 		"-o", "ConnectTimeout=5",
-		fmt.Sprintf("%s@%s", cfg.User, ip),
+		"-o", fmt.Sprintf("ServerAliveInterval=%d", int(keepaliveInterval/time.Second)),
+		"-o", fmt.Sprintf("ServerAliveCountMax=%d", keepaliveMaxMissed),
 	}
+	cmd = append(cmd, sshMuxOptions()...)
+	cmd = append(cmd, fmt.Sprintf("%s@%s", cfg.User, ip))
 
 	if cfg.KeyPath != "" {
 		cmd = append([]string{"ssh", "-i", cfg.KeyPath}, cmd[1:]...)
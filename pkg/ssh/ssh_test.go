@@ -1,7 +1,10 @@
 package ssh
 
 import (
+	"os"
+	"path/filepath"
 	"testing"
+	"time"
 
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
 	"github.com/stretchr/testify/assert"
@@ -19,7 +22,87 @@ func TestNewClient(t *testing.T) {
 	assert.Equal(t, cfg, client.config)
 }
 
+func TestConnKey(t *testing.T) {
+	root := NewSSHClient(&config.SSHConfig{User: "root", KeyPath: "/keys/a"})
+	rootAgain := NewSSHClient(&config.SSHConfig{User: "root", KeyPath: "/keys/a"})
+	otherUser := NewSSHClient(&config.SSHConfig{User: "core", KeyPath: "/keys/a"})
+	otherKey := NewSSHClient(&config.SSHConfig{User: "root", KeyPath: "/keys/b"})
+
+	// Clients with the same credentials share a connection per host.
+	assert.Equal(t, root.connKey("192.168.1.10"), rootAgain.connKey("192.168.1.10"))
+	assert.NotEqual(t, root.connKey("192.168.1.10"), root.connKey("192.168.1.11"))
+	assert.NotEqual(t, root.connKey("192.168.1.10"), otherUser.connKey("192.168.1.10"))
+	assert.NotEqual(t, root.connKey("192.168.1.10"), otherKey.connKey("192.168.1.10"))
+
+	assert.True(t, connKeyIsHost(root.connKey("192.168.1.10"), "192.168.1.10"))
+	assert.True(t, connKeyIsHost(otherUser.connKey("192.168.1.10"), "192.168.1.10"))
+	assert.False(t, connKeyIsHost(root.connKey("192.168.1.100"), "192.168.1.10"))
+	assert.False(t, connKeyIsHost(root.connKey("192.168.1.10"), "2.168.1.10"))
+}
+
+func TestCloseHostConnectionsDoesNotBlockPool(t *testing.T) {
+	t.Setenv("XDG_CACHE_HOME", t.TempDir())
+	client := NewSSHClient(&config.SSHConfig{User: "root", KeyPath: "/keys/a"})
+	busy := hostConnFor(client.connKey("192.0.2.10"))
+	// Hold the entry's lock as a dial in progress would.
+	busy.mu.Lock()
+
+	closed := make(chan struct{})
+	go func() {
+		CloseHostConnections("192.0.2.10")
+		close(closed)
+	}()
+	// Let CloseHostConnections reach the busy entry before probing the pool.
+	time.Sleep(100 * time.Millisecond)
+
+	other := make(chan struct{})
+	go func() {
+		hostConnFor(client.connKey("192.0.2.11"))
+		close(other)
+	}()
+	select {
+	case <-other:
+	case <-time.After(5 * time.Second):
+		t.Fatal("pool lock held while waiting on another host's connection")
+	}
+
+	busy.mu.Unlock()
+	<-closed
+}
+
+func TestCloseAllConnectionsKeepsPoolEntries(t *testing.T) {
+	client := NewSSHClient(&config.SSHConfig{User: "root", KeyPath: "/keys/a"})
+	hc := hostConnFor(client.connKey("192.0.2.20"))
+
+	CloseAllConnections()
+
+	// A getConn holding hc keeps dialing into an entry the pool still owns.
+	assert.Same(t, hc, hostConnFor(client.connKey("192.0.2.20")))
+	assert.Nil(t, hc.client)
+}
+
+func TestSSHAddr(t *testing.T) {
+	assert.Equal(t, "192.168.1.10:22", sshAddr("192.168.1.10"))
+	assert.Equal(t, "[fd00::10]:22", sshAddr("fd00::10"))
+}
+
+func TestDialLimiterSpacesConnections(t *testing.T) {
+	var l dialLimiter
+	now := time.Now()
+
+	assert.Zero(t, l.reserve(now, 10))
+	assert.Equal(t, 100*time.Millisecond, l.reserve(now, 10))
+	assert.Equal(t, 200*time.Millisecond, l.reserve(now, 10))
+
+	// Idle time is not banked: after a pause the next dial goes straight out.
+	later := now.Add(5 * time.Second)
+	assert.Zero(t, l.reserve(later, 10))
+	assert.Equal(t, 100*time.Millisecond, l.reserve(later, 10))
+}
+
 func TestBuildSSHCommand(t *testing.T) {
+	t.Setenv(SSHMuxDisableEnv, "1")
+
 	cfg := &config.SSHConfig{
 		User:    "root",
 		KeyPath: "/home/user/.ssh/id_rsa",
@@ -42,6 +125,8 @@ func TestBuildSSHCommand(t *testing.T) {
 				"-o", "UserKnownHostsFile=/dev/null",
 				"-o", "LogLevel=ERROR",
 				"-o", "ConnectTimeout=5",
+				"-o", "ServerAliveInterval=15",
+				"-o", "ServerAliveCountMax=3",
 				"root@192.168.1.100",
 			},
 		},
@@ -56,6 +141,8 @@ func TestBuildSSHCommand(t *testing.T) {
 				"-o", "UserKnownHostsFile=/dev/null",
 				"-o", "LogLevel=ERROR",
 				"-o", "ConnectTimeout=5",
+				"-o", "ServerAliveInterval=15",
+				"-o", "ServerAliveCountMax=3",
 				"root@192.168.1.100",
 				"ls -la",
 			},
@@ -70,6 +157,53 @@ func TestBuildSSHCommand(t *testing.T) {
 	}
 }
 
+func TestBuildSSHCommandMultiplexes(t *testing.T) {
+	t.Setenv(SSHMuxDisableEnv, "")
+	t.Setenv("XDG_CACHE_HOME", t.TempDir())
+
+	cmd := BuildSSHCommand(&config.SSHConfig{User: "root"}, "192.168.1.100", "")
+	assert.Contains(t, cmd, "ControlMaster=auto")
+	assert.Contains(t, cmd, "ControlPersist=10m")
+	assert.Equal(t, "root@192.168.1.100", cmd[len(cmd)-1])
+}
+
+func TestMuxControlPathGlob(t *testing.T) {
+	t.Setenv("XDG_CACHE_HOME", t.TempDir())
+
+	path, err := muxControlPath("root", "192.168.1.10", "22")
+	assert.NoError(t, err)
+
+	pattern, err := muxControlPath("*", "192.168.1.10", "*")
+	assert.NoError(t, err)
+	matched, err := filepath.Match(pattern, path)
+	assert.NoError(t, err)
+	assert.True(t, matched)
+
+	pattern, err = muxControlPath("*", "192.168.1.1", "*")
+	assert.NoError(t, err)
+	matched, err = filepath.Match(pattern, path)
+	assert.NoError(t, err)
+	assert.False(t, matched)
+}
+
+func TestMuxDirIsPrivate(t *testing.T) {
+	cacheDir := t.TempDir()
+	t.Setenv("XDG_CACHE_HOME", cacheDir)
+
+	dir, err := muxDir()
+	assert.NoError(t, err)
+	assert.Equal(t, filepath.Join(cacheDir, "dpu-sim", "ssh-mux"), dir)
+	info, err := os.Stat(dir)
+	assert.NoError(t, err)
+	assert.Equal(t, os.FileMode(0o700), info.Mode().Perm())
+
+	// A directory others can write to is refused rather than used.
+	assert.NoError(t, os.Chmod(dir, 0o777))
+	_, err = muxDir()
+	assert.Error(t, err)
+	assert.Nil(t, sshMuxOptions())
+}
+
 func TestBuildAuthMethods(t *testing.T) {
 	t.Run("password only", func(t *testing.T) {
 		cfg := &config.SSHConfig{User: "root", Password: "secret"}
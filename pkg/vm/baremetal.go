@@ -8,6 +8,7 @@ import (
 
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/log"
+	"github.com/ovn-kubernetes/dpu-simulator/pkg/network"
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/platform"
 )
 
@@ -196,6 +197,9 @@ func (m *VMManager) maybeApplyBootc(node config.BareMetalConfig, cmdExec platfor
 			}
 			wait = parsed
 		}
+		// The node rebooted into a new image: its pooled connection is dead
+		// and the cached distro/sudo probes may no longer hold.
+		platform.ForgetSSHHost(node.MgmtIP)
 		reconnect := m.globalSSHExecutor(node.MgmtIP)
 		if reconnectErr := reconnect.WaitUntilReady(wait); reconnectErr != nil {
 			return fmt.Errorf("node %s did not come back after bootc apply reboot: %w", node.Name, reconnectErr)
@@ -353,64 +357,67 @@ func (m *VMManager) setKubeletNodeIP(node config.BareMetalConfig, cmdExec platfo
 }
 
 func (m *VMManager) detectHostEgressTo(ip string) (*hostEgressInfo, error) {
-	local := platform.NewLocalExecutor()
-	cmd := fmt.Sprintf("ip -4 route get %s | awk '{for(i=1;i<=NF;i++){if($i==\"dev\")dev=$(i+1); if($i==\"src\")src=$(i+1)}} END{print dev,src}'", shellQuote(ip))
-	stdout, stderr, err := local.ExecuteWithTimeout(cmd, 30*time.Second)
+	route, err := network.GetRouteTo(platform.NewLocalExecutor(), ip)
 	if err != nil {
-		return nil, fmt.Errorf("failed to detect host egress route to %s: %w, stderr: %s", ip, err, stderr)
+		return nil, fmt.Errorf("failed to detect host egress route to %s: %w", ip, err)
 	}
-
-	fields := strings.Fields(strings.TrimSpace(stdout))
-	if len(fields) < 2 {
-		return nil, fmt.Errorf("failed to parse host egress route to %s from output %q", ip, stdout)
+	if route.PrefSrc == "" {
+		return nil, fmt.Errorf("failed to detect host egress route to %s: no source address in route via %s", ip, route.Dev)
 	}
 
-	return &hostEgressInfo{iface: fields[0], ip: fields[1]}, nil
+	return &hostEgressInfo{iface: route.Dev, ip: route.PrefSrc}, nil
 }
 
 func getRouteDevice(cmdExec platform.CommandExecutor, ip string) (string, error) {
-	cmd := fmt.Sprintf("ip -4 route get %s | awk '{for(i=1;i<=NF;i++){if($i==\"dev\"){print $(i+1); exit}}}'", shellQuote(ip))
-	stdout, stderr, err := cmdExec.ExecuteWithTimeout(cmd, 30*time.Second)
+	route, err := network.GetRouteTo(cmdExec, ip)
 	if err != nil {
-		return "", fmt.Errorf("failed to detect route device to %s: %w, stderr: %s", ip, err, stderr)
+		return "", fmt.Errorf("failed to detect route device to %s: %w", ip, err)
 	}
-	return strings.TrimSpace(stdout), nil
+	return route.Dev, nil
 }
 
-func ensureForwardRule(local *platform.LocalExecutor, inIface, outIface, src, dst string) error {
-	script := strings.Builder{}
-	script.WriteString("set -e\n")
-	script.WriteString("sudo iptables -C FORWARD")
-	if inIface != "" {
-		script.WriteString(" -i " + shellQuote(inIface))
-	}
-	if outIface != "" {
-		script.WriteString(" -o " + shellQuote(outIface))
-	}
-	if src != "" {
-		script.WriteString(" -s " + shellQuote(src))
-	}
-	if dst != "" {
-		script.WriteString(" -d " + shellQuote(dst))
+// forwardRule is an ACCEPT rule in the host FORWARD chain. Empty fields are
+// left out of the match.
+type forwardRule struct {
+	inIface, outIface, src, dst string
+}
+
+// match returns the iptables match arguments for the rule.
+func (r forwardRule) match() string {
+	sb := strings.Builder{}
+	if r.inIface != "" {
+		sb.WriteString(" -i " + shellQuote(r.inIface))
 	}
-	script.WriteString(" -j ACCEPT || sudo iptables -I FORWARD 1")
-	if inIface != "" {
-		script.WriteString(" -i " + shellQuote(inIface))
+	if r.outIface != "" {
+		sb.WriteString(" -o " + shellQuote(r.outIface))
 	}
-	if outIface != "" {
-		script.WriteString(" -o " + shellQuote(outIface))
+	if r.src != "" {
+		sb.WriteString(" -s " + shellQuote(r.src))
 	}
-	if src != "" {
-		script.WriteString(" -s " + shellQuote(src))
+	if r.dst != "" {
+		sb.WriteString(" -d " + shellQuote(r.dst))
 	}
-	if dst != "" {
-		script.WriteString(" -d " + shellQuote(dst))
+	return sb.String()
+}
+
+// forwardRulesScript returns a script that inserts each rule at the top of
+// the FORWARD chain unless an identical rule already exists.
+func forwardRulesScript(rules []forwardRule) string {
+	script := strings.Builder{}
+	script.WriteString("set -e\n")
+	for _, r := range rules {
+		match := r.match()
+		fmt.Fprintf(&script, "sudo iptables -C FORWARD%s -j ACCEPT || sudo iptables -I FORWARD 1%s -j ACCEPT\n", match, match)
 	}
-	script.WriteString(" -j ACCEPT\n")
+	return script.String()
+}
 
-	stdout, stderr, err := local.ExecuteWithTimeout(script.String(), 30*time.Second)
+// ensureForwardRules makes sure every rule is present, using one shell
+// invocation for the whole set rather than one per rule.
+func ensureForwardRules(local *platform.LocalExecutor, rules ...forwardRule) error {
+	stdout, stderr, err := local.ExecuteWithTimeout(forwardRulesScript(rules), 30*time.Second)
 	if err != nil {
-		return fmt.Errorf("failed to ensure FORWARD rule in=%s out=%s src=%s dst=%s: %w, stdout: %s, stderr: %s", inIface, outIface, src, dst, err, stdout, stderr)
+		return fmt.Errorf("failed to ensure FORWARD rules %+v: %w, stdout: %s, stderr: %s", rules, err, stdout, stderr)
 	}
 
 	return nil
@@ -439,29 +446,20 @@ func (m *VMManager) ensureHybridNetworking(node config.BareMetalConfig, firstMas
 		return fmt.Errorf("failed to enable net.ipv4.ip_forward on host: %w", err)
 	}
 
-	if err := ensureForwardRule(local, egress.iface, mgmtNet.BridgeName, "", mgmtSubnet); err != nil {
-		return err
-	}
-	if err := ensureForwardRule(local, mgmtNet.BridgeName, egress.iface, mgmtSubnet, ""); err != nil {
-		return err
-	}
-	if err := ensureForwardRule(local, egress.iface, k8sNet.BridgeName, "", k8sSubnet); err != nil {
-		return err
-	}
-	if err := ensureForwardRule(local, k8sNet.BridgeName, egress.iface, k8sSubnet, ""); err != nil {
-		return err
-	}
-
-	// Also allow explicit host forwarding between this baremetal node and the
-	// cluster k8s subnet regardless of ingress interface naming/topology.
-	// This prevents libvirt/firewalld chains from rejecting packets sourced from
-	// external baremetal subnets (for example 172.22.0.0/16) destined to VM k8s
-	// network addresses (for example 192.168.123.0/24).
 	nodeCIDR := fmt.Sprintf("%s/32", node.MgmtIP)
-	if err := ensureForwardRule(local, "", "", nodeCIDR, k8sSubnet); err != nil {
-		return err
-	}
-	if err := ensureForwardRule(local, "", "", k8sSubnet, nodeCIDR); err != nil {
+	if err := ensureForwardRules(local,
+		forwardRule{inIface: egress.iface, outIface: mgmtNet.BridgeName, dst: mgmtSubnet},
+		forwardRule{inIface: mgmtNet.BridgeName, outIface: egress.iface, src: mgmtSubnet},
+		forwardRule{inIface: egress.iface, outIface: k8sNet.BridgeName, dst: k8sSubnet},
+		forwardRule{inIface: k8sNet.BridgeName, outIface: egress.iface, src: k8sSubnet},
+		// Also allow explicit host forwarding between this baremetal node and the
+		// cluster k8s subnet regardless of ingress interface naming/topology.
+		// This prevents libvirt/firewalld chains from rejecting packets sourced from
+		// external baremetal subnets (for example 172.22.0.0/16) destined to VM k8s
+		// network addresses (for example 192.168.123.0/24).
+		forwardRule{src: nodeCIDR, dst: k8sSubnet},
+		forwardRule{src: k8sSubnet, dst: nodeCIDR},
+	); err != nil {
 		return err
 	}
 
@@ -103,3 +103,23 @@ func TestIsExpectedBootcApplyDisconnect(t *testing.T) {
 		})
 	}
 }
+
+// TestForwardRulesScriptChecksBeforeInserting verifies every rule is emitted
+// as an idempotent check-or-insert line in a single set -e script.
+func TestForwardRulesScriptChecksBeforeInserting(t *testing.T) {
+	t.Parallel()
+
+	script := forwardRulesScript([]forwardRule{
+		{inIface: "eno1", outIface: "virbr-mgmt", dst: "192.168.120.0/24"},
+		{src: "172.22.0.10/32", dst: "192.168.123.0/24"},
+	})
+
+	want := "set -e\n" +
+		"sudo iptables -C FORWARD -i 'eno1' -o 'virbr-mgmt' -d '192.168.120.0/24' -j ACCEPT || " +
+		"sudo iptables -I FORWARD 1 -i 'eno1' -o 'virbr-mgmt' -d '192.168.120.0/24' -j ACCEPT\n" +
+		"sudo iptables -C FORWARD -s '172.22.0.10/32' -d '192.168.123.0/24' -j ACCEPT || " +
+		"sudo iptables -I FORWARD 1 -s '172.22.0.10/32' -d '192.168.123.0/24' -j ACCEPT\n"
+	if script != want {
+		t.Fatalf("unexpected script:\ngot:  %q\nwant: %q", script, want)
+	}
+}
@@ -8,6 +8,8 @@ import (
 	"path/filepath"
 	"strings"
 
+	"golang.org/x/sync/errgroup"
+
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/log"
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/network"
@@ -22,38 +24,110 @@ func (m *VMManager) CreateVM(vmCfg config.VMConfig) error {
 		return fmt.Errorf("VM %s already exists", vmCfg.Name)
 	}
 
-	imagePath := GetImagePath(m.config.OperatingSystem)
+	inputs, err := m.loadVMBuildInputs()
+	if err != nil {
+		return err
+	}
+
+	assets, err := m.prepareVMAssets(vmCfg, inputs)
+	if err != nil {
+		return err
+	}
+
+	return m.defineAndStartVM(vmCfg, assets)
+}
+
+// vmBuildInputs holds the host-side inputs shared by every VM: the base cloud
+// image and the VM-independent part of the cloud-init user-data.
+type vmBuildInputs struct {
+	imagePath        string
+	imageVirtualSize int64
+	userDataHeader   string
+}
+
+// loadVMBuildInputs ensures the base cloud image is present and reads the
+// inputs shared by all VMs, so creating N VMs does the work once rather than N
+// times.
+func (m *VMManager) loadVMBuildInputs() (vmBuildInputs, error) {
+	inputs := vmBuildInputs{imagePath: GetImagePath(m.config.OperatingSystem)}
 
-	if err := EnsureCloudImage(m.hostExec, m.config.OperatingSystem, imagePath); err != nil {
-		return fmt.Errorf("failed to ensure cloud image: %w", err)
+	// A saved Kubernetes-ready image for this config replaces the cloud
+	// image, so the install step later only has to verify dependencies.
+	if golden, ok := m.cachedGoldenImage(); ok {
+		log.Info("Using Kubernetes-ready base image %s", golden)
+		inputs.imagePath = golden
+	} else if err := EnsureCloudImage(m.hostExec, m.config.OperatingSystem, inputs.imagePath); err != nil {
+		return inputs, fmt.Errorf("failed to ensure cloud image: %w", err)
 	}
 
-	diskPath, err := CreateVMDisk(m.hostExec, vmCfg.Name, vmCfg.DiskSize, imagePath)
+	// Disks and cloud-init ISOs for every VM land here; create it once.
+	if err := os.MkdirAll(DefaultImageDir, 0o755); err != nil {
+		return inputs, fmt.Errorf("failed to create image directory: %w", err)
+	}
+
+	size, err := imageVirtualSizeBytes(m.hostExec, inputs.imagePath)
+	if err != nil {
+		return inputs, fmt.Errorf("failed to inspect base image size %s: %w", inputs.imagePath, err)
+	}
+	inputs.imageVirtualSize = size
+
+	pubKey, err := readSSHPublicKey(m.config.SSH)
 	if err != nil {
-		return fmt.Errorf("failed to create VM disk: %w", err)
+		return inputs, err
 	}
+	inputs.userDataHeader = generateUserDataHeader(pubKey, m.config.SSH.User, m.config.SSH.Password)
+
+	return inputs, nil
+}
+
+// vmAssets holds the host-side files a VM domain is defined against.
+type vmAssets struct {
+	diskPath      string
+	cloudInitPath string
+	nvramPath     string
+}
+
+// prepareVMAssets creates the overlay disk, cloud-init ISO and (when UEFI is
+// used) NVRAM file for a VM. It only touches files named after the VM, so it
+// is safe to run for several VMs concurrently.
+func (m *VMManager) prepareVMAssets(vmCfg config.VMConfig, inputs vmBuildInputs) (vmAssets, error) {
+	var assets vmAssets
+	var err error
 
-	cloudInitPath, err := CreateCloudInitISO(m.hostExec, m.config.SSH, vmCfg, m.config)
+	assets.diskPath, err = createVMDisk(m.hostExec, vmCfg.Name, vmCfg.DiskSize, inputs.imagePath, inputs.imageVirtualSize)
 	if err != nil {
-		return fmt.Errorf("failed to create cloud-init ISO: %w", err)
+		return assets, fmt.Errorf("failed to create VM disk: %w", err)
+	}
+
+	assets.cloudInitPath, err = createCloudInitISO(m.hostExec, inputs.userDataHeader, vmCfg, m.config)
+	if err != nil {
+		return assets, fmt.Errorf("failed to create cloud-init ISO: %w", err)
 	}
 
 	spec := m.hostSpec
-	var nvramPath string
 	if m.hostDistro.Architecture == platform.AARCH64 && (spec.uefiLoader == "" || spec.uefiVarsTemplate == "") {
-		return fmt.Errorf("missing aarch64 UEFI firmware: install edk2/aavmf and ensure QEMU_EFI-pflash and vars template are available")
+		return assets, fmt.Errorf("missing aarch64 UEFI firmware: install edk2/aavmf and ensure QEMU_EFI-pflash and vars template are available")
 	}
 	if spec.uefiLoader != "" && spec.uefiVarsTemplate != "" {
-		nvramPath, err = ensureUEFINvram(vmCfg.Name, spec.uefiVarsTemplate)
+		assets.nvramPath, err = ensureUEFINvram(vmCfg.Name, spec.uefiVarsTemplate)
 		if err != nil {
-			return fmt.Errorf("failed to prepare UEFI NVRAM: %w", err)
+			return assets, fmt.Errorf("failed to prepare UEFI NVRAM: %w", err)
 		}
 	}
 
+	return assets, nil
+}
+
+// defineAndStartVM defines the libvirt domain for a VM and starts it.
+func (m *VMManager) defineAndStartVM(vmCfg config.VMConfig, assets vmAssets) error {
 	// Generate libvirt domain XML
-	xml := m.GenerateVMXML(vmCfg, diskPath, cloudInitPath, spec, nvramPath)
+	xml := m.GenerateVMXML(vmCfg, assets.diskPath, assets.cloudInitPath, m.hostSpec, assets.nvramPath)
 
-	domain, err := m.conn.DomainDefineXML(xml)
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return fmt.Errorf("failed to define domain: %w", err)
+	}
+	domain, err := conn.DomainDefineXML(xml)
 	if err != nil {
 		return fmt.Errorf("failed to define domain: %w", err)
 	}
@@ -71,9 +145,9 @@ func (m *VMManager) CreateVM(vmCfg config.VMConfig) error {
 	return nil
 }
 
-func (m *VMManager) generateNetworkInterfaces(vmCfg config.VMConfig) string {
-	var sb strings.Builder
-
+// writeNetworkInterfaces writes an interface element for every configured
+// network the VM is attached to.
+func (m *VMManager) writeNetworkInterfaces(sb *strings.Builder, vmCfg config.VMConfig) {
 	for _, network := range m.config.Networks {
 		// AttachTo determines which type of VM the network should be attached to.
 		if network.AttachTo != "any" && network.AttachTo != vmCfg.Type {
@@ -84,16 +158,25 @@ func (m *VMManager) generateNetworkInterfaces(vmCfg config.VMConfig) string {
 			mac = vmCfg.K8sNodeMAC
 		}
 		sb.WriteString("    <interface type='network'>\n")
-		sb.WriteString(fmt.Sprintf("      <mac address='%s'/>\n", mac))
-		sb.WriteString(fmt.Sprintf("      <source network='%s'/>\n", network.Name))
+		fmt.Fprintf(sb, "      <mac address='%s'/>\n", mac)
+		fmt.Fprintf(sb, "      <source network='%s'/>\n", network.Name)
 		if network.UseOVS {
 			sb.WriteString("      <virtualport type='openvswitch'/>\n")
 		}
-		sb.WriteString(fmt.Sprintf("      <model type='%s'/>\n", network.NICModel))
+		fmt.Fprintf(sb, "      <model type='%s'/>\n", network.NICModel)
 		sb.WriteString("    </interface>\n")
 	}
+}
 
-	return sb.String()
+// writeHostToDPUInterface writes the libvirt interface element for one
+// host-to-DPU channel.
+func writeHostToDPUInterface(sb *strings.Builder, mac, netName, nicModel string) {
+	sb.WriteString("    <interface type='network'>\n")
+	fmt.Fprintf(sb, "      <mac address='%s'/>\n", mac)
+	fmt.Fprintf(sb, "      <source network='%s'/>\n", netName)
+	sb.WriteString("      <virtualport type='openvswitch'/>\n")
+	fmt.Fprintf(sb, "      <model type='%s'/>\n", nicModel)
+	sb.WriteString("    </interface>\n")
 }
 
 type archSpec struct {
@@ -294,16 +377,16 @@ func (m *VMManager) GenerateVMXML(vmCfg config.VMConfig, diskPath, cloudInitPath
 	var sb strings.Builder
 
 	sb.WriteString("<domain type='kvm'>\n")
-	sb.WriteString(fmt.Sprintf("  <name>%s</name>\n", vmCfg.Name))
-	sb.WriteString(fmt.Sprintf("  <memory unit='MiB'>%d</memory>\n", vmCfg.Memory))
-	sb.WriteString(fmt.Sprintf("  <vcpu>%d</vcpu>\n", vmCfg.VCPUs))
+	fmt.Fprintf(&sb, "  <name>%s</name>\n", vmCfg.Name)
+	fmt.Fprintf(&sb, "  <memory unit='MiB'>%d</memory>\n", vmCfg.Memory)
+	fmt.Fprintf(&sb, "  <vcpu>%d</vcpu>\n", vmCfg.VCPUs)
 
 	sb.WriteString("  <os>\n")
-	sb.WriteString(fmt.Sprintf("    <type arch='%s' machine='%s'>hvm</type>\n", spec.libvirtArch, spec.machine))
+	fmt.Fprintf(&sb, "    <type arch='%s' machine='%s'>hvm</type>\n", spec.libvirtArch, spec.machine)
 	if spec.uefiLoader != "" {
-		sb.WriteString(fmt.Sprintf("    <loader readonly='yes' type='pflash'>%s</loader>\n", spec.uefiLoader))
+		fmt.Fprintf(&sb, "    <loader readonly='yes' type='pflash'>%s</loader>\n", spec.uefiLoader)
 		if nvramPath != "" {
-			sb.WriteString(fmt.Sprintf("    <nvram>%s</nvram>\n", nvramPath))
+			fmt.Fprintf(&sb, "    <nvram>%s</nvram>\n", nvramPath)
 		}
 	}
 	sb.WriteString("    <boot dev='hd'/>\n")
@@ -320,7 +403,7 @@ func (m *VMManager) GenerateVMXML(vmCfg config.VMConfig, diskPath, cloudInitPath
 	sb.WriteString("  </features>\n")
 
 	if spec.cpuMode != "" {
-		sb.WriteString(fmt.Sprintf("  <cpu mode='%s'/>\n", spec.cpuMode))
+		fmt.Fprintf(&sb, "  <cpu mode='%s'/>\n", spec.cpuMode)
 	}
 
 	if spec.enableIOMMU {
@@ -336,17 +419,17 @@ func (m *VMManager) GenerateVMXML(vmCfg config.VMConfig, diskPath, cloudInitPath
 	sb.WriteString("  <on_crash>destroy</on_crash>\n")
 
 	sb.WriteString("  <devices>\n")
-	sb.WriteString(fmt.Sprintf("    <emulator>%s</emulator>\n", spec.emulator))
+	fmt.Fprintf(&sb, "    <emulator>%s</emulator>\n", spec.emulator)
 
 	sb.WriteString("    <disk type='file' device='disk'>\n")
 	sb.WriteString("      <driver name='qemu' type='qcow2'/>\n")
-	sb.WriteString(fmt.Sprintf("      <source file='%s'/>\n", diskPath))
+	fmt.Fprintf(&sb, "      <source file='%s'/>\n", diskPath)
 	sb.WriteString("      <target dev='vda' bus='virtio'/>\n")
 	sb.WriteString("    </disk>\n")
 
 	sb.WriteString("    <disk type='file' device='cdrom'>\n")
 	sb.WriteString("      <driver name='qemu' type='raw'/>\n")
-	sb.WriteString(fmt.Sprintf("      <source file='%s'/>\n", cloudInitPath))
+	fmt.Fprintf(&sb, "      <source file='%s'/>\n", cloudInitPath)
 	sb.WriteString("      <target dev='sda' bus='sata'/>\n")
 	sb.WriteString("      <readonly/>\n")
 	sb.WriteString("    </disk>\n")
@@ -354,10 +437,9 @@ func (m *VMManager) GenerateVMXML(vmCfg config.VMConfig, diskPath, cloudInitPath
 	// Generate network interfaces from looking at the Networks configuration section and seeing if the
 	// VM is attached to any of the networks. If so, generate the network interface XML for each of those
 	// networks.
-	sb.WriteString(m.generateNetworkInterfaces(vmCfg))
+	m.writeNetworkInterfaces(&sb, vmCfg)
 
 	numPairs := m.config.GetHostToDpuNumPairs()
-	mappings := m.config.GetHostDPUMappings()
 	hostToDpuNic := "virtio"
 	if net := m.config.GetHostToDpuNetwork(); net != nil && net.NICModel != "" {
 		hostToDpuNic = net.NICModel
@@ -365,41 +447,21 @@ func (m *VMManager) GenerateVMXML(vmCfg config.VMConfig, diskPath, cloudInitPath
 
 	// Add host-to-DPU network interfaces. Deterministic MAC per (vm, index); udev in guest renames by MAC.
 	if vmCfg.Type == config.HostType {
-		for _, mapping := range mappings {
-			if mapping.Host.Name == vmCfg.Name {
-				for _, conn := range mapping.Connections {
-					for idx := 0; idx < numPairs; idx++ {
-						netName := network.GetHostToDPUNetworkName(mapping.Host.Name, conn.DPU.Name, idx)
-						mac := network.GenerateMACForHostToDpu(vmCfg.Name, config.HostType, idx)
-						sb.WriteString("    <interface type='network'>\n")
-						sb.WriteString(fmt.Sprintf("      <mac address='%s'/>\n", mac))
-						sb.WriteString(fmt.Sprintf("      <source network='%s'/>\n", netName))
-						sb.WriteString("      <virtualport type='openvswitch'/>\n")
-						sb.WriteString(fmt.Sprintf("      <model type='%s'/>\n", hostToDpuNic))
-						sb.WriteString("    </interface>\n")
-					}
-				}
-				break
+		for _, conn := range m.config.GetDPUConnectionsForHost(vmCfg.Name) {
+			for idx := 0; idx < numPairs; idx++ {
+				netName := network.GetHostToDPUNetworkName(vmCfg.Name, conn.DPU.Name, idx)
+				mac := network.GenerateMACForHostToDpu(vmCfg.Name, config.HostType, idx)
+				writeHostToDPUInterface(&sb, mac, netName, hostToDpuNic)
 			}
 		}
 	}
 
 	if vmCfg.Type == config.DpuType {
-		for _, mapping := range mappings {
-			for _, conn := range mapping.Connections {
-				if conn.DPU.Name == vmCfg.Name {
-					for idx := 0; idx < numPairs; idx++ {
-						netName := network.GetHostToDPUNetworkName(mapping.Host.Name, conn.DPU.Name, idx)
-						mac := network.GenerateMACForHostToDpu(vmCfg.Name, config.DpuType, idx)
-						sb.WriteString("    <interface type='network'>\n")
-						sb.WriteString(fmt.Sprintf("      <mac address='%s'/>\n", mac))
-						sb.WriteString(fmt.Sprintf("      <source network='%s'/>\n", netName))
-						sb.WriteString("      <virtualport type='openvswitch'/>\n")
-						sb.WriteString(fmt.Sprintf("      <model type='%s'/>\n", hostToDpuNic))
-						sb.WriteString("    </interface>\n")
-					}
-					break
-				}
+		if hostName, ok := m.config.GetHostForDPU(vmCfg.Name); ok {
+			for idx := 0; idx < numPairs; idx++ {
+				netName := network.GetHostToDPUNetworkName(hostName, vmCfg.Name, idx)
+				mac := network.GenerateMACForHostToDpu(vmCfg.Name, config.DpuType, idx)
+				writeHostToDPUInterface(&sb, mac, netName, hostToDpuNic)
 			}
 		}
 	}
@@ -421,7 +483,41 @@ func (m *VMManager) CreateAllVMs() error {
 	log.Info("=== Creating All VMs ===")
 
 	for _, vmCfg := range m.config.VMs {
-		if err := m.CreateVM(vmCfg); err != nil {
+		if m.VMExists(vmCfg.Name) {
+			return fmt.Errorf("failed to create VM %s: VM %s already exists", vmCfg.Name, vmCfg.Name)
+		}
+	}
+
+	// All VMs share the same base image and SSH key; resolve them once up
+	// front rather than once per VM.
+	inputs, err := m.loadVMBuildInputs()
+	if err != nil {
+		return err
+	}
+
+	// Disk and cloud-init ISO creation shell out to qemu-img and genisoimage
+	// and are independent per VM, so run them concurrently. Defining and
+	// starting the domains stays serial on the shared libvirt connection.
+	assets := make([]vmAssets, len(m.config.VMs))
+	var g errgroup.Group
+	for i, vmCfg := range m.config.VMs {
+		g.Go(func() error {
+			a, err := m.prepareVMAssets(vmCfg, inputs)
+			if err != nil {
+				// Only the first error is returned; log each one as it happens.
+				log.Error("✗ Failed to prepare disk/cloud-init for %s: %v", vmCfg.Name, err)
+				return fmt.Errorf("failed to create VM %s: %w", vmCfg.Name, err)
+			}
+			assets[i] = a
+			return nil
+		})
+	}
+	if err := g.Wait(); err != nil {
+		return err
+	}
+
+	for i, vmCfg := range m.config.VMs {
+		if err := m.defineAndStartVM(vmCfg, assets[i]); err != nil {
 			return fmt.Errorf("failed to create VM %s: %w", vmCfg.Name, err)
 		}
 	}
@@ -52,7 +52,7 @@ func EnsureCloudImage(cmdExec platform.CommandExecutor, osConfig config.OSConfig
 		return pullCloudImageFromOCI(osConfig.ImageRef, osConfig.ImageName, destPath)
 	}
 	if osConfig.ImageURL != "" {
-		return DownloadCloudImage(cmdExec, osConfig.ImageURL, destPath)
+		return downloadCloudImage(cmdExec, osConfig.ImageURL, destPath)
 	}
 	return errors.New("operating_system image source is not configured")
 }
@@ -65,6 +65,12 @@ func DownloadCloudImage(cmdExec platform.CommandExecutor, url, destPath string)
 		return nil
 	}
 
+	return downloadCloudImage(cmdExec, url, destPath)
+}
+
+// downloadCloudImage downloads a cloud image without checking whether it
+// already exists; callers have done that.
+func downloadCloudImage(cmdExec platform.CommandExecutor, url, destPath string) error {
 	// Create destination directory if it doesn't exist
 	destDir := filepath.Dir(destPath)
 	if err := os.MkdirAll(destDir, 0o755); err != nil {
@@ -352,8 +358,11 @@ func copyFile(sourcePath, destPath string) error {
 	return nil
 }
 
-// CreateVMDisk creates a disk image for a VM using qemu-img
-func CreateVMDisk(cmdExec platform.CommandExecutor, vmName string, sizeGB int, baseImage string) (string, error) {
+// createVMDisk creates a qcow2 overlay disk for a VM on top of baseImage
+// using qemu-img. baseVirtualSizeBytes is the base image's virtual size,
+// inspected once by the caller for all disks created from it.
+// DefaultImageDir must already exist.
+func createVMDisk(cmdExec platform.CommandExecutor, vmName string, sizeGB int, baseImage string, baseVirtualSizeBytes int64) (string, error) {
 	diskPath := filepath.Join(DefaultImageDir, fmt.Sprintf("%s.qcow2", vmName))
 
 	// Check if disk already exists
@@ -362,15 +371,6 @@ func CreateVMDisk(cmdExec platform.CommandExecutor, vmName string, sizeGB int, b
 		return diskPath, nil
 	}
 
-	// Create image directory if it doesn't exist
-	if err := os.MkdirAll(DefaultImageDir, 0o755); err != nil {
-		return "", fmt.Errorf("failed to create image directory: %w", err)
-	}
-
-	baseVirtualSizeBytes, err := imageVirtualSizeBytes(cmdExec, baseImage)
-	if err != nil {
-		return "", fmt.Errorf("failed to inspect base image size %s: %w", baseImage, err)
-	}
 	requestedSizeBytes := int64(sizeGB) * 1024 * 1024 * 1024
 
 	log.Debug("Creating disk for %s based on %s...", vmName, baseImage)
@@ -416,32 +416,21 @@ func getInterfaceNamesAndMACs(cfg *config.Config, vmConfig config.VMConfig) []if
 		out = append(out, ifaceNameAndMAC{Name: net.Type, MAC: mac})
 	}
 	numPairs := cfg.GetHostToDpuNumPairs()
-	mappings := cfg.GetHostDPUMappings()
-	if vmConfig.Type == config.HostType {
-		for _, mapping := range mappings {
-			if mapping.Host.Name == vmConfig.Name {
-				for idx := 0; idx < numPairs; idx++ {
-					out = append(out, ifaceNameAndMAC{
-						Name: fmt.Sprintf(network.HostDataIfFmt, idx),
-						MAC:  network.GenerateMACForHostToDpu(vmConfig.Name, config.HostType, idx),
-					})
-				}
-				break
-			}
+	if vmConfig.Type == config.HostType && len(cfg.GetDPUConnectionsForHost(vmConfig.Name)) > 0 {
+		for idx := 0; idx < numPairs; idx++ {
+			out = append(out, ifaceNameAndMAC{
+				Name: fmt.Sprintf(network.HostDataIfFmt, idx),
+				MAC:  network.GenerateMACForHostToDpu(vmConfig.Name, config.HostType, idx),
+			})
 		}
 	}
 	if vmConfig.Type == config.DpuType {
-		for _, mapping := range mappings {
-			for _, conn := range mapping.Connections {
-				if conn.DPU.Name == vmConfig.Name {
-					for idx := 0; idx < numPairs; idx++ {
-						out = append(out, ifaceNameAndMAC{
-							Name: fmt.Sprintf(network.DPUDataIfFmt, idx),
-							MAC:  network.GenerateMACForHostToDpu(vmConfig.Name, config.DpuType, idx),
-						})
-					}
-					break
-				}
+		if _, ok := cfg.GetHostForDPU(vmConfig.Name); ok {
+			for idx := 0; idx < numPairs; idx++ {
+				out = append(out, ifaceNameAndMAC{
+					Name: fmt.Sprintf(network.DPUDataIfFmt, idx),
+					MAC:  network.GenerateMACForHostToDpu(vmConfig.Name, config.DpuType, idx),
+				})
 			}
 		}
 	}
@@ -470,6 +459,28 @@ func imageVirtualSizeBytes(cmdExec platform.CommandExecutor, imagePath string) (
 // CreateCloudInitISO creates a cloud-init ISO for VM initialization.
 // If cfg is non-nil, udev rules are added to rename interfaces by MAC to common names (mgmt, k8s, eth0-0, rep0-0, etc.).
 func CreateCloudInitISO(cmdExec platform.CommandExecutor, sshConfig config.SSHConfig, vmConfig config.VMConfig, cfg *config.Config) (string, error) {
+	pubKey, err := readSSHPublicKey(sshConfig)
+	if err != nil {
+		return "", err
+	}
+	header := generateUserDataHeader(pubKey, sshConfig.User, sshConfig.Password)
+	return createCloudInitISO(cmdExec, header, vmConfig, cfg)
+}
+
+// readSSHPublicKey reads the public half of the configured SSH key.
+func readSSHPublicKey(sshConfig config.SSHConfig) (string, error) {
+	pubKeyPath := sshConfig.KeyPath + ".pub"
+	pubKeyData, err := os.ReadFile(pubKeyPath)
+	if err != nil {
+		return "", fmt.Errorf("failed to read SSH public key: %w", err)
+	}
+	return strings.TrimSpace(string(pubKeyData)), nil
+}
+
+// createCloudInitISO is CreateCloudInitISO with the VM-independent part of the
+// user-data (see generateUserDataHeader) already rendered, so callers creating
+// several ISOs render it once.
+func createCloudInitISO(cmdExec platform.CommandExecutor, userDataHeader string, vmConfig config.VMConfig, cfg *config.Config) (string, error) {
 	vmName := vmConfig.Name
 	isoPath := filepath.Join(DefaultImageDir, fmt.Sprintf("%s-cloud-init.iso", vmName))
 
@@ -492,18 +503,11 @@ func CreateCloudInitISO(cmdExec platform.CommandExecutor, sshConfig config.SSHCo
 		return "", fmt.Errorf("failed to write meta-data: %w", err)
 	}
 
-	// Read SSH public key
-	pubKeyPath := sshConfig.KeyPath + ".pub"
-	pubKeyData, err := os.ReadFile(pubKeyPath)
-	if err != nil {
-		return "", fmt.Errorf("failed to read SSH public key: %w", err)
-	}
-
 	var ifaceNameMACs []ifaceNameAndMAC
 	if cfg != nil {
 		ifaceNameMACs = getInterfaceNamesAndMACs(cfg, vmConfig)
 	}
-	userData := generateUserData(string(pubKeyData), sshConfig.User, sshConfig.Password, ifaceNameMACs, cfg, vmConfig)
+	userData := generateUserData(userDataHeader, ifaceNameMACs, cfg, vmConfig)
 	userDataPath := filepath.Join(tempDir, "user-data")
 	if err := os.WriteFile(userDataPath, []byte(userData), 0o644); err != nil {
 		return "", fmt.Errorf("failed to write user-data: %w", err)
@@ -529,11 +533,11 @@ func generateMetaData(vmName string) string {
 	return sb.String()
 }
 
-// generateUserData generates cloud-init user-data content that sets ssh keys, passwords, updates packages, and disables
-// zram. ZRAM enables swap, which is not desirable for k8s, hense we disable it partially here. If ifaceNameMACs is non-empty,
-// udev rules rename interfaces (mgmt, k8s, eth0-0, etc.). NetworkManager is kept but only mgmt is managed (DHCP); other interfaces
-// are unmanaged.
-func generateUserData(sshPubKey, username, password string, ifaceNameMACs []ifaceNameAndMAC, cfg *config.Config, vmConfig config.VMConfig) string {
+// generateUserDataHeader renders the part of the cloud-init user-data that is
+// the same for every VM: the user with its SSH key and password, packages, and
+// the start of write_files with the zram override. ZRAM enables swap, which is
+// not desirable for k8s, hense we disable it partially here.
+func generateUserDataHeader(sshPubKey, username, password string) string {
 	var sb strings.Builder
 
 	sb.WriteString("#cloud-config\n")
@@ -570,28 +574,35 @@ func generateUserData(sshPubKey, username, password string, ifaceNameMACs []ifac
 	sb.WriteString("    content: \"\"\n")
 	sb.WriteString("    permissions: \"0644\"\n")
 
+	return sb.String()
+}
+
+// generateUserData generates cloud-init user-data content by appending the per-VM entries to userDataHeader (see
+// generateUserDataHeader). If ifaceNameMACs is non-empty, udev rules rename interfaces (mgmt, k8s, eth0-0, etc.).
+// NetworkManager is kept but only mgmt is managed (DHCP); other interfaces are unmanaged.
+func generateUserData(userDataHeader string, ifaceNameMACs []ifaceNameAndMAC, cfg *config.Config, vmConfig config.VMConfig) string {
+	var sb strings.Builder
+	sb.Grow(len(userDataHeader) + 4096)
+
+	sb.WriteString(userDataHeader)
+
 	if len(ifaceNameMACs) > 0 {
 		// udev rules: match by deterministic MAC (hash of VM name + type), set NAME to common name
-		udevContent := "# dpu-sim: rename interfaces by MAC to common names\n"
-		for _, m := range ifaceNameMACs {
-			udevContent += fmt.Sprintf("ATTR{address}==%q, SUBSYSTEM==\"net\", ACTION==\"add\", NAME=%q\n", m.MAC, m.Name)
-		}
 		sb.WriteString("  - path: /etc/udev/rules.d/70-dpu-sim-ifnames.rules\n")
 		sb.WriteString("    content: |\n")
-		for _, line := range strings.Split(strings.TrimSuffix(udevContent, "\n"), "\n") {
-			sb.WriteString("      " + line + "\n")
+		sb.WriteString("      # dpu-sim: rename interfaces by MAC to common names\n")
+		for _, m := range ifaceNameMACs {
+			fmt.Fprintf(&sb, "      ATTR{address}==%q, SUBSYSTEM==\"net\", ACTION==\"add\", NAME=%q\n", m.MAC, m.Name)
 		}
 		sb.WriteString("    permissions: \"0644\"\n")
 		// First-boot script: rename existing interfaces by MAC (udev NAME= applies on add; existing devs need ip link set).
 		// Use read < file to get MAC without newline; cat would include newline and break the comparison.
-		scriptContent := "#!/bin/bash\n# dpu-sim: rename interfaces by MAC at first boot\n"
-		for _, m := range ifaceNameMACs {
-			scriptContent += fmt.Sprintf("for d in /sys/class/net/*; do [ -f \"$d/address\" ] || continue; ifname=$(basename \"$d\"); [ \"$ifname\" = lo ] && continue; read -r mac < \"$d/address\"; [ \"$mac\" = \"%s\" ] && ip link set dev \"$ifname\" name \"%s\" && break; done\n", m.MAC, m.Name)
-		}
 		sb.WriteString("  - path: /etc/dpu-sim-rename-ifaces.sh\n")
 		sb.WriteString("    content: |\n")
-		for _, line := range strings.Split(strings.TrimSuffix(scriptContent, "\n"), "\n") {
-			sb.WriteString("      " + line + "\n")
+		sb.WriteString("      #!/bin/bash\n")
+		sb.WriteString("      # dpu-sim: rename interfaces by MAC at first boot\n")
+		for _, m := range ifaceNameMACs {
+			fmt.Fprintf(&sb, "      for d in /sys/class/net/*; do [ -f \"$d/address\" ] || continue; ifname=$(basename \"$d\"); [ \"$ifname\" = lo ] && continue; read -r mac < \"$d/address\"; [ \"$mac\" = \"%s\" ] && ip link set dev \"$ifname\" name \"%s\" && break; done\n", m.MAC, m.Name)
 		}
 		sb.WriteString("    permissions: \"0755\"\n")
 	}
@@ -637,7 +648,7 @@ func generateUserData(sshPubKey, username, password string, ifaceNameMACs []ifac
 				sb.WriteString("      [Service]\n")
 				sb.WriteString("      Type=oneshot\n")
 				sb.WriteString("      RemainAfterExit=yes\n")
-				sb.WriteString(fmt.Sprintf("      ExecStart=/bin/sh -c '%s'\n", execStart))
+				fmt.Fprintf(&sb, "      ExecStart=/bin/sh -c '%s'\n", execStart)
 				sb.WriteString("      [Install]\n")
 				sb.WriteString("      WantedBy=multi-user.target\n")
 				sb.WriteString("    permissions: \"0644\"\n")
@@ -3,6 +3,7 @@ package vm
 import (
 	"os"
 	"path/filepath"
+	"strings"
 	"testing"
 
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
@@ -99,3 +100,24 @@ func TestFindPulledCloudImage(t *testing.T) {
 		t.Fatalf("expected %s, got %s", want, got)
 	}
 }
+
+// TestGenerateUserDataAppendsPerVMEntriesToHeader verifies the shared header
+// is emitted verbatim and followed by the VM's interface rename rules.
+func TestGenerateUserDataAppendsPerVMEntriesToHeader(t *testing.T) {
+	header := generateUserDataHeader("ssh-ed25519 AAAA test@host\n", "root", "redhat")
+	if !strings.HasPrefix(header, "#cloud-config\nusers:\n  - name: root\n") {
+		t.Fatalf("unexpected header start: %q", header)
+	}
+	if !strings.Contains(header, "      - ssh-ed25519 AAAA test@host\n") {
+		t.Fatalf("header missing trimmed SSH key: %q", header)
+	}
+
+	ifaces := []ifaceNameAndMAC{{Name: "mgmt", MAC: "52:54:00:aa:bb:cc"}}
+	userData := generateUserData(header, ifaces, nil, config.VMConfig{Name: "vm-1"})
+	if !strings.HasPrefix(userData, header) {
+		t.Fatalf("user-data does not start with the shared header")
+	}
+	if !strings.Contains(userData, `ATTR{address}=="52:54:00:aa:bb:cc", SUBSYSTEM=="net", ACTION=="add", NAME="mgmt"`) {
+		t.Fatalf("user-data missing udev rename rule: %q", userData)
+	}
+}
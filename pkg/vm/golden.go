@@ -0,0 +1,169 @@
+package vm
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"fmt"
+	"os"
+	"path/filepath"
+	"strings"
+	"time"
+
+	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
+	"github.com/ovn-kubernetes/dpu-simulator/pkg/log"
+	"github.com/ovn-kubernetes/dpu-simulator/pkg/platform"
+)
+
+// goldenImageShutdownTimeout bounds how long SaveGoldenImage waits for the
+// source VM to power off before copying its disk.
+const goldenImageShutdownTimeout = 3 * time.Minute
+
+// goldenImageDir is where golden images are stored; a variable so tests can
+// point it at a temporary directory.
+var goldenImageDir = DefaultImageDir
+
+// cloudInitWaitScript waits for cloud-init to finish. Exit status 2 means it
+// finished with recoverable errors, which counts as done.
+const cloudInitWaitScript = "cloud-init status --wait || [ $? -eq 2 ]"
+
+// goldenImagePath returns where the Kubernetes-ready base image for this
+// configuration is stored. The name is keyed by everything that changes what
+// InstallKubernetes puts on the disk, so a config change never reuses a stale
+// image.
+func (m *VMManager) goldenImagePath() string {
+	osCfg := m.config.OperatingSystem
+	h := sha256.New()
+	for _, part := range []string{
+		osCfg.ImageName,
+		osCfg.ImageURL,
+		osCfg.ImageRef,
+		osCfg.PackageProxy,
+		m.config.Kubernetes.Version,
+		m.hostSpec.libvirtArch,
+	} {
+		h.Write([]byte(part))
+		h.Write([]byte{0})
+	}
+	key := hex.EncodeToString(h.Sum(nil))[:12]
+	return filepath.Join(goldenImageDir, fmt.Sprintf("golden-k8s-%s-%s.qcow2", m.config.Kubernetes.Version, key))
+}
+
+// cachedGoldenImage returns the golden image path if image caching is
+// enabled and the image has already been saved.
+func (m *VMManager) cachedGoldenImage() (string, bool) {
+	if !m.config.OperatingSystem.CacheK8sImage {
+		return "", false
+	}
+	path := m.goldenImagePath()
+	if _, err := os.Stat(path); err != nil {
+		return "", false
+	}
+	return path, true
+}
+
+// goldenImageSysprepScript resets per-machine identity on the source VM so
+// clones of its disk come up as distinct machines: cloud-init runs again, and
+// machine-id, SSH host keys and the OVS system-id are regenerated on boot.
+func goldenImageSysprepScript() string {
+	sb := strings.Builder{}
+	sb.WriteString("set -e\n")
+	sb.WriteString("sudo cloud-init clean --logs\n")
+	sb.WriteString("sudo truncate -s 0 /etc/machine-id\n")
+	sb.WriteString("sudo rm -f /var/lib/dbus/machine-id /etc/ssh/ssh_host_*\n")
+	sb.WriteString("sudo rm -f /etc/openvswitch/conf.db /etc/openvswitch/system-id.conf\n")
+	sb.WriteString("sync\n")
+	return sb.String()
+}
+
+// GoldenImagePending reports whether SaveGoldenImage still has an image to
+// save for this configuration.
+func (m *VMManager) GoldenImagePending() bool {
+	if !m.config.OperatingSystem.CacheK8sImage || len(m.config.VMs) == 0 {
+		return false
+	}
+	_, err := os.Stat(m.goldenImagePath())
+	return err != nil
+}
+
+// SaveGoldenImage snapshots the first VM's disk, after Kubernetes packages
+// have been installed on it, as the base image for future deployments of the
+// same configuration. Later runs boot from it and InstallKubernetes finds
+// every dependency already present. It is a no-op when
+// operating_system.cache_k8s_image is unset or the image already exists.
+func (m *VMManager) SaveGoldenImage() error {
+	if !m.GoldenImagePending() {
+		return nil
+	}
+	goldenPath := m.goldenImagePath()
+
+	vmName := m.config.VMs[0].Name
+	log.Info("=== Saving Kubernetes-ready base image from %s ===", vmName)
+
+	mgmtIP, err := m.GetVMMgmtIP(vmName)
+	if err != nil {
+		return fmt.Errorf("failed to get IP for %s: %w", vmName, err)
+	}
+	sshExec := platform.NewSSHExecutor(&m.config.SSH, mgmtIP)
+	if stdout, stderr, err := sshExec.ExecuteWithTimeout(goldenImageSysprepScript(), 2*time.Minute); err != nil {
+		return fmt.Errorf("failed to prepare %s for imaging: %w, stdout: %s, stderr: %s", vmName, err, stdout, stderr)
+	}
+
+	if err := m.StopVM(vmName); err != nil {
+		return err
+	}
+	if err := m.waitForVMState(vmName, VMStateShutoff, goldenImageShutdownTimeout); err != nil {
+		return err
+	}
+
+	// Flatten the overlay and its backing file into a standalone image, then
+	// rename it into place so an interrupted copy is never picked up.
+	diskPath := filepath.Join(DefaultImageDir, fmt.Sprintf("%s.qcow2", vmName))
+	tmpPath := goldenPath + ".tmp"
+	out, errOut, err := platform.RunCommandInDir(m.hostExec, "", "qemu-img", []string{
+		"convert", "-O", "qcow2", diskPath, tmpPath,
+	}, 30*time.Minute)
+	if err != nil {
+		os.Remove(tmpPath)
+		return fmt.Errorf("failed to copy %s to %s: %w, output: %s", diskPath, tmpPath, err, platform.CombinedCmdOutput(out, errOut))
+	}
+	if err := os.Rename(tmpPath, goldenPath); err != nil {
+		os.Remove(tmpPath)
+		return fmt.Errorf("failed to save golden image %s: %w", goldenPath, err)
+	}
+	log.Info("✓ Saved Kubernetes-ready base image %s", goldenPath)
+
+	// Bring the source VM back; it boots through cloud-init like a clone.
+	if err := m.StartVM(vmName); err != nil {
+		return err
+	}
+	mgmtIP, err = m.WaitForVMIP(vmName, config.MgmtNetworkName, 5*time.Minute)
+	if err != nil {
+		return fmt.Errorf("failed to get IP for %s after imaging: %w", vmName, err)
+	}
+	sshExec = platform.NewSSHExecutor(&m.config.SSH, mgmtIP)
+	if err := sshExec.WaitUntilReady(5 * time.Minute); err != nil {
+		return fmt.Errorf("failed to wait for SSH on %s after imaging: %w", vmName, err)
+	}
+	if stdout, stderr, err := sshExec.ExecuteWithTimeout(cloudInitWaitScript, 10*time.Minute); err != nil {
+		return fmt.Errorf("cloud-init failed on %s after imaging: %w, stdout: %s, stderr: %s", vmName, err, stdout, stderr)
+	}
+	return nil
+}
+
+// waitForVMState polls until the VM reaches want or timeout expires.
+func (m *VMManager) waitForVMState(vmName string, want VMState, timeout time.Duration) error {
+	deadline := time.Now().Add(timeout)
+	interval := ipPollInitialInterval
+	for {
+		state, err := m.GetVMState(vmName)
+		if err == nil && state == want {
+			return nil
+		}
+		remaining := time.Until(deadline)
+		if remaining <= 0 {
+			return fmt.Errorf("timeout waiting for VM %s to reach state %s (last state %s)", vmName, want, state)
+		}
+		time.Sleep(min(interval, remaining))
+		interval = min(interval*3/2, ipPollMaxInterval)
+	}
+}
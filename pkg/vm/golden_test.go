@@ -0,0 +1,91 @@
+package vm
+
+import (
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+
+	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
+)
+
+// TestGoldenImagePathChangesWithInstallInputs verifies the cached base image
+// is not reused across Kubernetes versions or OS images.
+func TestGoldenImagePathChangesWithInstallInputs(t *testing.T) {
+	t.Parallel()
+
+	newManager := func(version, imageName string) *VMManager {
+		return &VMManager{
+			config: &config.Config{
+				OperatingSystem: config.OSConfig{ImageName: imageName},
+				Kubernetes:      config.KubernetesConfig{Version: version},
+			},
+			hostSpec: archSpec{libvirtArch: "x86_64"},
+		}
+	}
+
+	base := newManager("1.33", "Fedora-x86_64.qcow2").goldenImagePath()
+	if !strings.HasPrefix(base, DefaultImageDir+"/golden-k8s-1.33-") {
+		t.Fatalf("unexpected golden image path: %s", base)
+	}
+	if again := newManager("1.33", "Fedora-x86_64.qcow2").goldenImagePath(); again != base {
+		t.Fatalf("expected stable path, got %s and %s", base, again)
+	}
+	if other := newManager("1.34", "Fedora-x86_64.qcow2").goldenImagePath(); other == base {
+		t.Fatalf("expected a different path for another Kubernetes version")
+	}
+	if other := newManager("1.33", "CentOS-x86_64.qcow2").goldenImagePath(); other == base {
+		t.Fatalf("expected a different path for another OS image")
+	}
+}
+
+// TestCachedGoldenImageRespectsSettingAndFile verifies a golden image is only
+// used, and only still pending, according to cache_k8s_image and whether the
+// image file exists.
+func TestCachedGoldenImageRespectsSettingAndFile(t *testing.T) {
+	origDir := goldenImageDir
+	goldenImageDir = t.TempDir()
+	t.Cleanup(func() {
+		goldenImageDir = origDir
+	})
+
+	newManager := func(cache bool) *VMManager {
+		return &VMManager{
+			config: &config.Config{
+				OperatingSystem: config.OSConfig{ImageName: "Fedora-x86_64.qcow2", CacheK8sImage: cache},
+				Kubernetes:      config.KubernetesConfig{Version: "1.33"},
+				VMs:             []config.VMConfig{{Name: "vm1"}},
+			},
+			hostSpec: archSpec{libvirtArch: "x86_64"},
+		}
+	}
+	disabled, enabled := newManager(false), newManager(true)
+
+	if _, ok := enabled.cachedGoldenImage(); ok {
+		t.Fatalf("expected no cached image before one is saved")
+	}
+	if !enabled.GoldenImagePending() {
+		t.Fatalf("expected an image to be pending when caching is enabled")
+	}
+	if disabled.GoldenImagePending() {
+		t.Fatalf("expected nothing pending when caching is disabled")
+	}
+
+	path := enabled.goldenImagePath()
+	if filepath.Dir(path) != goldenImageDir {
+		t.Fatalf("expected golden image under %s, got %s", goldenImageDir, path)
+	}
+	if err := os.WriteFile(path, []byte("image"), 0o644); err != nil {
+		t.Fatalf("failed to write golden image: %v", err)
+	}
+
+	if got, ok := enabled.cachedGoldenImage(); !ok || got != path {
+		t.Fatalf("expected cached image %s, got %q (ok=%v)", path, got, ok)
+	}
+	if enabled.GoldenImagePending() {
+		t.Fatalf("expected nothing pending once the image exists")
+	}
+	if _, ok := disabled.cachedGoldenImage(); ok {
+		t.Fatalf("expected the image to be ignored when caching is disabled")
+	}
+}
@@ -1,14 +1,17 @@
 package vm
 
 import (
+	"encoding/xml"
 	"fmt"
 	"net"
 	"strings"
+	"sync"
 	"time"
 
 	"libvirt.org/go/libvirt"
 
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
+	"github.com/ovn-kubernetes/dpu-simulator/pkg/platform"
 )
 
 // GetVMMgmtIP retrieves the management network IP address of a VM.
@@ -16,18 +19,27 @@ func (m *VMManager) GetVMMgmtIP(vmName string) (string, error) {
 	return m.WaitForVMIP(vmName, config.MgmtNetworkName, 10*time.Second)
 }
 
+// primeMgmtIPs resolves the management address of every VM in vms before a
+// fan-out, so they all come from one DHCP lease snapshot and the concurrent
+// workers find them cached instead of each going back to libvirt. VMs with
+// no lease yet are skipped; their workers wait for one as before.
+func (m *VMManager) primeMgmtIPs(vms []config.VMConfig) {
+	for _, vmCfg := range vms {
+		_, _ = m.GetVMIP(vmCfg.Name, config.MgmtNetworkName)
+	}
+}
+
 // GetVMK8sIP returns the Kubernetes network IP address of a VM from configuration.
 // The k8s interface uses a static IP (no DHCP).
 func (m *VMManager) GetVMK8sIP(vmName string) (string, error) {
-	for _, vm := range m.config.VMs {
-		if vm.Name == vmName {
-			if vm.K8sNodeIP == "" {
-				return "", fmt.Errorf("no k8s_node_ip configured for VM %s", vmName)
-			}
-			return vm.K8sNodeIP, nil
-		}
+	vm := m.config.GetVMConfig(vmName)
+	if vm == nil {
+		return "", fmt.Errorf("VM %s not found in configuration", vmName)
 	}
-	return "", fmt.Errorf("VM %s not found in configuration", vmName)
+	if vm.K8sNodeIP == "" {
+		return "", fmt.Errorf("no k8s_node_ip configured for VM %s", vmName)
+	}
+	return vm.K8sNodeIP, nil
 }
 
 // GetVMIP retrieves the IP address of a VM by name and network type.
@@ -44,66 +56,407 @@ func (m *VMManager) GetVMIP(vmName string, networkType string) (string, error) {
 		return "", fmt.Errorf("could not determine subnet for network type %q", networkType)
 	}
 
-	return m.GetVMIPBySubnet(vmName, subnet)
+	// A running VM keeps its address, so once found it is served from
+	// memory until the VM is started, stopped or deleted via this manager.
+	key := vmName + "/" + networkType
+	m.leases.mu.Lock()
+	ip, ok := m.leases.ips[key]
+	m.leases.mu.Unlock()
+	if ok {
+		return ip, nil
+	}
+
+	ip, err := m.lookupVMIP(vmName, network.Name, networkType, subnet)
+	if err != nil {
+		return "", err
+	}
+
+	m.leases.mu.Lock()
+	if m.leases.ips == nil {
+		m.leases.ips = make(map[string]string)
+	}
+	m.leases.ips[key] = ip
+	m.leases.mu.Unlock()
+	return ip, nil
+}
+
+// lookupVMIP asks libvirt for the VM's address on the given network.
+func (m *VMManager) lookupVMIP(vmName, networkName, networkType, subnet string) (string, error) {
+	// DHCP-backed networks are answered from a lease snapshot shared by all
+	// VMs on the network; anything else asks libvirt about the domain.
+	var leaseFn func() (string, bool, error)
+	if networkType != config.K8sNetworkName {
+		leaseFn = func() (string, bool, error) { return m.leaseIP(vmName, networkName) }
+	}
+	return lookupVMIPWith(leaseFn, func() (string, error) { return m.GetVMIPBySubnet(vmName, subnet) })
+}
+
+// lookupVMIPWith returns the address from leaseFn when it has one, and
+// otherwise falls back to domainFn. A VM missing from the lease snapshot
+// (lease not written yet, or expired) still goes to domainFn, whose ARP
+// source can find it. leaseFn may be nil to skip the snapshot.
+func lookupVMIPWith(leaseFn func() (string, bool, error), domainFn func() (string, error)) (string, error) {
+	if leaseFn != nil {
+		if ip, ok, err := leaseFn(); err == nil && ok {
+			return ip, nil
+		}
+	}
+	return domainFn()
+}
+
+// forgetVMAddresses drops every cached address and MAC for vmName so the next
+// lookup goes back to libvirt. It is called whenever the VM's lifecycle
+// changes, since a restarted guest may get a new lease. Pooled SSH
+// connections and host probes for the forgotten addresses are dropped too;
+// the connections would only be found dead on the next command.
+func (m *VMManager) forgetVMAddresses(vmName string) {
+	prefix := vmName + "/"
+	var forgotten []string
+	m.leases.mu.Lock()
+	for key, ip := range m.leases.ips {
+		if strings.HasPrefix(key, prefix) {
+			delete(m.leases.ips, key)
+			forgotten = append(forgotten, ip)
+		}
+	}
+	for key := range m.leases.macs {
+		if strings.HasPrefix(key, prefix) {
+			delete(m.leases.macs, key)
+		}
+	}
+	m.leases.mu.Unlock()
+
+	for _, ip := range forgotten {
+		platform.ForgetSSHHost(ip)
+	}
+}
+
+// leaseSnapshotMaxAge is how long a network's DHCP lease snapshot is reused.
+// It lets concurrent waiters polling in the same tick share one libvirt call.
+const leaseSnapshotMaxAge = 250 * time.Millisecond
+
+// leaseCache holds recent DHCP lease snapshots per libvirt network, the MAC
+// address each VM uses on each network and the addresses already resolved.
+type leaseCache struct {
+	mu         sync.Mutex
+	snapshots  map[string]leaseSnapshot // network name -> snapshot
+	macs       map[string]string        // vm name + "/" + network name -> MAC
+	ips        map[string]string        // vm name + "/" + network type -> IP
+	macsPrimed bool                     // primeVMMACs has run
+	firstMACVM string                   // first VM whose MAC was looked up
+}
+
+type leaseSnapshot struct {
+	taken   time.Time
+	ipByMAC map[string]string
+}
+
+// leaseIP looks up a VM's IPv4 lease on a libvirt network. ok is false when
+// the VM has an interface on the network but no lease yet. A non-nil error
+// means the lookup could not be done this way and the caller should fall back
+// to querying the domain.
+func (m *VMManager) leaseIP(vmName, networkName string) (ip string, ok bool, err error) {
+	mac, err := m.vmMACOnNetwork(vmName, networkName)
+	if err != nil {
+		return "", false, err
+	}
+	leases, err := m.networkLeases(networkName)
+	if err != nil {
+		return "", false, err
+	}
+	ip, ok = leases[mac]
+	return ip, ok, nil
+}
+
+// networkLeases returns a MAC -> IPv4 map of the network's DHCP leases,
+// refreshing it from libvirt at most once per leaseSnapshotMaxAge.
+func (m *VMManager) networkLeases(networkName string) (map[string]string, error) {
+	m.leases.mu.Lock()
+	defer m.leases.mu.Unlock()
+
+	if snap, ok := m.leases.snapshots[networkName]; ok && time.Since(snap.taken) < leaseSnapshotMaxAge {
+		return snap.ipByMAC, nil
+	}
+
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return nil, fmt.Errorf("failed to lookup network %s: %w", networkName, err)
+	}
+	net, err := conn.LookupNetworkByName(networkName)
+	if err != nil {
+		return nil, fmt.Errorf("failed to lookup network %s: %w", networkName, err)
+	}
+	defer net.Free()
+
+	leases, err := net.GetDHCPLeases()
+	if err != nil {
+		return nil, fmt.Errorf("failed to get DHCP leases for network %s: %w", networkName, err)
+	}
+
+	ipByMAC := make(map[string]string, len(leases))
+	for _, lease := range leases {
+		if lease.Type == libvirt.IP_ADDR_TYPE_IPV4 {
+			ipByMAC[strings.ToLower(lease.Mac)] = lease.IPaddr
+		}
+	}
+
+	if m.leases.snapshots == nil {
+		m.leases.snapshots = make(map[string]leaseSnapshot)
+	}
+	m.leases.snapshots[networkName] = leaseSnapshot{taken: time.Now(), ipByMAC: ipByMAC}
+	return ipByMAC, nil
+}
+
+// domainInterfaces is the subset of libvirt domain XML needed to map a VM's
+// interfaces to the networks they are attached to.
+type domainInterfaces struct {
+	Interfaces []struct {
+		MAC struct {
+			Address string `xml:"address,attr"`
+		} `xml:"mac"`
+		Source struct {
+			Network string `xml:"network,attr"`
+		} `xml:"source"`
+	} `xml:"devices>interface"`
+}
+
+// macsByNetwork parses a domain XML description into a network name -> MAC
+// map, keeping the first interface on each network.
+func macsByNetwork(desc string) (map[string]string, error) {
+	var parsed domainInterfaces
+	if err := xml.Unmarshal([]byte(desc), &parsed); err != nil {
+		return nil, err
+	}
+	macs := make(map[string]string, len(parsed.Interfaces))
+	for _, iface := range parsed.Interfaces {
+		network := iface.Source.Network
+		if network == "" || iface.MAC.Address == "" {
+			continue
+		}
+		if _, ok := macs[network]; !ok {
+			macs[network] = strings.ToLower(iface.MAC.Address)
+		}
+	}
+	return macs, nil
+}
+
+// cacheVMMACs records vmName's MAC on each network, keeping entries that are
+// already cached.
+func (m *VMManager) cacheVMMACs(vmName string, byNetwork map[string]string) {
+	m.leases.mu.Lock()
+	defer m.leases.mu.Unlock()
+	if m.leases.macs == nil {
+		m.leases.macs = make(map[string]string)
+	}
+	for network, mac := range byNetwork {
+		key := vmName + "/" + network
+		if _, ok := m.leases.macs[key]; !ok {
+			m.leases.macs[key] = mac
+		}
+	}
+}
+
+// shouldPrimeMACs reports whether a MAC lookup for vmName should first prime
+// the cache for every VM. That only pays off once a second VM is asked about;
+// single-VM paths such as "vmctl ssh" keep to one domain lookup instead of
+// reading the XML of every running VM.
+func (m *VMManager) shouldPrimeMACs(vmName string) bool {
+	m.leases.mu.Lock()
+	defer m.leases.mu.Unlock()
+	if m.leases.macsPrimed {
+		return false
+	}
+	if m.leases.firstMACVM == "" {
+		m.leases.firstMACVM = vmName
+		return false
+	}
+	return m.leases.firstMACVM != vmName
 }
 
+// primeVMMACs reads the interface MACs of every running configured VM from a
+// single domain listing, so resolving addresses for a whole deployment does
+// not look each domain up by name. It runs once per manager; VMs it missed
+// fall back to a per-domain lookup in vmMACOnNetwork.
+func (m *VMManager) primeVMMACs() {
+	m.leases.mu.Lock()
+	primed := m.leases.macsPrimed
+	m.leases.macsPrimed = true
+	m.leases.mu.Unlock()
+	if primed {
+		return
+	}
+
+	configured := make(map[string]bool, len(m.config.VMs))
+	for _, vmCfg := range m.config.VMs {
+		configured[vmCfg.Name] = true
+	}
+
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return
+	}
+	domains, err := conn.ListAllDomains(libvirt.CONNECT_LIST_DOMAINS_ACTIVE)
+	if err != nil {
+		return
+	}
+	for _, domain := range domains {
+		if name, err := domain.GetName(); err == nil && configured[name] {
+			if desc, err := domain.GetXMLDesc(0); err == nil {
+				if byNetwork, err := macsByNetwork(desc); err == nil {
+					m.cacheVMMACs(name, byNetwork)
+				}
+			}
+		}
+		domain.Free()
+	}
+}
+
+// vmMACOnNetwork returns the MAC address of the VM's interface on the given
+// libvirt network. The domain XML is read once per VM and network.
+func (m *VMManager) vmMACOnNetwork(vmName, networkName string) (string, error) {
+	key := vmName + "/" + networkName
+
+	if m.shouldPrimeMACs(vmName) {
+		m.primeVMMACs()
+	}
+	m.leases.mu.Lock()
+	mac, ok := m.leases.macs[key]
+	m.leases.mu.Unlock()
+	if ok {
+		return mac, nil
+	}
+
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return "", fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
+	}
+	domain, err := conn.LookupDomainByName(vmName)
+	if err != nil {
+		return "", fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
+	}
+	defer domain.Free()
+
+	desc, err := domain.GetXMLDesc(0)
+	if err != nil {
+		return "", fmt.Errorf("failed to get XML for domain %s: %w", vmName, err)
+	}
+
+	byNetwork, err := macsByNetwork(desc)
+	if err != nil {
+		return "", fmt.Errorf("failed to parse XML for domain %s: %w", vmName, err)
+	}
+	mac, ok = byNetwork[networkName]
+	if !ok {
+		return "", fmt.Errorf("VM %s has no interface on network %s", vmName, networkName)
+	}
+
+	m.cacheVMMACs(vmName, byNetwork)
+	return mac, nil
+}
+
+const (
+	// ipPollInitialInterval and ipPollMaxInterval bound the backoff used
+	// while waiting for a VM to get a DHCP lease. Waiters on a network share
+	// one lease snapshot per leaseSnapshotMaxAge however many VMs poll, so
+	// the cap can stay short and a new lease is seen within half a second.
+	ipPollInitialInterval = 100 * time.Millisecond
+	ipPollMaxInterval     = 500 * time.Millisecond
+)
+
 // WaitForVMIP waits for a VM to get an IP address on the specified network type.
 // networkType should be "mgmt" or "k8s" to specify which network's IP to wait for.
 func (m *VMManager) WaitForVMIP(vmName string, networkType string, timeout time.Duration) (string, error) {
 	deadline := time.Now().Add(timeout)
-	ticker := time.NewTicker(2 * time.Second)
-	defer ticker.Stop()
+	// Back off from a short initial interval so fast-booting VMs are picked
+	// up quickly without hammering libvirt for slow ones.
+	interval := ipPollInitialInterval
 
-	for time.Now().Before(deadline) {
+	for {
 		ip, err := m.GetVMIP(vmName, networkType)
 		if err == nil && ip != "" {
 			return ip, nil
 		}
-		<-ticker.C
+		remaining := time.Until(deadline)
+		if remaining <= 0 {
+			break
+		}
+		time.Sleep(min(interval, remaining))
+		interval = min(interval*3/2, ipPollMaxInterval)
 	}
 
 	return "", fmt.Errorf("timeout waiting for IP address for VM %s on network %s", vmName, networkType)
 }
 
+// vmIPSources are the libvirt address sources GetVMIPBySubnet consults, in
+// order. DHCP leases answer for libvirt-managed networks; the ARP table also
+// covers guests on networks whose addresses libvirt did not hand out.
+var vmIPSources = []libvirt.DomainInterfaceAddressesSource{
+	libvirt.DOMAIN_INTERFACE_ADDRESSES_SRC_LEASE,
+	libvirt.DOMAIN_INTERFACE_ADDRESSES_SRC_ARP,
+}
+
 // GetVMIPBySubnet retrieves the IP address of a VM that belongs to the specified subnet.
 // subnet should be in CIDR notation (e.g., "192.168.120.0/24").
 func (m *VMManager) GetVMIPBySubnet(vmName string, subnet string) (string, error) {
-	domain, err := m.conn.LookupDomainByName(vmName)
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return "", fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
+	}
+	domain, err := conn.LookupDomainByName(vmName)
 	if err != nil {
 		return "", fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
 	}
 	defer domain.Free()
 
+	return vmIPInSubnet(vmName, subnet, domain.ListAllInterfaceAddresses)
+}
+
+// vmIPInSubnet returns the first IPv4 address inside subnet that listAddrs
+// reports, trying each of vmIPSources in order.
+func vmIPInSubnet(vmName, subnet string, listAddrs func(libvirt.DomainInterfaceAddressesSource) ([]libvirt.DomainInterface, error)) (string, error) {
 	// Parse the subnet CIDR
 	_, ipNet, err := net.ParseCIDR(subnet)
 	if err != nil {
 		return "", fmt.Errorf("failed to parse subnet %s: %w", subnet, err)
 	}
 
-	// Get domain interfaces
-	ifaces, err := domain.ListAllInterfaceAddresses(libvirt.DOMAIN_INTERFACE_ADDRESSES_SRC_LEASE)
-	if err != nil {
-		return "", fmt.Errorf("failed to get interfaces for %s: %w", vmName, err)
-	}
+	var lastErr error
+	queried := false
+	for _, src := range vmIPSources {
+		// Get domain interfaces
+		ifaces, err := listAddrs(src)
+		if err != nil {
+			lastErr = err
+			continue
+		}
+		queried = true
 
-	// Find IPv4 address that belongs to the specified subnet
-	for _, iface := range ifaces {
-		for _, addr := range iface.Addrs {
-			if addr.Type == libvirt.IP_ADDR_TYPE_IPV4 {
-				ip := net.ParseIP(addr.Addr)
-				if ip != nil && ipNet.Contains(ip) {
-					return addr.Addr, nil
+		// Find IPv4 address that belongs to the specified subnet
+		for _, iface := range ifaces {
+			for _, addr := range iface.Addrs {
+				if addr.Type == libvirt.IP_ADDR_TYPE_IPV4 {
+					ip := net.ParseIP(addr.Addr)
+					if ip != nil && ipNet.Contains(ip) {
+						return addr.Addr, nil
+					}
 				}
 			}
 		}
 	}
+	if !queried {
+		return "", fmt.Errorf("failed to get interfaces for %s: %w", vmName, lastErr)
+	}
 
 	return "", fmt.Errorf("no IP address found for VM %s in subnet %s", vmName, subnet)
 }
 
 // GetVMState retrieves the state of a VM
 func (m *VMManager) GetVMState(vmName string) (VMState, error) {
-	domain, err := m.conn.LookupDomainByName(vmName)
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return VMStateUnknown, fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
+	}
+	domain, err := conn.LookupDomainByName(vmName)
 	if err != nil {
 		return VMStateUnknown, fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
 	}
@@ -139,7 +492,11 @@ func libvirtStateToVMState(state libvirt.DomainState) VMState {
 
 // VMExists checks if a VM exists
 func (m *VMManager) VMExists(vmName string) bool {
-	domain, err := m.conn.LookupDomainByName(vmName)
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return false
+	}
+	domain, err := conn.LookupDomainByName(vmName)
 	if err != nil {
 		return false
 	}
@@ -149,7 +506,11 @@ func (m *VMManager) VMExists(vmName string) bool {
 
 // GetVMInterfaceInfo retrieves interface information from a VM
 func (m *VMManager) GetVMInterfaceInfo(vmName string) ([]InterfaceInfo, error) {
-	domain, err := m.conn.LookupDomainByName(vmName)
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return nil, fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
+	}
+	domain, err := conn.LookupDomainByName(vmName)
 	if err != nil {
 		return nil, fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
 	}
@@ -179,7 +540,11 @@ func (m *VMManager) GetVMInterfaceInfo(vmName string) ([]InterfaceInfo, error) {
 // GetVMInfo retrieves comprehensive information about a VM.
 // networkType should be "mgmt" or "k8s" to specify which network's IP to retrieve.
 func (m *VMManager) GetVMInfo(vmName string, networkType string) (*VMInfo, error) {
-	domain, err := m.conn.LookupDomainByName(vmName)
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return nil, fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
+	}
+	domain, err := conn.LookupDomainByName(vmName)
 	if err != nil {
 		return nil, fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
 	}
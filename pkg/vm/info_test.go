@@ -0,0 +1,132 @@
+package vm
+
+import (
+	"fmt"
+	"testing"
+	"time"
+
+	"libvirt.org/go/libvirt"
+)
+
+// TestForgetVMAddressesOnlyDropsThatVM verifies cached addresses and MACs are
+// cleared for the named VM without touching VMs sharing its name prefix.
+func TestForgetVMAddressesOnlyDropsThatVM(t *testing.T) {
+	t.Parallel()
+
+	manager := &VMManager{}
+	manager.leases.ips = map[string]string{
+		"vm1/mgmt":  "192.168.120.11",
+		"vm10/mgmt": "192.168.120.20",
+	}
+	manager.leases.macs = map[string]string{
+		"vm1/mgmt-net":  "52:54:00:00:00:01",
+		"vm10/mgmt-net": "52:54:00:00:00:10",
+	}
+
+	manager.forgetVMAddresses("vm1")
+
+	if _, ok := manager.leases.ips["vm1/mgmt"]; ok {
+		t.Fatalf("expected vm1 address to be forgotten")
+	}
+	if _, ok := manager.leases.macs["vm1/mgmt-net"]; ok {
+		t.Fatalf("expected vm1 MAC to be forgotten")
+	}
+	if manager.leases.ips["vm10/mgmt"] != "192.168.120.20" {
+		t.Fatalf("expected vm10 address to be kept, got %v", manager.leases.ips)
+	}
+	if manager.leases.macs["vm10/mgmt-net"] != "52:54:00:00:00:10" {
+		t.Fatalf("expected vm10 MAC to be kept, got %v", manager.leases.macs)
+	}
+}
+
+// TestMacsByNetworkKeepsFirstInterface verifies domain XML is mapped to one
+// lower-cased MAC per libvirt network, ignoring interfaces without a network.
+func TestMacsByNetworkKeepsFirstInterface(t *testing.T) {
+	t.Parallel()
+
+	desc := `<domain>
+  <devices>
+    <interface type='network'>
+      <mac address='52:54:00:AA:00:01'/>
+      <source network='mgmt-net'/>
+    </interface>
+    <interface type='network'>
+      <mac address='52:54:00:aa:00:02'/>
+      <source network='mgmt-net'/>
+    </interface>
+    <interface type='bridge'>
+      <mac address='52:54:00:aa:00:03'/>
+      <source bridge='br0'/>
+    </interface>
+  </devices>
+</domain>`
+
+	macs, err := macsByNetwork(desc)
+	if err != nil {
+		t.Fatalf("macsByNetwork returned error: %v", err)
+	}
+	if len(macs) != 1 || macs["mgmt-net"] != "52:54:00:aa:00:01" {
+		t.Fatalf("unexpected MACs: %v", macs)
+	}
+}
+
+// TestShouldPrimeMACsWaitsForSecondVM verifies the all-VM MAC priming is
+// skipped while only one VM is being looked up.
+func TestShouldPrimeMACsWaitsForSecondVM(t *testing.T) {
+	t.Parallel()
+
+	manager := &VMManager{}
+	if manager.shouldPrimeMACs("vm1") {
+		t.Fatalf("expected no priming for the first VM")
+	}
+	if manager.shouldPrimeMACs("vm1") {
+		t.Fatalf("expected no priming for repeated lookups of the same VM")
+	}
+	if !manager.shouldPrimeMACs("vm2") {
+		t.Fatalf("expected priming once a second VM is looked up")
+	}
+
+	manager.leases.macsPrimed = true
+	if manager.shouldPrimeMACs("vm3") {
+		t.Fatalf("expected no priming after the cache was primed")
+	}
+}
+
+// TestLookupVMIPFallsBackToARPWithoutLease verifies a VM missing from the
+// DHCP lease snapshot is still found through the domain's ARP addresses.
+func TestLookupVMIPFallsBackToARPWithoutLease(t *testing.T) {
+	t.Parallel()
+
+	manager := &VMManager{}
+	manager.leases.macs = map[string]string{"vm1/mgmt-net": "52:54:00:00:00:01"}
+	// An empty snapshot that stays fresh for the whole test: no leases yet.
+	manager.leases.snapshots = map[string]leaseSnapshot{
+		"mgmt-net": {taken: time.Now().Add(time.Hour), ipByMAC: map[string]string{}},
+	}
+
+	listAddrs := func(src libvirt.DomainInterfaceAddressesSource) ([]libvirt.DomainInterface, error) {
+		switch src {
+		case libvirt.DOMAIN_INTERFACE_ADDRESSES_SRC_LEASE:
+			return nil, nil
+		case libvirt.DOMAIN_INTERFACE_ADDRESSES_SRC_ARP:
+			return []libvirt.DomainInterface{{
+				Addrs: []libvirt.DomainIPAddress{
+					{Type: libvirt.IP_ADDR_TYPE_IPV4, Addr: "10.0.0.5"},
+					{Type: libvirt.IP_ADDR_TYPE_IPV4, Addr: "192.168.120.11"},
+				},
+			}}, nil
+		}
+		return nil, fmt.Errorf("unexpected source %v", src)
+	}
+
+	ip, err := lookupVMIPWith(
+		func() (string, bool, error) { return manager.leaseIP("vm1", "mgmt-net") },
+		func() (string, error) { return vmIPInSubnet("vm1", "192.168.120.0/24", listAddrs) },
+	)
+	if err != nil {
+		t.Fatalf("lookupVMIPWith returned error: %v", err)
+	}
+	if ip != "192.168.120.11" {
+		t.Fatalf("expected the ARP address in the subnet, got %q", ip)
+	}
+}
@@ -1,12 +1,17 @@
 package vm
 
 import (
+	"context"
+	"errors"
 	"fmt"
 	"net"
 	"strconv"
 	"strings"
+	"sync/atomic"
 	"time"
 
+	"golang.org/x/sync/errgroup"
+
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/cni"
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/k8s"
@@ -15,42 +20,147 @@ import (
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/platform"
 )
 
-// InstallKubernetes installs the software components on a VM
+// InstallKubernetes installs the software components on a VM. When vmName is
+// empty, every VM in the config is installed concurrently, bounded by
+// kubernetes.max_parallel.
 func (m *VMManager) InstallKubernetes(vmName string) error {
 	log.Info("=== Installing Kubernetes on VM-based deployment ===")
 
-	k8sMgr := k8s.NewK8sMachineManager(m.config)
+	// Get Kubernetes version from config
+	k8sVersion := m.config.Kubernetes.Version
+	if k8sVersion == "" {
+		return fmt.Errorf("kubernetes version is not set")
+	}
 
-	// Install on each VM in the config file
+	var targets []config.VMConfig
 	for _, vmCfg := range m.config.VMs {
 		// Install only on specific VM if vmName is set
 		if vmName != "" && vmCfg.Name != vmName {
 			continue
 		}
+		targets = append(targets, vmCfg)
+	}
+	if len(targets) == 0 {
+		return nil
+	}
 
-		// Get VM IP
-		mgmtIP, err := m.GetVMMgmtIP(vmCfg.Name)
-		if err != nil {
-			return fmt.Errorf("failed to get IP for %s: %w", vmCfg.Name, err)
-		}
+	k8sMgr := k8s.NewK8sMachineManager(m.config)
+	m.primeMgmtIPs(targets)
 
-		log.Info("--- Installing Kubernetes on %s (%s) ---", vmCfg.Name, mgmtIP)
+	// Each VM is installed over its own SSH connection and the steps do not
+	// depend on other VMs, so fan out across all of them.
+	if err := m.forEachVM(targets, func(vmCfg config.VMConfig) error {
+		return m.installKubernetesOnVM(k8sMgr, vmCfg.Name, k8sVersion)
+	}); err != nil {
+		return err
+	}
 
-		// Get Kubernetes version from config
-		k8sVersion := m.config.Kubernetes.Version
-		if k8sVersion == "" {
-			return fmt.Errorf("kubernetes version is not set")
-		}
+	log.Info("✓ Kubernetes installed on %d VM(s)", len(targets))
+	return nil
+}
+
+// forEachVM runs fn for every VM concurrently, with at most
+// kubernetes.max_parallel calls in flight, and returns the first error.
+// Once a call fails, VMs still waiting for a slot are skipped: the caller
+// aborts on that error anyway, so there is no point starting more work
+// that is likely to hit the same problem.
+func (m *VMManager) forEachVM(vms []config.VMConfig, fn func(vmCfg config.VMConfig) error) error {
+	return forEachNode(m.config.Kubernetes.GetMaxParallel(), vms, func(vmCfg config.VMConfig) string { return vmCfg.Name }, fn)
+}
 
-		cmdExec := platform.NewSSHExecutor(&m.config.SSH, mgmtIP)
-		if err := cmdExec.WaitUntilReady(5 * time.Minute); err != nil {
-			return fmt.Errorf("failed to wait for SSH on %s: %w", vmCfg.Name, err)
+// forEachNode is the node-type-agnostic body of forEachVM: it runs fn for
+// every node with at most limit calls in flight and returns the first error,
+// skipping nodes that had not started yet once a call has failed.
+//
+// Each node is reported as it finishes rather than when the whole batch
+// does, and every failure is logged since only the first one is returned.
+// On failure a one-line summary names every node that failed or was skipped.
+func forEachNode[T any](limit int, nodes []T, name func(T) string, fn func(T) error) error {
+	if len(nodes) == 0 {
+		return nil
+	}
+	var finished atomic.Int32
+	// Each worker only writes its own slot, so no lock is needed.
+	outcomes := make([]nodeOutcome, len(nodes))
+	g, ctx := errgroup.WithContext(context.Background())
+	g.SetLimit(min(len(nodes), limit))
+	for i, node := range nodes {
+		g.Go(func() error {
+			if ctx.Err() != nil {
+				log.Debug("Skipping %s after an earlier failure", name(node))
+				outcomes[i] = nodeSkipped
+				return nil
+			}
+			start := time.Now()
+			err := fn(node)
+			done := finished.Add(1)
+			elapsed := time.Since(start).Round(time.Second)
+			if err != nil {
+				log.Error("✗ %s failed after %s (%d/%d): %v", name(node), elapsed, done, len(nodes), err)
+				outcomes[i] = nodeFailed
+				return err
+			}
+			log.Info("✓ %s finished in %s (%d/%d)", name(node), elapsed, done, len(nodes))
+			return nil
+		})
+	}
+	err := g.Wait()
+	if err != nil {
+		names := make([]string, len(nodes))
+		for i, node := range nodes {
+			names[i] = name(node)
 		}
+		log.Error("%s", nodeOutcomeSummary(names, outcomes))
+	}
+	return err
+}
+
+// nodeOutcome records how forEachNode's call for one node ended.
+type nodeOutcome uint8
+
+const (
+	nodeSucceeded nodeOutcome = iota
+	nodeFailed
+	nodeSkipped
+)
 
-		if err := k8sMgr.InstallKubernetes(cmdExec, vmCfg.Name, k8sVersion); err != nil {
-			return fmt.Errorf("failed to install Kubernetes on %s: %w", vmCfg.Name, err)
+// nodeOutcomeSummary lists the failed and skipped nodes out of names, where
+// outcomes[i] belongs to names[i].
+func nodeOutcomeSummary(names []string, outcomes []nodeOutcome) string {
+	var failed, skipped []string
+	for i, outcome := range outcomes {
+		switch outcome {
+		case nodeFailed:
+			failed = append(failed, names[i])
+		case nodeSkipped:
+			skipped = append(skipped, names[i])
 		}
 	}
+	summary := fmt.Sprintf("✗ %d of %d node(s) failed: %s", len(failed), len(names), strings.Join(failed, ", "))
+	if len(skipped) > 0 {
+		summary += fmt.Sprintf("; skipped: %s", strings.Join(skipped, ", "))
+	}
+	return summary
+}
+
+// installKubernetesOnVM waits for SSH on a single VM and installs Kubernetes on it.
+func (m *VMManager) installKubernetesOnVM(k8sMgr *k8s.K8sMachineManager, vmName, k8sVersion string) error {
+	// Get VM IP
+	mgmtIP, err := m.GetVMMgmtIP(vmName)
+	if err != nil {
+		return fmt.Errorf("failed to get IP for %s: %w", vmName, err)
+	}
+
+	log.Info("--- Installing Kubernetes on %s (%s) ---", vmName, mgmtIP)
+
+	cmdExec := platform.NewSSHExecutor(&m.config.SSH, mgmtIP)
+	if err := cmdExec.WaitUntilReady(5 * time.Minute); err != nil {
+		return fmt.Errorf("failed to wait for SSH on %s: %w", vmName, err)
+	}
+
+	if err := k8sMgr.InstallKubernetes(cmdExec, vmName, k8sVersion); err != nil {
+		return fmt.Errorf("failed to install Kubernetes on %s: %w", vmName, err)
+	}
 	return nil
 }
 
@@ -112,38 +222,40 @@ func (m *VMManager) setupOVNBrExForCluster(clusterRoleMapping config.ClusterRole
 	return nil
 }
 
-// setupK8sCluster sets up a single Kubernetes cluster
-func (m *VMManager) setupK8sCluster(clusterName string, clusterRoleMapping config.ClusterRoleMapping) error {
+// bootstrapK8sCluster brings up a single Kubernetes cluster up to the point
+// where its CNI can be installed: OVS bridges, kubeadm init, control plane
+// and worker joins, and kubelet node-ip alignment. It returns the first
+// master's K8s IP, which the CNI install needs.
+func (m *VMManager) bootstrapK8sCluster(clusterName string, clusterRoleMapping config.ClusterRoleMapping) (string, error) {
 	k8sMgr := k8s.NewK8sMachineManager(m.config)
 	bareMetalRoleMapping := m.config.GetBareMetalClusterRoleMapping()[clusterName]
 
 	clusterCfg := m.config.GetClusterConfig(clusterName)
 	if clusterCfg == nil {
-		return fmt.Errorf("cluster %s not found in configuration", clusterName)
+		return "", fmt.Errorf("cluster %s not found in configuration", clusterName)
 	}
 
 	// Verify cluster has at least one master node
 	masterVMs := clusterRoleMapping[config.ClusterRoleMaster]
 	if len(masterVMs) == 0 {
-		return fmt.Errorf("no master nodes found for cluster %s", clusterName)
+		return "", fmt.Errorf("no master nodes found for cluster %s", clusterName)
 	}
 	if len(bareMetalRoleMapping[config.ClusterRoleMaster]) > 0 {
-		return fmt.Errorf("baremetal control-plane nodes are not yet supported for cluster %s", clusterName)
+		return "", fmt.Errorf("baremetal control-plane nodes are not yet supported for cluster %s", clusterName)
 	}
 
-	cniType := clusterCfg.CNI
-	if cniType == "" {
-		return fmt.Errorf("CNI type is not set for cluster %s", clusterName)
+	if clusterCfg.CNI == "" {
+		return "", fmt.Errorf("CNI type is not set for cluster %s", clusterName)
 	}
 
 	//if cniType == config.CNIOVNKubernetes {
 	//	if err := m.setupOVNBrExForCluster(clusterRoleMapping, k8sMgr); err != nil {
-	//		return err
+	//		return "", err
 	//	}
 	//}
 	if m.config.DPUClusterNeedsOVNK(clusterCfg.Name) {
 		if err := m.setupOVNKubernetesOffloadToDPUOVS(clusterCfg.Name); err != nil {
-			return fmt.Errorf("failed to setup OVS on DPU VMs: %w", err)
+			return "", fmt.Errorf("failed to setup OVS on DPU VMs: %w", err)
 		}
 	}
 
@@ -160,17 +272,23 @@ func (m *VMManager) setupK8sCluster(clusterName string, clusterRoleMapping confi
 		gatewayIf := m.config.GatewayInterfaces(clusterCfg.Name)
 		bridges = append(bridges, "br"+gatewayIf)
 	}
+	var clusterVMs []config.VMConfig
 	for _, vms := range clusterRoleMapping {
-		for _, vmCfg := range vms {
-			mgmtIP, err := m.GetVMMgmtIP(vmCfg.Name)
-			if err != nil {
-				return fmt.Errorf("failed to get mgmt IP for %s: %w", vmCfg.Name, err)
-			}
-			exec := platform.NewSSHExecutor(&m.config.SSH, mgmtIP)
-			if err := k8sMgr.EnsureOVNBridges(exec, bridges...); err != nil {
-				return fmt.Errorf("failed to ensure OVS bridges on %s: %w", vmCfg.Name, err)
-			}
+		clusterVMs = append(clusterVMs, vms...)
+	}
+	m.primeMgmtIPs(clusterVMs)
+	if err := m.forEachVM(clusterVMs, func(vmCfg config.VMConfig) error {
+		mgmtIP, err := m.GetVMMgmtIP(vmCfg.Name)
+		if err != nil {
+			return fmt.Errorf("failed to get mgmt IP for %s: %w", vmCfg.Name, err)
+		}
+		exec := platform.NewSSHExecutor(&m.config.SSH, mgmtIP)
+		if err := k8sMgr.EnsureOVNBridges(exec, bridges...); err != nil {
+			return fmt.Errorf("failed to ensure OVS bridges on %s: %w", vmCfg.Name, err)
 		}
+		return nil
+	}); err != nil {
+		return "", err
 	}
 
 	podCIDR := clusterCfg.PodCIDR
@@ -180,11 +298,11 @@ func (m *VMManager) setupK8sCluster(clusterName string, clusterRoleMapping confi
 	firstMaster := masterVMs[0]
 	firstMasterMgmtIP, err := m.GetVMMgmtIP(firstMaster.Name)
 	if err != nil {
-		return fmt.Errorf("failed to get mgmt IP for %s: %w", firstMaster.Name, err)
+		return "", fmt.Errorf("failed to get mgmt IP for %s: %w", firstMaster.Name, err)
 	}
 	firstMasterK8sIP, err := m.GetVMK8sIP(firstMaster.Name)
 	if err != nil {
-		return fmt.Errorf("failed to get K8s IP for %s: %w", firstMaster.Name, err)
+		return "", fmt.Errorf("failed to get K8s IP for %s: %w", firstMaster.Name, err)
 	}
 
 	firstMasterExec := platform.NewSSHExecutor(&m.config.SSH, firstMasterMgmtIP)
@@ -192,11 +310,11 @@ func (m *VMManager) setupK8sCluster(clusterName string, clusterRoleMapping confi
 	log.Info("\n=== Initializing first control plane node: %s ===", firstMaster.Name)
 	clusterInfo, err := k8sMgr.InitializeControlPlane(firstMasterExec, firstMaster.Name, firstMasterMgmtIP, podCIDR, serviceCIDR, fmt.Sprintf("%s:6443", firstMasterMgmtIP), []string{firstMasterMgmtIP, firstMasterK8sIP})
 	if err != nil {
-		return fmt.Errorf("failed to initialize control plane on %s: %w", firstMaster.Name, err)
+		return "", fmt.Errorf("failed to initialize control plane on %s: %w", firstMaster.Name, err)
 	}
 
 	if err := k8s.SaveKubeconfigToFile(clusterInfo.Kubeconfig, clusterName, m.config.Kubernetes.KubeconfigDir); err != nil {
-		return fmt.Errorf("failed to save kubeconfig for cluster %s: %w", clusterName, err)
+		return "", fmt.Errorf("failed to save kubeconfig for cluster %s: %w", clusterName, err)
 	}
 
 	// Join additional master nodes to the control plane
@@ -205,12 +323,12 @@ func (m *VMManager) setupK8sCluster(clusterName string, clusterRoleMapping confi
 		for _, masterVM := range masterVMs[1:] {
 			masterMgmtIP, err := m.GetVMMgmtIP(masterVM.Name)
 			if err != nil {
-				return fmt.Errorf("failed to get mgmt IP for %s: %w", masterVM.Name, err)
+				return "", fmt.Errorf("failed to get mgmt IP for %s: %w", masterVM.Name, err)
 			}
 
 			masterExec := platform.NewSSHExecutor(&m.config.SSH, masterMgmtIP)
 			if err := k8sMgr.JoinControlPlane(masterExec, masterVM.Name, clusterInfo); err != nil {
-				return fmt.Errorf("failed to join control plane on %s: %w", masterVM.Name, err)
+				return "", fmt.Errorf("failed to join control plane on %s: %w", masterVM.Name, err)
 			}
 		}
 	}
@@ -222,13 +340,15 @@ func (m *VMManager) setupK8sCluster(clusterName string, clusterRoleMapping confi
 		firstMasterMgmtIP,
 		firstMasterExec,
 	); err != nil {
-		return err
+		return "", err
 	}
 
 	workerVMs := clusterRoleMapping[config.ClusterRoleWorker]
 	if len(workerVMs) > 0 {
 		log.Info("=== Joining worker nodes ===")
-		for _, workerVM := range workerVMs {
+		// Workers join with the same bootstrap token and do not depend on
+		// each other, so join them concurrently.
+		if err := m.forEachVM(workerVMs, func(workerVM config.VMConfig) error {
 			workerMgmtIP, err := m.GetVMMgmtIP(workerVM.Name)
 			if err != nil {
 				return fmt.Errorf("failed to get mgmt IP for %s: %w", workerVM.Name, err)
@@ -238,14 +358,23 @@ func (m *VMManager) setupK8sCluster(clusterName string, clusterRoleMapping confi
 			if err := k8sMgr.JoinWorker(workerExec, workerVM.Name, clusterInfo); err != nil {
 				return fmt.Errorf("failed to join worker node %s: %w", workerVM.Name, err)
 			}
+			return nil
+		}); err != nil {
+			return "", err
 		}
 	}
 
 	log.Info("\n=== Aligning kubelet node-ip with k8s_node_ip (OVN underlay) ===")
 	if err := m.ensureKubeletUsesK8sNodeIP(clusterRoleMapping, firstMasterExec); err != nil {
-		return fmt.Errorf("kubelet node-ip alignment: %w", err)
+		return "", fmt.Errorf("kubelet node-ip alignment: %w", err)
 	}
+	return firstMasterK8sIP, nil
+}
 
+// installClusterCNI installs the CNI and addons on a cluster bootstrapped by
+// bootstrapK8sCluster.
+func (m *VMManager) installClusterCNI(clusterCfg config.ClusterConfig, firstMasterK8sIP string) error {
+	clusterName := clusterCfg.Name
 	kubeconfigPath := k8s.GetKubeconfigPath(clusterName, m.config.Kubernetes.KubeconfigDir)
 	hostLocalExec := platform.NewLocalExecutor()
 	cniMgr, err := cni.NewCNIManagerWithKubeconfigFile(m.config, kubeconfigPath, hostLocalExec)
@@ -253,7 +382,7 @@ func (m *VMManager) setupK8sCluster(clusterName string, clusterRoleMapping confi
 		return fmt.Errorf("failed to create CNI manager: %w", err)
 	}
 
-	if err := cniMgr.InstallCNI(cniType, clusterName, firstMasterK8sIP); err != nil {
+	if err := cniMgr.InstallCNI(clusterCfg.CNI, clusterName, firstMasterK8sIP); err != nil {
 		return fmt.Errorf("failed to install CNI: %w", err)
 	}
 
@@ -269,41 +398,53 @@ func (m *VMManager) setupK8sCluster(clusterName string, clusterRoleMapping confi
 }
 
 // ensureKubeletUsesK8sNodeIP sets kubelet --node-ip to each VM's k8s_node_ip so Node.Status and
-// OVN use the k8s L3 subnet. The primary master is patched last to shorten API disruption from
-// kubelet restarting static control-plane pods.
+// OVN use the k8s L3 subnet. Workers only restart their own kubelet, so they are patched
+// concurrently; masters follow one at a time with the primary master last to shorten API
+// disruption from kubelet restarting static control-plane pods.
 func (m *VMManager) ensureKubeletUsesK8sNodeIP(clusterRoleMapping config.ClusterRoleMapping, firstMasterExec platform.CommandExecutor) error {
 	masters := clusterRoleMapping[config.ClusterRoleMaster]
-	var patchOrder []config.VMConfig
-	patchOrder = append(patchOrder, clusterRoleMapping[config.ClusterRoleWorker]...)
+	workers := clusterRoleMapping[config.ClusterRoleWorker]
+	if len(masters) == 0 && len(workers) == 0 {
+		return nil
+	}
+	if err := m.forEachVM(workers, m.ensureVMKubeletK8sNodeIP); err != nil {
+		return err
+	}
+	var masterOrder []config.VMConfig
 	if len(masters) > 1 {
-		patchOrder = append(patchOrder, masters[1:]...)
+		masterOrder = append(masterOrder, masters[1:]...)
 	}
 	if len(masters) > 0 {
-		patchOrder = append(patchOrder, masters[0])
-	}
-	if len(patchOrder) == 0 {
-		return nil
+		masterOrder = append(masterOrder, masters[0])
 	}
-	for _, vmCfg := range patchOrder {
-		ip := strings.TrimSpace(vmCfg.K8sNodeIP)
-		if ip == "" {
-			continue
-		}
-		mgmtIP, err := m.GetVMMgmtIP(vmCfg.Name)
-		if err != nil {
-			return fmt.Errorf("mgmt IP for %s: %w", vmCfg.Name, err)
-		}
-		exec := platform.NewSSHExecutor(&m.config.SSH, mgmtIP)
-		if err := k8s.EnsureKubeletK8sNodeIP(exec, ip); err != nil {
-			return fmt.Errorf("%s: %w", vmCfg.Name, err)
+	for _, vmCfg := range masterOrder {
+		if err := m.ensureVMKubeletK8sNodeIP(vmCfg); err != nil {
+			return err
 		}
 	}
-	if err := k8s.WaitAllNodesReady(firstMasterExec, 6*time.Minute); err != nil {
+	if err := k8s.WaitAllNodesReady(firstMasterExec, len(masters)+len(workers), 6*time.Minute); err != nil {
 		return err
 	}
 	return nil
 }
 
+// ensureVMKubeletK8sNodeIP points one VM's kubelet at its k8s_node_ip, if set.
+func (m *VMManager) ensureVMKubeletK8sNodeIP(vmCfg config.VMConfig) error {
+	ip := strings.TrimSpace(vmCfg.K8sNodeIP)
+	if ip == "" {
+		return nil
+	}
+	mgmtIP, err := m.GetVMMgmtIP(vmCfg.Name)
+	if err != nil {
+		return fmt.Errorf("mgmt IP for %s: %w", vmCfg.Name, err)
+	}
+	exec := platform.NewSSHExecutor(&m.config.SSH, mgmtIP)
+	if err := k8s.EnsureKubeletK8sNodeIP(exec, ip); err != nil {
+		return fmt.Errorf("%s: %w", vmCfg.Name, err)
+	}
+	return nil
+}
+
 // adoptAndJoinBareMetalWorkers prepares baremetal worker nodes and joins them
 // to an initialized cluster.
 //
@@ -322,35 +463,18 @@ func (m *VMManager) adoptAndJoinBareMetalWorkers(k8sMgr *k8s.K8sMachineManager,
 	}
 	fallbackJoinEndpoint := fmt.Sprintf("%s:6443", firstMasterMgmtIP)
 
-	for _, node := range bareMetalWorkers {
-		workerExec, err := m.ensureBareMetalSSHAccess(node)
-		if err != nil {
-			return fmt.Errorf("failed to establish SSH access to baremetal node %s: %w", node.Name, err)
-		}
-
-		if err := m.maybeApplyBootc(node, workerExec); err != nil {
-			return fmt.Errorf("failed bootc reconcile on baremetal node %s: %w", node.Name, err)
-		}
-
-		// Recreate executor in case bootc rebooted and the previous SSH session is stale.
-		workerExec = m.globalSSHExecutor(node.MgmtIP)
-		if err := workerExec.WaitUntilReady(5 * time.Minute); err != nil {
-			return fmt.Errorf("baremetal node %s not reachable after bootc processing: %w", node.Name, err)
-		}
-
-		if err := m.resetBareMetalNode(node, workerExec); err != nil {
-			return fmt.Errorf("failed to reset baremetal node %s: %w", node.Name, err)
-		}
+	// Everything up to the join only touches the node itself, so prepare
+	// all nodes concurrently. Hybrid networking edits host iptables and the
+	// first master's routes, so it and the join stay one node at a time.
+	if err := forEachNode(m.config.Kubernetes.GetMaxParallel(), bareMetalWorkers,
+		func(node config.BareMetalConfig) string { return node.Name },
+		func(node config.BareMetalConfig) error { return m.prepareBareMetalWorker(k8sMgr, node) },
+	); err != nil {
+		return err
+	}
 
-		if err := k8sMgr.InstallKubernetes(workerExec, node.Name, m.config.Kubernetes.Version); err != nil {
-			return fmt.Errorf("failed to install Kubernetes on baremetal node %s: %w", node.Name, err)
-		}
-		if err := k8sMgr.EnsureOVNBrInt(workerExec); err != nil {
-			return fmt.Errorf("failed to ensure br-int on baremetal node %s: %w", node.Name, err)
-		}
-		if err := m.setKubeletNodeIP(node, workerExec); err != nil {
-			return fmt.Errorf("failed to set kubelet node-ip on baremetal node %s: %w", node.Name, err)
-		}
+	for _, node := range bareMetalWorkers {
+		workerExec := m.globalSSHExecutor(node.MgmtIP)
 		if err := m.ensureHybridNetworking(node, firstMasterExec); err != nil {
 			return fmt.Errorf("failed to prepare hybrid networking for baremetal node %s: %w", node.Name, err)
 		}
@@ -382,6 +506,41 @@ func (m *VMManager) adoptAndJoinBareMetalWorkers(k8sMgr *k8s.K8sMachineManager,
 	return nil
 }
 
+// prepareBareMetalWorker brings one baremetal node to the point where it can
+// join: SSH access, optional bootc reconcile, reset, Kubernetes install,
+// br-int and kubelet node-ip.
+func (m *VMManager) prepareBareMetalWorker(k8sMgr *k8s.K8sMachineManager, node config.BareMetalConfig) error {
+	workerExec, err := m.ensureBareMetalSSHAccess(node)
+	if err != nil {
+		return fmt.Errorf("failed to establish SSH access to baremetal node %s: %w", node.Name, err)
+	}
+
+	if err := m.maybeApplyBootc(node, workerExec); err != nil {
+		return fmt.Errorf("failed bootc reconcile on baremetal node %s: %w", node.Name, err)
+	}
+
+	// Recreate executor in case bootc rebooted and the previous SSH session is stale.
+	workerExec = m.globalSSHExecutor(node.MgmtIP)
+	if err := workerExec.WaitUntilReady(5 * time.Minute); err != nil {
+		return fmt.Errorf("baremetal node %s not reachable after bootc processing: %w", node.Name, err)
+	}
+
+	if err := m.resetBareMetalNode(node, workerExec); err != nil {
+		return fmt.Errorf("failed to reset baremetal node %s: %w", node.Name, err)
+	}
+
+	if err := k8sMgr.InstallKubernetes(workerExec, node.Name, m.config.Kubernetes.Version); err != nil {
+		return fmt.Errorf("failed to install Kubernetes on baremetal node %s: %w", node.Name, err)
+	}
+	if err := k8sMgr.EnsureOVNBrInt(workerExec); err != nil {
+		return fmt.Errorf("failed to ensure br-int on baremetal node %s: %w", node.Name, err)
+	}
+	if err := m.setKubeletNodeIP(node, workerExec); err != nil {
+		return fmt.Errorf("failed to set kubelet node-ip on baremetal node %s: %w", node.Name, err)
+	}
+	return nil
+}
+
 // setupOVNKubernetesOffloadToDPUOVS configures OVS external_ids on all DPU VMs in the given
 // cluster. OVS is already installed on VMs during InstallKubernetes; this
 // sets the external_ids that ovnkube-node DPU mode needs.
@@ -410,14 +569,116 @@ func (m *VMManager) setupOVNKubernetesOffloadToDPUOVS(dpuClusterName string) err
 	return nil
 }
 
+// InstallAndSetupAllK8sClusters does the work of InstallKubernetes("")
+// followed by SetupAllK8sClusters, but bootstraps each cluster as soon as its
+// own VMs are installed instead of waiting for every VM in the deployment, so
+// one cluster's kubeadm init overlaps with installs still running elsewhere.
+func (m *VMManager) InstallAndSetupAllK8sClusters() error {
+	log.Info("=== Installing Kubernetes on VM-based deployment ===")
+
+	k8sVersion := m.config.Kubernetes.Version
+	if k8sVersion == "" {
+		return fmt.Errorf("kubernetes version is not set")
+	}
+
+	// pending counts each cluster's VMs still being installed; the cluster's
+	// channel in installed is closed when its count drops to zero.
+	pending := make(map[string]*atomic.Int32)
+	installed := make(map[string]chan struct{})
+	for _, vmCfg := range m.config.VMs {
+		if pending[vmCfg.K8sCluster] == nil {
+			pending[vmCfg.K8sCluster] = new(atomic.Int32)
+			installed[vmCfg.K8sCluster] = make(chan struct{})
+		}
+		pending[vmCfg.K8sCluster].Add(1)
+	}
+
+	k8sMgr := k8s.NewK8sMachineManager(m.config)
+	m.primeMgmtIPs(m.config.VMs)
+
+	var installErr error
+	installDone := make(chan struct{})
+	go func() {
+		defer close(installDone)
+		installErr = m.forEachVM(m.config.VMs, func(vmCfg config.VMConfig) error {
+			if err := m.installKubernetesOnVM(k8sMgr, vmCfg.Name, k8sVersion); err != nil {
+				return err
+			}
+			if pending[vmCfg.K8sCluster].Add(-1) == 0 {
+				close(installed[vmCfg.K8sCluster])
+			}
+			return nil
+		})
+		if installErr == nil {
+			log.Info("✓ Kubernetes installed on %d VM(s)", len(m.config.VMs))
+		}
+	}()
+
+	err := m.setupK8sClusters(func(clusterName string) error {
+		select {
+		case <-installed[clusterName]:
+			return nil
+		case <-installDone:
+			if installErr != nil {
+				return errInstallFailed
+			}
+			return nil
+		}
+	})
+	// Never leave installs running behind the caller's back, and report an
+	// install failure over the setup error it caused.
+	<-installDone
+	if installErr != nil {
+		return fmt.Errorf("failed to install Kubernetes: %w", installErr)
+	}
+	return err
+}
+
+// errInstallFailed is returned to a cluster waiting on its VMs' installs
+// when the install run has failed.
+var errInstallFailed = errors.New("kubernetes install failed")
+
 // SetupAllK8sClusters sets up all Kubernetes clusters from the configuration.
-// Clusters are processed in install order (host clusters before DPU clusters
-// when offloading is enabled).
+// Clusters are bootstrapped concurrently; CNIs are then installed in install
+// order (host clusters before DPU clusters when offloading is enabled).
 func (m *VMManager) SetupAllK8sClusters() error {
+	return m.setupK8sClusters(nil)
+}
+
+// setupK8sClusters is the body of SetupAllK8sClusters. When ready is set, a
+// cluster is only bootstrapped once ready returns nil for it.
+func (m *VMManager) setupK8sClusters(ready func(clusterName string) error) error {
 	clusterRoleMapping := m.config.GetClusterRoleMapping()
-	for _, clusterCfg := range m.config.ClustersOrderedForInstall() {
-		log.Info("\n=== Setting up Kubernetes cluster %s ===", clusterCfg.Name)
-		if err := m.setupK8sCluster(clusterCfg.Name, clusterRoleMapping[clusterCfg.Name]); err != nil {
+	clusters := m.config.ClustersOrderedForInstall()
+
+	// Bootstrapping a cluster (kubeadm init and joins) does not depend on any
+	// other cluster, so bring them all up at once. Only the CNI installs have
+	// to follow install order.
+	firstMasterK8sIPs := make([]string, len(clusters))
+	var g errgroup.Group
+	for i, clusterCfg := range clusters {
+		g.Go(func() error {
+			if ready != nil {
+				if err := ready(clusterCfg.Name); err != nil {
+					return err
+				}
+			}
+			log.Info("\n=== Setting up Kubernetes cluster %s ===", clusterCfg.Name)
+			ip, err := m.bootstrapK8sCluster(clusterCfg.Name, clusterRoleMapping[clusterCfg.Name])
+			if err != nil {
+				return fmt.Errorf("failed to setup Kubernetes cluster %s: %w", clusterCfg.Name, err)
+			}
+			firstMasterK8sIPs[i] = ip
+			return nil
+		})
+	}
+	if err := g.Wait(); err != nil {
+		return err
+	}
+
+	for i, clusterCfg := range clusters {
+		log.Info("\n=== Installing CNI on cluster %s ===", clusterCfg.Name)
+		if err := m.installClusterCNI(clusterCfg, firstMasterK8sIPs[i]); err != nil {
 			return fmt.Errorf("failed to setup Kubernetes cluster %s: %w", clusterCfg.Name, err)
 		}
 	}
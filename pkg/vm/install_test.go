@@ -0,0 +1,50 @@
+package vm
+
+import (
+	"errors"
+	"sync/atomic"
+	"testing"
+
+	"github.com/ovn-kubernetes/dpu-simulator/pkg/config"
+)
+
+// TestForEachVMSkipsQueuedVMsAfterFailure verifies that once a VM fails, VMs
+// still waiting for a slot are not started and the failure is returned.
+func TestForEachVMSkipsQueuedVMsAfterFailure(t *testing.T) {
+	t.Parallel()
+
+	manager := &VMManager{
+		config: &config.Config{
+			Kubernetes: config.KubernetesConfig{MaxParallel: 1},
+		},
+	}
+	vms := []config.VMConfig{{Name: "vm1"}, {Name: "vm2"}, {Name: "vm3"}}
+	wantErr := errors.New("repo not found")
+
+	var calls atomic.Int32
+	err := manager.forEachVM(vms, func(vmCfg config.VMConfig) error {
+		calls.Add(1)
+		return wantErr
+	})
+	if !errors.Is(err, wantErr) {
+		t.Fatalf("expected %v, got %v", wantErr, err)
+	}
+	if got := calls.Load(); got != 1 {
+		t.Fatalf("expected only the first VM to run, got %d calls", got)
+	}
+}
+
+// TestNodeOutcomeSummary verifies the failure summary names failed and
+// skipped nodes and leaves out the ones that succeeded.
+func TestNodeOutcomeSummary(t *testing.T) {
+	t.Parallel()
+
+	got := nodeOutcomeSummary(
+		[]string{"vm1", "vm2", "vm3", "vm4"},
+		[]nodeOutcome{nodeSucceeded, nodeFailed, nodeSkipped, nodeFailed},
+	)
+	want := "✗ 2 of 4 node(s) failed: vm2, vm4; skipped: vm3"
+	if got != want {
+		t.Fatalf("expected %q, got %q", want, got)
+	}
+}
@@ -10,7 +10,13 @@ import (
 
 // StartVM starts a VM
 func (m *VMManager) StartVM(vmName string) error {
-	domain, err := m.conn.LookupDomainByName(vmName)
+	defer m.forgetVMAddresses(vmName)
+
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
+	}
+	domain, err := conn.LookupDomainByName(vmName)
 	if err != nil {
 		return fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
 	}
@@ -34,7 +40,13 @@ func (m *VMManager) StartVM(vmName string) error {
 
 // StopVM shuts down a VM
 func (m *VMManager) StopVM(vmName string) error {
-	domain, err := m.conn.LookupDomainByName(vmName)
+	defer m.forgetVMAddresses(vmName)
+
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
+	}
+	domain, err := conn.LookupDomainByName(vmName)
 	if err != nil {
 		return fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
 	}
@@ -58,7 +70,13 @@ func (m *VMManager) StopVM(vmName string) error {
 
 // DestroyVM forcefully stops a VM
 func (m *VMManager) DestroyVM(vmName string) error {
-	domain, err := m.conn.LookupDomainByName(vmName)
+	defer m.forgetVMAddresses(vmName)
+
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
+	}
+	domain, err := conn.LookupDomainByName(vmName)
 	if err != nil {
 		return fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
 	}
@@ -81,7 +99,13 @@ func (m *VMManager) DestroyVM(vmName string) error {
 
 // RebootVM reboots a VM
 func (m *VMManager) RebootVM(vmName string) error {
-	domain, err := m.conn.LookupDomainByName(vmName)
+	defer m.forgetVMAddresses(vmName)
+
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
+	}
+	domain, err := conn.LookupDomainByName(vmName)
 	if err != nil {
 		return fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
 	}
@@ -105,7 +129,13 @@ func (m *VMManager) RebootVM(vmName string) error {
 
 // DeleteVM undefines (deletes) a VM and its associated storage
 func (m *VMManager) DeleteVM(vmName string) error {
-	domain, err := m.conn.LookupDomainByName(vmName)
+	defer m.forgetVMAddresses(vmName)
+
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return err
+	}
+	domain, err := conn.LookupDomainByName(vmName)
 	if err != nil {
 		// VM doesn't exist, nothing to do
 		return nil
@@ -171,7 +201,11 @@ func (m *VMManager) CleanupVMs() error {
 
 // SetAutostart configures a VM to start automatically on host boot
 func (m *VMManager) SetAutostart(vmName string, autostart bool) error {
-	domain, err := m.conn.LookupDomainByName(vmName)
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
+	}
+	domain, err := conn.LookupDomainByName(vmName)
 	if err != nil {
 		return fmt.Errorf("failed to lookup domain %s: %w", vmName, err)
 	}
@@ -186,7 +220,11 @@ func (m *VMManager) SetAutostart(vmName string, autostart bool) error {
 
 // ListAllVMs returns a list of all VMs
 func (m *VMManager) ListAllVMs() ([]string, error) {
-	domains, err := m.conn.ListAllDomains(libvirt.CONNECT_LIST_DOMAINS_ACTIVE | libvirt.CONNECT_LIST_DOMAINS_INACTIVE)
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return nil, fmt.Errorf("failed to list domains: %w", err)
+	}
+	domains, err := conn.ListAllDomains(libvirt.CONNECT_LIST_DOMAINS_ACTIVE | libvirt.CONNECT_LIST_DOMAINS_INACTIVE)
 	if err != nil {
 		return nil, fmt.Errorf("failed to list domains: %w", err)
 	}
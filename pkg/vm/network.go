@@ -14,7 +14,11 @@ import (
 
 // NetworkExists checks if a network exists
 func (m *VMManager) NetworkExists(networkName string) bool {
-	net, err := m.conn.LookupNetworkByName(networkName)
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return false
+	}
+	net, err := conn.LookupNetworkByName(networkName)
 	if err != nil {
 		return false
 	}
@@ -50,7 +54,11 @@ func (m *VMManager) CreateNetwork(netCfg config.NetworkConfig) error {
 		return fmt.Errorf("unsupported network mode: %s", netCfg.Mode)
 	}
 
-	net, err := m.conn.NetworkDefineXML(xml)
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return fmt.Errorf("failed to define network %s: %w", netCfg.Name, err)
+	}
+	net, err := conn.NetworkDefineXML(xml)
 	if err != nil {
 		return fmt.Errorf("failed to define network %s: %w", netCfg.Name, err)
 	}
@@ -244,20 +252,18 @@ func setLibvirtFirewallBackend(conf, backend string) (string, bool) {
 	return result, changed
 }
 
-// buildDHCPReservations returns DHCP host entries (MAC -> IP) for the given network.
+// writeDHCPReservations writes DHCP host entries (MAC -> IP) for the given network.
 // Only the k8s network uses static reservations (K8sNodeMAC/K8sNodeIP). The mgmt
 // network uses dynamic DHCP only for now.
-func (m *VMManager) buildDHCPReservations(netCfg config.NetworkConfig) string {
+func (m *VMManager) writeDHCPReservations(sb *strings.Builder, netCfg config.NetworkConfig) {
 	if netCfg.Type != config.K8sNetworkName {
-		return ""
+		return
 	}
-	var sb strings.Builder
 	for _, vmCfg := range m.config.VMs {
 		if vmCfg.K8sNodeMAC != "" && vmCfg.K8sNodeIP != "" {
-			sb.WriteString(fmt.Sprintf("      <host mac='%s' name='%s' ip='%s'/>\n", vmCfg.K8sNodeMAC, vmCfg.Name, vmCfg.K8sNodeIP))
+			fmt.Fprintf(sb, "      <host mac='%s' name='%s' ip='%s'/>\n", vmCfg.K8sNodeMAC, vmCfg.Name, vmCfg.K8sNodeIP)
 		}
 	}
-	return sb.String()
 }
 
 // generateNATNetworkXML generates XML for a NAT network with Linux bridges and DHCP
@@ -265,19 +271,19 @@ func (m *VMManager) generateNATNetworkXML(netCfg config.NetworkConfig) string {
 	var sb strings.Builder
 
 	sb.WriteString("<network>\n")
-	sb.WriteString(fmt.Sprintf("  <name>%s</name>\n", netCfg.Name))
+	fmt.Fprintf(&sb, "  <name>%s</name>\n", netCfg.Name)
 	sb.WriteString("  <forward mode='nat'/>\n")
-	sb.WriteString(fmt.Sprintf("  <bridge name='%s' stp='on' delay='0'/>\n", netCfg.BridgeName))
+	fmt.Fprintf(&sb, "  <bridge name='%s' stp='on' delay='0'/>\n", netCfg.BridgeName)
 
-	sb.WriteString(fmt.Sprintf("  <ip address='%s' netmask='%s'>\n", netCfg.Gateway, netCfg.SubnetMask))
+	fmt.Fprintf(&sb, "  <ip address='%s' netmask='%s'>\n", netCfg.Gateway, netCfg.SubnetMask)
 
 	// K8s (ovn-network): no DHCP on the segment; VMs assign k8s interface IP manually
 	if netCfg.Type != config.K8sNetworkName {
 		sb.WriteString("    <dhcp>\n")
 		if netCfg.DHCPStart != "" && netCfg.DHCPEnd != "" {
-			sb.WriteString(fmt.Sprintf("      <range start='%s' end='%s'/>\n", netCfg.DHCPStart, netCfg.DHCPEnd))
+			fmt.Fprintf(&sb, "      <range start='%s' end='%s'/>\n", netCfg.DHCPStart, netCfg.DHCPEnd)
 		}
-		sb.WriteString(m.buildDHCPReservations(netCfg))
+		m.writeDHCPReservations(&sb, netCfg)
 		sb.WriteString("    </dhcp>\n")
 	}
 
@@ -292,8 +298,8 @@ func generateBridgeNetworkXML(networkName, bridgeName string) string {
 	var sb strings.Builder
 
 	sb.WriteString("<network>\n")
-	sb.WriteString(fmt.Sprintf("  <name>%s</name>\n", networkName))
-	sb.WriteString(fmt.Sprintf("  <bridge name='%s' stp='on' delay='0'/>\n", bridgeName))
+	fmt.Fprintf(&sb, "  <name>%s</name>\n", networkName)
+	fmt.Fprintf(&sb, "  <bridge name='%s' stp='on' delay='0'/>\n", bridgeName)
 	sb.WriteString("</network>\n")
 
 	return sb.String()
@@ -304,9 +310,9 @@ func generateOVSNetworkXML(networkName, bridgeName string) string {
 	var sb strings.Builder
 
 	sb.WriteString("<network>\n")
-	sb.WriteString(fmt.Sprintf("  <name>%s</name>\n", networkName))
+	fmt.Fprintf(&sb, "  <name>%s</name>\n", networkName)
 	sb.WriteString("  <forward mode='bridge'/>\n")
-	sb.WriteString(fmt.Sprintf("  <bridge name='%s'/>\n", bridgeName))
+	fmt.Fprintf(&sb, "  <bridge name='%s'/>\n", bridgeName)
 	sb.WriteString("  <virtualport type='openvswitch'/>\n")
 	sb.WriteString("</network>\n")
 
@@ -315,26 +321,53 @@ func generateOVSNetworkXML(networkName, bridgeName string) string {
 
 // CreateOVSBridge creates an OVS bridge
 func CreateOVSBridge(cmdExec platform.CommandExecutor, bridgeName string) error {
-	_, _, err := platform.RunCommandInDir(cmdExec, "", "ovs-vsctl", []string{"br-exists", bridgeName}, 30*time.Second)
-	if err == nil {
-		log.Info("OVS bridge %s already exists, skipping creation", bridgeName)
+	return CreateOVSBridges(cmdExec, []string{bridgeName})
+}
+
+// CreateOVSBridges creates the given OVS bridges and brings them up. All
+// bridges are added in a single ovs-vsctl transaction (--may-exist makes it a
+// no-op for bridges that already exist) and brought up with a single
+// "ip -batch" invocation, both sent to the host as one script, so the cost
+// doesn't grow with the number of bridges.
+func CreateOVSBridges(cmdExec platform.CommandExecutor, bridgeNames []string) error {
+	if len(bridgeNames) == 0 {
 		return nil
 	}
 
-	co, ce, err := platform.RunCommandInDir(cmdExec, "", "ovs-vsctl", []string{"add-br", bridgeName}, 2*time.Minute)
+	out, errOut, err := cmdExec.ExecuteWithTimeout(ovsBridgesScript(bridgeNames), 2*time.Minute)
 	if err != nil {
-		return fmt.Errorf("failed to create OVS bridge %s: %w, output: %s", bridgeName, err, platform.CombinedCmdOutput(co, ce))
+		return fmt.Errorf("failed to create OVS bridges %s: %w, output: %s",
+			strings.Join(bridgeNames, ", "), err, platform.CombinedCmdOutput(out, errOut))
 	}
 
-	bo, be, err := platform.RunCommandInDir(cmdExec, "", "ip", []string{"link", "set", bridgeName, "up"}, 2*time.Minute)
-	if err != nil {
-		return fmt.Errorf("failed to bring up OVS bridge %s: %w, output: %s", bridgeName, err, platform.CombinedCmdOutput(bo, be))
+	for _, bridgeName := range bridgeNames {
+		log.Info("✓ Created OVS bridge: %s", bridgeName)
 	}
-
-	log.Info("✓ Created OVS bridge: %s", bridgeName)
 	return nil
 }
 
+// ovsBridgesScript returns a shell script that adds the given OVS bridges in
+// one ovs-vsctl transaction and sets their links up in one ip batch.
+func ovsBridgesScript(bridgeNames []string) string {
+	var sb strings.Builder
+	sb.WriteString("set -e\n")
+	sb.WriteString("ovs-vsctl")
+	for i, bridgeName := range bridgeNames {
+		if i > 0 {
+			sb.WriteString(" --")
+		}
+		sb.WriteString(" --may-exist add-br ")
+		sb.WriteString(platform.ShQuote(bridgeName))
+	}
+	sb.WriteString("\n")
+	sb.WriteString("ip -batch - <<'EOF'\n")
+	for _, bridgeName := range bridgeNames {
+		fmt.Fprintf(&sb, "link set %s up\n", bridgeName)
+	}
+	sb.WriteString("EOF\n")
+	return sb.String()
+}
+
 // DeleteOVSBridge deletes an OVS bridge
 func DeleteOVSBridge(cmdExec platform.CommandExecutor, bridgeName string) error {
 	_, _, err := platform.RunCommandInDir(cmdExec, "", "ovs-vsctl", []string{"br-exists", bridgeName}, 30*time.Second)
@@ -365,9 +398,19 @@ func (m *VMManager) CreateHostToDPUNetwork(hostName, dpuName string, index int)
 		return fmt.Errorf("failed to create OVS bridge for host-to-DPU: %w", err)
 	}
 
+	return m.defineHostToDPUNetwork(networkName, bridgeName)
+}
+
+// defineHostToDPUNetwork defines and starts the libvirt network for a
+// host-to-DPU channel whose OVS bridge already exists.
+func (m *VMManager) defineHostToDPUNetwork(networkName, bridgeName string) error {
 	xml := generateOVSNetworkXML(networkName, bridgeName)
 
-	net, err := m.conn.NetworkDefineXML(xml)
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return fmt.Errorf("failed to define host-to-DPU network %s: %w", networkName, err)
+	}
+	net, err := conn.NetworkDefineXML(xml)
 	if err != nil {
 		return fmt.Errorf("failed to define host-to-DPU network %s: %w", networkName, err)
 	}
@@ -401,27 +444,60 @@ func (m *VMManager) CreateAllNetworks() error {
 		}
 	}
 
-	// Create host-to-DPU network channels
+	// Create host-to-DPU network channels. Collect every channel first so
+	// all of their OVS bridges can be created in one go.
+	type h2dChannel struct {
+		hostName, dpuName       string
+		index                   int
+		networkName, bridgeName string
+	}
+	var channels []h2dChannel
 	numPairs := m.config.GetHostToDpuNumPairs()
-	mappings := m.config.GetHostDPUMappings()
-	for _, mapping := range mappings {
+	for _, mapping := range m.config.GetHostDPUMappings() {
 		for _, dpuConn := range mapping.Connections {
 			for idx := 0; idx < numPairs; idx++ {
-				if err := m.CreateHostToDPUNetwork(mapping.Host.Name, dpuConn.DPU.Name, idx); err != nil {
-					return fmt.Errorf("failed to create host-to-DPU network (pair %d) for host %s and DPU %s: %w",
-						idx, mapping.Host.Name, dpuConn.DPU.Name, err)
+				ch := h2dChannel{
+					hostName:    mapping.Host.Name,
+					dpuName:     dpuConn.DPU.Name,
+					index:       idx,
+					networkName: network.GetHostToDPUNetworkName(mapping.Host.Name, dpuConn.DPU.Name, idx),
+					bridgeName:  network.GenerateBridgeName(mapping.Host.Name, dpuConn.DPU.Name, idx),
+				}
+				if m.NetworkExists(ch.networkName) {
+					return fmt.Errorf("failed to create host-to-DPU network (pair %d) for host %s and DPU %s: host-to-DPU network %s already exists",
+						idx, ch.hostName, ch.dpuName, ch.networkName)
 				}
+				channels = append(channels, ch)
 			}
 		}
 	}
 
+	bridgeNames := make([]string, 0, len(channels))
+	for _, ch := range channels {
+		bridgeNames = append(bridgeNames, ch.bridgeName)
+	}
+	if err := CreateOVSBridges(m.hostExec, bridgeNames); err != nil {
+		return fmt.Errorf("failed to create OVS bridges for host-to-DPU networks: %w", err)
+	}
+
+	for _, ch := range channels {
+		if err := m.defineHostToDPUNetwork(ch.networkName, ch.bridgeName); err != nil {
+			return fmt.Errorf("failed to create host-to-DPU network (pair %d) for host %s and DPU %s: %w",
+				ch.index, ch.hostName, ch.dpuName, err)
+		}
+	}
+
 	log.Info("✓ All networks created successfully")
 	return nil
 }
 
 // DeleteNetwork removes a libvirt network by name
 func (m *VMManager) DeleteNetwork(networkName string) error {
-	net, err := m.conn.LookupNetworkByName(networkName)
+	conn, err := m.libvirtConn()
+	if err != nil {
+		return err
+	}
+	net, err := conn.LookupNetworkByName(networkName)
 	if err != nil {
 		// Network doesn't exist, nothing to do
 		return nil
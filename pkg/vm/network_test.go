@@ -51,3 +51,20 @@ func TestSetLibvirtFirewallBackendNoopWhenAlreadySet(t *testing.T) {
 		t.Fatalf("expected unchanged config\n got: %q\nwant: %q", updated, input)
 	}
 }
+
+// TestOVSBridgesScriptBatchesAllBridges verifies every bridge is added in a
+// single ovs-vsctl transaction and brought up in a single ip batch.
+func TestOVSBridgesScriptBatchesAllBridges(t *testing.T) {
+	t.Parallel()
+
+	got := ovsBridgesScript([]string{"h2d-aaaa", "h2d-bbbb"})
+	want := "set -e\n" +
+		"ovs-vsctl --may-exist add-br 'h2d-aaaa' -- --may-exist add-br 'h2d-bbbb'\n" +
+		"ip -batch - <<'EOF'\n" +
+		"link set h2d-aaaa up\n" +
+		"link set h2d-bbbb up\n" +
+		"EOF\n"
+	if got != want {
+		t.Fatalf("unexpected script\n got: %q\nwant: %q", got, want)
+	}
+}
@@ -1,7 +1,10 @@
 package vm
 
 import (
+	"errors"
 	"fmt"
+	"sync"
+	"time"
 
 	"libvirt.org/go/libvirt"
 
@@ -10,8 +13,20 @@ import (
 	"github.com/ovn-kubernetes/dpu-simulator/pkg/platform"
 )
 
+// libvirtURI is the libvirt daemon every VMManager connects to.
+const libvirtURI = "qemu:///system"
+
+// libvirtReconnectInterval is how long libvirtConn waits after a failed
+// reconnect before trying again.
+const libvirtReconnectInterval = time.Second
+
 // VMManager manages libvirt virtual machines and networks
 type VMManager struct {
+	// connMu guards conn, which is shared by every goroutine using the
+	// manager and is reopened by libvirtConn if libvirtd drops it. The
+	// libvirt client is thread-safe, so callers only need the read lock to
+	// use it; the write lock is for replacing or closing it.
+	connMu     sync.RWMutex
 	conn       *libvirt.Connect
 	config     *config.Config
 	hostDistro *platform.Distro
@@ -20,6 +35,18 @@ type VMManager struct {
 	// hostSpec is the resolved per-host virtualization profile (machine type,
 	// emulator path, firmware, and feature flags) reused across VM XML creation.
 	hostSpec archSpec
+	// leases caches DHCP lease snapshots so IP lookups for many VMs share
+	// libvirt round trips.
+	leases leaseCache
+	// reconnectFailedAt is when libvirtConn last failed to reconnect,
+	// guarded by connMu.
+	reconnectFailedAt time.Time
+	// retiredConns are connections libvirtConn replaced. Callers may still
+	// hold them, so they are only closed by Close. Guarded by connMu.
+	retiredConns []*libvirt.Connect
+	// closed is set by Close, after which libvirtConn fails instead of
+	// reconnecting. Guarded by connMu.
+	closed bool
 }
 
 // NewVMManager creates a new VMManager with the given config, connecting to libvirt.
@@ -37,7 +64,7 @@ func NewVMManager(cfg *config.Config, hostExec platform.CommandExecutor) (*VMMan
 	if err != nil {
 		return nil, fmt.Errorf("failed to detect host distro: %w", err)
 	}
-	conn, err := libvirt.NewConnect("qemu:///system")
+	conn, err := libvirt.NewConnect(libvirtURI)
 	if err != nil {
 		return nil, fmt.Errorf("failed to connect to libvirt: %w", err)
 	}
@@ -64,10 +91,83 @@ func NewVMManager(cfg *config.Config, hostExec platform.CommandExecutor) (*VMMan
 	}, nil
 }
 
-// Close closes the libvirt connection
+// errLibvirtClosed is returned by libvirtConn once the manager is closed.
+var errLibvirtClosed = errors.New("libvirt connection is closed")
+
+// libvirtConn returns the manager's libvirt connection, reopening it first if
+// the socket has gone away (for example after libvirtd was restarted by a
+// package install). If reconnecting fails the stale connection is returned so
+// the caller's libvirt call surfaces the error. After Close it returns
+// errLibvirtClosed rather than opening a connection nothing would close.
+func (m *VMManager) libvirtConn() (*libvirt.Connect, error) {
+	// Fast path: concurrent VM workers share the live connection without
+	// serializing on the health check.
+	m.connMu.RLock()
+	conn, closed := m.conn, m.closed
+	m.connMu.RUnlock()
+	if closed {
+		return nil, errLibvirtClosed
+	}
+	if conn != nil {
+		if alive, err := conn.IsAlive(); err == nil && alive {
+			return conn, nil
+		}
+	}
+
+	m.connMu.Lock()
+	defer m.connMu.Unlock()
+
+	if m.closed {
+		return nil, errLibvirtClosed
+	}
+
+	// Another goroutine may have reconnected while we waited for the lock.
+	if m.conn != nil && m.conn != conn {
+		if alive, err := m.conn.IsAlive(); err == nil && alive {
+			return m.conn, nil
+		}
+	}
+
+	// While libvirtd is down every VM worker lands here; let one of them
+	// try per interval instead of queueing up a connect attempt each.
+	if time.Since(m.reconnectFailedAt) < libvirtReconnectInterval {
+		return m.conn, nil
+	}
+
+	log.Debug("libvirt connection to %s is not alive, reconnecting", libvirtURI)
+	conn, err := libvirt.NewConnect(libvirtURI)
+	if err != nil {
+		log.Warn("Failed to reconnect to libvirt: %v", err)
+		m.reconnectFailedAt = time.Now()
+		return m.conn, nil
+	}
+	// Other goroutines may still be in a call on the old connection, which
+	// they got from the fast path. Leave it to them and close it in Close
+	// instead of pulling it out from under them.
+	if m.conn != nil {
+		m.retiredConns = append(m.retiredConns, m.conn)
+	}
+	m.conn = conn
+	return m.conn, nil
+}
+
+// Close closes the libvirt connection, along with any it replaced. The
+// manager cannot be used afterwards.
 func (m *VMManager) Close() error {
+	m.connMu.Lock()
+	defer m.connMu.Unlock()
+
+	if m.closed {
+		return nil
+	}
+	m.closed = true
+	for _, conn := range m.retiredConns {
+		conn.Close()
+	}
+	m.retiredConns = nil
 	if m.conn != nil {
 		_, err := m.conn.Close()
+		m.conn = nil
 		return err
 	}
 	return nil
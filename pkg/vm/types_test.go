@@ -0,0 +1,28 @@
+package vm
+
+import (
+	"errors"
+	"testing"
+)
+
+// TestLibvirtConnFailsAfterClose verifies a closed manager does not quietly
+// open a new libvirt connection that nothing would close.
+func TestLibvirtConnFailsAfterClose(t *testing.T) {
+	t.Parallel()
+
+	manager := &VMManager{}
+	if err := manager.Close(); err != nil {
+		t.Fatalf("Close returned error: %v", err)
+	}
+	if err := manager.Close(); err != nil {
+		t.Fatalf("second Close returned error: %v", err)
+	}
+
+	conn, err := manager.libvirtConn()
+	if !errors.Is(err, errLibvirtClosed) {
+		t.Fatalf("expected errLibvirtClosed, got %v", err)
+	}
+	if conn != nil {
+		t.Fatalf("expected no connection after Close")
+	}
+}